@@ -38,6 +38,7 @@ const envSchema = z.object({
 
   // CORS
   CORS_ORIGINS: z.string().default('http://localhost:3000'),
+  CORS_ORIGINS_PARAMETER: z.string().optional(),
 
   // Slack Integration
   SLACK_WEBHOOK_URL: z.string().url().optional(),
@@ -269,6 +270,50 @@ export function getSettings(): Settings {
   return _settings;
 }
 
+// CORS origins refresh state (SSM Parameter Store via Lambda extension)
+const CORS_ORIGINS_REFRESH_INTERVAL_MS = 60_000;
+let _corsOriginsRefreshedAt = 0;
+
+/**
+ * Refresh CORS origins from SSM Parameter Store.
+ *
+ * When CORS_ORIGINS_PARAMETER is set, the allow-list is read through the
+ * AWS Parameters and Secrets Lambda Extension (local HTTP cache), so CORS
+ * changes do not require a Lambda redeploy. Reads are throttled to once
+ * per minute per container; failures keep the current origins.
+ */
+export async function refreshCorsOrigins(): Promise<void> {
+  const parameterName = process.env['CORS_ORIGINS_PARAMETER'];
+  const sessionToken = process.env['AWS_SESSION_TOKEN'];
+  if (!parameterName || !sessionToken) {
+    return;
+  }
+
+  const now = Date.now();
+  if (now - _corsOriginsRefreshedAt < CORS_ORIGINS_REFRESH_INTERVAL_MS) {
+    return;
+  }
+  _corsOriginsRefreshedAt = now;
+
+  const port = process.env['PARAMETERS_SECRETS_EXTENSION_HTTP_PORT'] ?? '2773';
+  try {
+    const response = await fetch(
+      `http://localhost:${port}/systemsmanager/parameters/get?name=${encodeURIComponent(parameterName)}`,
+      { headers: { 'X-Aws-Parameters-Secrets-Token': sessionToken } }
+    );
+    if (!response.ok) {
+      return;
+    }
+    const body = (await response.json()) as { Parameter?: { Value?: string } };
+    const value = body.Parameter?.Value;
+    if (value) {
+      getSettings().corsOrigins = parseCorsOrigins(value);
+    }
+  } catch {
+    // Keep the previously loaded origins
+  }
+}
+
 /**
  * Reset settings (useful for testing).
  */
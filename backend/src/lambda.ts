@@ -14,77 +14,24 @@
  * - 2.6: Register cleanup handlers for graceful shutdown
  */
 
-import { handle, type LambdaEvent, type APIGatewayProxyResult } from 'hono/aws-lambda';
+import {
+  handle,
+  streamHandle,
+  type LambdaEvent,
+  type APIGatewayProxyResult,
+} from 'hono/aws-lambda';
 import type { Context } from 'aws-lambda';
 import { app } from './index.js';
 import { getLogger, type LambdaContext } from './utils/logger.js';
-import { getSettings } from './config.js';
+import {
+  handleScheduledEvent,
+  type EventBridgeEvent,
+  type EventBridgeResponse,
+} from './scheduler.js';
 
 // Configure logger for Lambda
 const logger = getLogger('lambda');
 
-// =============================================================================
-// Type Definitions
-// =============================================================================
-
-/**
- * EventBridge scheduled event payload.
- */
-interface EventBridgeEvent {
-  source: string;
-  'detail-type': string;
-  detail?: Record<string, unknown>;
-  time?: string;
-  region?: string;
-  account?: string;
-  resources?: string[];
-}
-
-/**
- * Lambda handler response for EventBridge events.
- */
-interface EventBridgeResponse {
-  statusCode: number;
-  body: ReminderCheckResult | FollowUpCheckResult | WeeklyReportResult | ErrorResult;
-}
-
-/**
- * Error result for EventBridge handlers.
- */
-interface ErrorResult {
-  error: string;
-  execution_time_ms?: number;
-  valid_types?: string[];
-}
-
-/**
- * Result from reminder check handler.
- */
-interface ReminderCheckResult {
-  reminders_sent: number;
-  errors: number;
-  execution_time_ms: number;
-}
-
-/**
- * Result from follow-up check handler.
- */
-interface FollowUpCheckResult {
-  follow_ups_sent: number;
-  remind_laters_sent: number;
-  errors: number;
-  execution_time_ms: number;
-}
-
-/**
- * Result from weekly report handler.
- */
-interface WeeklyReportResult {
-  reports_sent: number;
-  errors: number;
-  execution_time_ms: number;
-}
-
 // =============================================================================
 // Cleanup Handlers
 // =============================================================================
@@ -153,253 +100,6 @@ process.on('unhandledRejection', (reason) => {
   );
 });
 
-// =============================================================================
-// EventBridge Event Handlers
-// =============================================================================
-
-/**
- * Handle reminder check triggered by EventBridge.
- *
- * This handler is invoked every 5 minutes by EventBridge Scheduler.
- * It checks all habits with trigger_time set and sends reminders
- * to users via Slack DM.
- *
- * Requirement 2.3: Support scheduled events for reminders
- *
- * @param event - EventBridge event payload
- * @param _context - Lambda context object (unused but required by Lambda signature)
- * @returns Response with reminder check results
- */
-async function handleReminderCheck(
-  event: EventBridgeEvent,
-  _context: Context
-): Promise<EventBridgeResponse> {
-  const startTime = Date.now();
-
-  logger.info('Starting reminder check', {
-    event_source: event.source,
-    detail_type: event['detail-type'],
-  });
-
-  try {
-    // Import ReminderService dynamically to avoid circular imports
-    // and to allow for lazy loading
-    // Note: ReminderService needs to be implemented in TypeScript
-    // For now, we'll return a placeholder response
-    
-    // TODO: Implement ReminderService in TypeScript
-    // const { ReminderService } = await import('./services/reminderService');
-    // const service = new ReminderService();
-    // const result = await service.checkAndSendReminders();
-
-    const executionTime = Date.now() - startTime;
-
-    // Placeholder response until ReminderService is implemented
-    const result: ReminderCheckResult = {
-      reminders_sent: 0,
-      errors: 0,
-      execution_time_ms: executionTime,
-    };
-
-    logger.info('Reminder check completed', {
-      reminders_sent: result.reminders_sent,
-      errors: result.errors,
-      execution_time_ms: result.execution_time_ms,
-    });
-
-    return {
-      statusCode: 200,
-      body: result,
-    };
-  } catch (error) {
-    const executionTime = Date.now() - startTime;
-
-    logger.error(
-      'Error in reminder check',
-      error instanceof Error ? error : new Error(String(error)),
-      { execution_time_ms: executionTime }
-    );
-
-    return {
-      statusCode: 500,
-      body: {
-        error: error instanceof Error ? error.message : String(error),
-        execution_time_ms: executionTime,
-      },
-    };
-  }
-}
-
-/**
- * Handle follow-up check triggered by EventBridge.
- *
- * This handler is invoked every 15 minutes by EventBridge Scheduler.
- * It performs two checks:
- * 1. Sends follow-up messages for habits that are 2+ hours past their
- *    trigger_time and still incomplete
- * 2. Sends remind-later notifications for habits where remind_later_at
- *    time has arrived
- *
- * Requirement 2.4: Support scheduled events for follow-ups
- *
- * @param event - EventBridge event payload
- * @param _context - Lambda context object (unused but required by Lambda signature)
- * @returns Response with follow-up check results
- */
-async function handleFollowUpCheck(
-  event: EventBridgeEvent,
-  _context: Context
-): Promise<EventBridgeResponse> {
-  const startTime = Date.now();
-
-  logger.info('Starting follow-up check', {
-    event_source: event.source,
-    detail_type: event['detail-type'],
-  });
-
-  try {
-    // Import FollowUpAgent dynamically to avoid circular imports
-    // Note: FollowUpAgent needs to be implemented in TypeScript
-    // For now, we'll return a placeholder response
-    
-    // TODO: Implement FollowUpAgent in TypeScript
-    // const { FollowUpAgent } = await import('./services/followUpAgent');
-    // const agent = new FollowUpAgent();
-    // const followUpCount = await agent.checkAndSendFollowUps();
-    // const remindLaterCount = await agent.checkRemindLater();
-
-    const executionTime = Date.now() - startTime;
-
-    // Placeholder response until FollowUpAgent is implemented
-    const result: FollowUpCheckResult = {
-      follow_ups_sent: 0,
-      remind_laters_sent: 0,
-      errors: 0,
-      execution_time_ms: executionTime,
-    };
-
-    logger.info('Follow-up check completed', {
-      follow_ups_sent: result.follow_ups_sent,
-      remind_laters_sent: result.remind_laters_sent,
-      errors: result.errors,
-      execution_time_ms: result.execution_time_ms,
-    });
-
-    return {
-      statusCode: 200,
-      body: result,
-    };
-  } catch (error) {
-    const executionTime = Date.now() - startTime;
-
-    logger.error(
-      'Error in follow-up check',
-      error instanceof Error ? error : new Error(String(error)),
-      { execution_time_ms: executionTime }
-    );
-
-    return {
-      statusCode: 500,
-      body: {
-        error: error instanceof Error ? error.message : String(error),
-        execution_time_ms: executionTime,
-      },
-    };
-  }
-}
-
-/**
- * Handle weekly report check triggered by EventBridge.
- *
- * This handler is invoked every 15 minutes by EventBridge Scheduler.
- * It checks all users with weekly_slack_report_enabled and sends
- * weekly reports to those whose configured day and time have arrived.
- *
- * Requirement 2.2: Support scheduled events for weekly reports
- *
- * @param event - EventBridge event payload
- * @param _context - Lambda context object (unused but required by Lambda signature)
- * @returns Response with weekly report results
- */
-async function handleWeeklyReport(
-  event: EventBridgeEvent,
-  _context: Context
-): Promise<EventBridgeResponse> {
-  const startTime = Date.now();
-
-  logger.info('Starting weekly report check', {
-    event_source: event.source,
-    detail_type: event['detail-type'],
-  });
-
-  try {
-    // Import WeeklyReportGenerator and repositories
-    const { WeeklyReportGenerator } = await import('./services/weeklyReportGenerator.js');
-    const { SlackRepository } = await import('./repositories/slackRepository.js');
-    const { HabitRepository } = await import('./repositories/habitRepository.js');
-    const { ActivityRepository } = await import('./repositories/activityRepository.js');
-    const { createClient } = await import('@supabase/supabase-js');
-
-    const settings = getSettings();
-
-    // Create Supabase client
-    if (!settings.supabaseUrl || !settings.supabaseServiceRoleKey) {
-      throw new Error('Supabase configuration is missing');
-    }
-
-    const supabase = createClient(settings.supabaseUrl, settings.supabaseServiceRoleKey);
-
-    // Create repositories
-    const slackRepo = new SlackRepository(supabase);
-    const habitRepo = new HabitRepository(supabase);
-    const activityRepo = new ActivityRepository(supabase);
-
-    // Create generator and send reports
-    const generator = new WeeklyReportGenerator(
-      slackRepo,
-      habitRepo,
-      activityRepo
-    );
-
-    const reportsSent = await generator.sendAllWeeklyReports(supabase);
-
-    const executionTime = Date.now() - startTime;
-
-    const result: WeeklyReportResult = {
-      reports_sent: reportsSent,
-      errors: 0,
-      execution_time_ms: executionTime,
-    };
-
-    logger.info('Weekly report check completed', {
-      reports_sent: result.reports_sent,
-      errors: result.errors,
-      execution_time_ms: result.execution_time_ms,
-    });
-
-    return {
-      statusCode: 200,
-      body: result,
-    };
-  } catch (error) {
-    const executionTime = Date.now() - startTime;
-
-    logger.error(
-      'Error in weekly report check',
-      error instanceof Error ? error : new Error(String(error)),
-      { execution_time_ms: executionTime }
-    );
-
-    return {
-      statusCode: 500,
-      body: {
-        error: error instanceof Error ? error.message : String(error),
-        execution_time_ms: executionTime,
-      },
-    };
-  }
-}
-
 // =============================================================================
 // Main Lambda Handler
 // =============================================================================
@@ -455,41 +155,7 @@ export async function handler(
   // Check if this is an EventBridge Scheduler event
   // EventBridge events have "source" field set to "aws.scheduler"
   if ('source' in event && event.source === 'aws.scheduler') {
-    const eventBridgeEvent = event as EventBridgeEvent;
-    const scheduleType = eventBridgeEvent['detail-type'] ?? '';
-
-    logger.info('Received EventBridge event', {
-      source: eventBridgeEvent.source,
-      detail_type: scheduleType,
-    });
-
-    // Route to appropriate handler based on schedule type
-    switch (scheduleType) {
-      // Requirement 2.3: Reminder check (5-minute interval)
-      case 'reminder-check':
-        return handleReminderCheck(eventBridgeEvent, context);
-
-      // Requirement 2.4: Follow-up and remind-later check (15-minute interval)
-      case 'follow-up-check':
-        return handleFollowUpCheck(eventBridgeEvent, context);
-
-      // Requirement 2.2: Weekly report check (15-minute interval)
-      case 'weekly-report':
-        return handleWeeklyReport(eventBridgeEvent, context);
-
-      default:
-        logger.warning(`Unknown EventBridge schedule type: ${scheduleType}`, {
-          detail_type: scheduleType,
-        });
-
-        return {
-          statusCode: 400,
-          body: {
-            error: `Unknown schedule type: ${scheduleType}`,
-            valid_types: ['reminder-check', 'follow-up-check', 'weekly-report'],
-          },
-        };
-    }
+    return handleScheduledEvent(event as EventBridgeEvent, context);
   }
 
   // Handle API Gateway requests via Hono
@@ -498,5 +164,16 @@ export async function handler(
   return apiHandler(event as LambdaEvent, context);
 }
 
+/**
+ * Streaming Lambda handler for Function URL (RESPONSE_STREAM invoke mode).
+ *
+ * API Gateway HTTP API buffers responses, so large responses are served
+ * through a Lambda Function URL instead. Bytes are sent to the client as
+ * Hono produces them, which lowers TTFB and avoids the 6 MB buffered
+ * payload limit. Only HTTP requests are routed here; scheduled events
+ * are handled by the scheduler function (scheduler.ts).
+ */
+export const streamHandler = streamHandle(app);
+
 // Export the handler as default for Lambda
 export default handler;
@@ -9,7 +9,7 @@
 
 import type { MiddlewareHandler, Context } from 'hono';
 import { cors as honoCors } from 'hono/cors';
-import { getSettings } from '../config.js';
+import { getSettings, refreshCorsOrigins } from '../config.js';
 import { getLogger } from '../utils/logger.js';
 
 const logger = getLogger('middleware.cors');
@@ -122,17 +122,18 @@ export function corsMiddleware(options: CorsOptions = {}): MiddlewareHandler {
     ...options,
   };
 
-  // Determine allowed origins
+  // Determine allowed origins (null = function case or settings, read per request
+  // so refreshed origins are picked up without re-creating the middleware)
   const allowedOrigins = options.origins
     ? Array.isArray(options.origins)
       ? options.origins
       : typeof options.origins === 'string'
         ? [options.origins]
-        : null // function case handled separately
-    : settings.corsOrigins;
+        : null
+    : null;
 
   logger.info('CORS middleware initialized', {
-    origins: allowedOrigins || 'dynamic',
+    origins: allowedOrigins || (options.origins ? 'dynamic' : settings.corsOrigins),
     credentials: config.credentials,
     methods: config.allowMethods,
   });
@@ -178,6 +179,8 @@ export function corsMiddleware(options: CorsOptions = {}): MiddlewareHandler {
  *
  * Configuration:
  * - CORS_ORIGINS: Comma-separated list or JSON array of allowed origins
+ * - CORS_ORIGINS_PARAMETER: SSM parameter name; origins are refreshed from it
+ *   on Lambda (see refreshCorsOrigins)
  * - Credentials: Always enabled
  * - Methods: All methods allowed
  * - Headers: All headers allowed
@@ -185,7 +188,12 @@ export function corsMiddleware(options: CorsOptions = {}): MiddlewareHandler {
  * @returns Hono middleware handler
  */
 export function createCorsMiddleware(): MiddlewareHandler {
-  return corsMiddleware();
+  const middleware = corsMiddleware();
+
+  return async (c, next) => {
+    await refreshCorsOrigins();
+    return middleware(c, next);
+  };
 }
 
 /**
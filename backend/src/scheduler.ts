@@ -0,0 +1,418 @@
+/**
+ * Lambda Handler for Scheduled Jobs
+ *
+ * This module provides the AWS Lambda entry point for EventBridge Scheduler
+ * events (reminder-check, follow-up-check, weekly-report). It is deployed as
+ * a separate function from the HTTP API so scheduled work and user-facing
+ * requests do not share cold starts or concurrency.
+ *
+ * Requirements:
+ * - 2.2: Support scheduled events for weekly reports
+ * - 2.3: Support scheduled events for reminders
+ * - 2.4: Support scheduled events for follow-ups
+ */
+
+import type { Context } from 'aws-lambda';
+import { getLogger, type LambdaContext } from './utils/logger.js';
+import { getSettings } from './config.js';
+
+const logger = getLogger('scheduler');
+
+// =============================================================================
+// Type Definitions
+// =============================================================================
+
+/**
+ * EventBridge scheduled event payload.
+ */
+export interface EventBridgeEvent {
+  source: string;
+  'detail-type': string;
+  detail?: Record<string, unknown>;
+  time?: string;
+  region?: string;
+  account?: string;
+  resources?: string[];
+}
+
+/**
+ * Lambda handler response for EventBridge events.
+ */
+export interface EventBridgeResponse {
+  statusCode: number;
+  body: ReminderCheckResult | FollowUpCheckResult | WeeklyReportResult | ErrorResult;
+}
+
+/**
+ * Error result for EventBridge handlers.
+ */
+interface ErrorResult {
+  error: string;
+  execution_time_ms?: number;
+  valid_types?: string[];
+}
+
+/**
+ * Result from reminder check handler.
+ */
+interface ReminderCheckResult {
+  reminders_sent: number;
+  errors: number;
+  execution_time_ms: number;
+}
+
+/**
+ * Result from follow-up check handler.
+ */
+interface FollowUpCheckResult {
+  follow_ups_sent: number;
+  remind_laters_sent: number;
+  errors: number;
+  execution_time_ms: number;
+}
+
+/**
+ * Result from weekly report handler.
+ */
+interface WeeklyReportResult {
+  reports_sent: number;
+  errors: number;
+  execution_time_ms: number;
+}
+
+// =============================================================================
+// EventBridge Event Handlers
+// =============================================================================
+
+/**
+ * Handle reminder check triggered by EventBridge.
+ *
+ * This handler is invoked every 5 minutes by EventBridge Scheduler.
+ * It checks all habits with trigger_time set and sends reminders
+ * to users via Slack DM.
+ *
+ * Requirement 2.3: Support scheduled events for reminders
+ *
+ * @param event - EventBridge event payload
+ * @param _context - Lambda context object (unused but required by Lambda signature)
+ * @returns Response with reminder check results
+ */
+async function handleReminderCheck(
+  event: EventBridgeEvent,
+  _context: Context
+): Promise<EventBridgeResponse> {
+  const startTime = Date.now();
+
+  logger.info('Starting reminder check', {
+    event_source: event.source,
+    detail_type: event['detail-type'],
+  });
+
+  try {
+    // Import ReminderService dynamically to avoid circular imports
+    // and to allow for lazy loading
+    // Note: ReminderService needs to be implemented in TypeScript
+    // For now, we'll return a placeholder response
+    
+    // TODO: Implement ReminderService in TypeScript
+    // const { ReminderService } = await import('./services/reminderService');
+    // const service = new ReminderService();
+    // const result = await service.checkAndSendReminders();
+
+    const executionTime = Date.now() - startTime;
+
+    // Placeholder response until ReminderService is implemented
+    const result: ReminderCheckResult = {
+      reminders_sent: 0,
+      errors: 0,
+      execution_time_ms: executionTime,
+    };
+
+    logger.info('Reminder check completed', {
+      reminders_sent: result.reminders_sent,
+      errors: result.errors,
+      execution_time_ms: result.execution_time_ms,
+    });
+
+    return {
+      statusCode: 200,
+      body: result,
+    };
+  } catch (error) {
+    const executionTime = Date.now() - startTime;
+
+    logger.error(
+      'Error in reminder check',
+      error instanceof Error ? error : new Error(String(error)),
+      { execution_time_ms: executionTime }
+    );
+
+    return {
+      statusCode: 500,
+      body: {
+        error: error instanceof Error ? error.message : String(error),
+        execution_time_ms: executionTime,
+      },
+    };
+  }
+}
+
+/**
+ * Handle follow-up check triggered by EventBridge.
+ *
+ * This handler is invoked every 15 minutes by EventBridge Scheduler.
+ * It performs two checks:
+ * 1. Sends follow-up messages for habits that are 2+ hours past their
+ *    trigger_time and still incomplete
+ * 2. Sends remind-later notifications for habits where remind_later_at
+ *    time has arrived
+ *
+ * Requirement 2.4: Support scheduled events for follow-ups
+ *
+ * @param event - EventBridge event payload
+ * @param _context - Lambda context object (unused but required by Lambda signature)
+ * @returns Response with follow-up check results
+ */
+async function handleFollowUpCheck(
+  event: EventBridgeEvent,
+  _context: Context
+): Promise<EventBridgeResponse> {
+  const startTime = Date.now();
+
+  logger.info('Starting follow-up check', {
+    event_source: event.source,
+    detail_type: event['detail-type'],
+  });
+
+  try {
+    // Import FollowUpAgent dynamically to avoid circular imports
+    // Note: FollowUpAgent needs to be implemented in TypeScript
+    // For now, we'll return a placeholder response
+    
+    // TODO: Implement FollowUpAgent in TypeScript
+    // const { FollowUpAgent } = await import('./services/followUpAgent');
+    // const agent = new FollowUpAgent();
+    // const followUpCount = await agent.checkAndSendFollowUps();
+    // const remindLaterCount = await agent.checkRemindLater();
+
+    const executionTime = Date.now() - startTime;
+
+    // Placeholder response until FollowUpAgent is implemented
+    const result: FollowUpCheckResult = {
+      follow_ups_sent: 0,
+      remind_laters_sent: 0,
+      errors: 0,
+      execution_time_ms: executionTime,
+    };
+
+    logger.info('Follow-up check completed', {
+      follow_ups_sent: result.follow_ups_sent,
+      remind_laters_sent: result.remind_laters_sent,
+      errors: result.errors,
+      execution_time_ms: result.execution_time_ms,
+    });
+
+    return {
+      statusCode: 200,
+      body: result,
+    };
+  } catch (error) {
+    const executionTime = Date.now() - startTime;
+
+    logger.error(
+      'Error in follow-up check',
+      error instanceof Error ? error : new Error(String(error)),
+      { execution_time_ms: executionTime }
+    );
+
+    return {
+      statusCode: 500,
+      body: {
+        error: error instanceof Error ? error.message : String(error),
+        execution_time_ms: executionTime,
+      },
+    };
+  }
+}
+
+/**
+ * Handle weekly report check triggered by EventBridge.
+ *
+ * This handler is invoked every 15 minutes by EventBridge Scheduler.
+ * It checks all users with weekly_slack_report_enabled and sends
+ * weekly reports to those whose configured day and time have arrived.
+ *
+ * Requirement 2.2: Support scheduled events for weekly reports
+ *
+ * @param event - EventBridge event payload
+ * @param _context - Lambda context object (unused but required by Lambda signature)
+ * @returns Response with weekly report results
+ */
+async function handleWeeklyReport(
+  event: EventBridgeEvent,
+  _context: Context
+): Promise<EventBridgeResponse> {
+  const startTime = Date.now();
+
+  logger.info('Starting weekly report check', {
+    event_source: event.source,
+    detail_type: event['detail-type'],
+  });
+
+  try {
+    // Import WeeklyReportGenerator and repositories
+    const { WeeklyReportGenerator } = await import('./services/weeklyReportGenerator.js');
+    const { SlackRepository } = await import('./repositories/slackRepository.js');
+    const { HabitRepository } = await import('./repositories/habitRepository.js');
+    const { ActivityRepository } = await import('./repositories/activityRepository.js');
+    const { createClient } = await import('@supabase/supabase-js');
+
+    const settings = getSettings();
+
+    // Create Supabase client
+    if (!settings.supabaseUrl || !settings.supabaseServiceRoleKey) {
+      throw new Error('Supabase configuration is missing');
+    }
+
+    const supabase = createClient(settings.supabaseUrl, settings.supabaseServiceRoleKey);
+
+    // Create repositories
+    const slackRepo = new SlackRepository(supabase);
+    const habitRepo = new HabitRepository(supabase);
+    const activityRepo = new ActivityRepository(supabase);
+
+    // Create generator and send reports
+    const generator = new WeeklyReportGenerator(
+      slackRepo,
+      habitRepo,
+      activityRepo
+    );
+
+    const reportsSent = await generator.sendAllWeeklyReports(supabase);
+
+    const executionTime = Date.now() - startTime;
+
+    const result: WeeklyReportResult = {
+      reports_sent: reportsSent,
+      errors: 0,
+      execution_time_ms: executionTime,
+    };
+
+    logger.info('Weekly report check completed', {
+      reports_sent: result.reports_sent,
+      errors: result.errors,
+      execution_time_ms: result.execution_time_ms,
+    });
+
+    return {
+      statusCode: 200,
+      body: result,
+    };
+  } catch (error) {
+    const executionTime = Date.now() - startTime;
+
+    logger.error(
+      'Error in weekly report check',
+      error instanceof Error ? error : new Error(String(error)),
+      { execution_time_ms: executionTime }
+    );
+
+    return {
+      statusCode: 500,
+      body: {
+        error: error instanceof Error ? error.message : String(error),
+        execution_time_ms: executionTime,
+      },
+    };
+  }
+}
+
+// =============================================================================
+// Scheduled Event Router
+// =============================================================================
+
+/**
+ * Route an EventBridge Scheduler event to its job handler by detail-type.
+ *
+ * Shared by the dedicated scheduler Lambda (`handler` below) and the
+ * unified handler in lambda.ts.
+ *
+ * @param event - EventBridge event payload
+ * @param context - Lambda context object
+ * @returns Response from the matching job handler
+ */
+export async function handleScheduledEvent(
+  event: EventBridgeEvent,
+  context: Context
+): Promise<EventBridgeResponse> {
+  const scheduleType = event['detail-type'] ?? '';
+
+  logger.info('Received EventBridge event', {
+    source: event.source,
+    detail_type: scheduleType,
+  });
+
+  // Route to appropriate handler based on schedule type
+  switch (scheduleType) {
+    // Requirement 2.3: Reminder check (5-minute interval)
+    case 'reminder-check':
+      return handleReminderCheck(event, context);
+
+    // Requirement 2.4: Follow-up and remind-later check (15-minute interval)
+    case 'follow-up-check':
+      return handleFollowUpCheck(event, context);
+
+    // Requirement 2.2: Weekly report check (15-minute interval)
+    case 'weekly-report':
+      return handleWeeklyReport(event, context);
+
+    default:
+      logger.warning(`Unknown EventBridge schedule type: ${scheduleType}`, {
+        detail_type: scheduleType,
+      });
+
+      return {
+        statusCode: 400,
+        body: {
+          error: `Unknown schedule type: ${scheduleType}`,
+          valid_types: ['reminder-check', 'follow-up-check', 'weekly-report'],
+        },
+      };
+  }
+}
+
+// =============================================================================
+// Scheduler Lambda Handler
+// =============================================================================
+
+/**
+ * Lambda handler for the dedicated scheduler function.
+ *
+ * Only EventBridge Scheduler events are delivered here. This module does
+ * not import the Hono application, so the scheduler function's cold start
+ * does not pay for loading HTTP routers, and HTTP cold starts do not pay
+ * for scheduled job dependencies.
+ *
+ * @param event - EventBridge event payload
+ * @param context - Lambda context object
+ * @returns Response from the matching job handler
+ */
+export async function handler(
+  event: EventBridgeEvent,
+  context: Context
+): Promise<EventBridgeResponse> {
+  const lambdaContext: LambdaContext = {
+    awsRequestId: context.awsRequestId,
+    functionName: context.functionName,
+    functionVersion: context.functionVersion,
+    memoryLimitInMB: parseInt(String(context.memoryLimitInMB), 10),
+    invokedFunctionArn: context.invokedFunctionArn,
+    getRemainingTimeInMillis: () => context.getRemainingTimeInMillis(),
+  };
+
+  logger.setLambdaContext(lambdaContext);
+
+  return handleScheduledEvent(event, context);
+}
+
+export default handler;
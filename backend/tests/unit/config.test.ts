@@ -0,0 +1,108 @@
+/**
+ * Config Unit Tests
+ *
+ * Tests for refreshing CORS origins from SSM Parameter Store through the
+ * AWS Parameters and Secrets Lambda Extension.
+ */
+
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+
+// =============================================================================
+// Test Helpers
+// =============================================================================
+
+type ConfigModule = typeof import('@/config');
+
+/**
+ * Import a fresh config module so the per-container refresh throttle starts
+ * from zero in every test.
+ */
+async function importConfig(): Promise<ConfigModule> {
+  vi.resetModules();
+  return import('@/config');
+}
+
+function parameterResponse(value: string): Response {
+  return new Response(JSON.stringify({ Parameter: { Value: value } }), { status: 200 });
+}
+
+// =============================================================================
+// Tests
+// =============================================================================
+
+describe('refreshCorsOrigins', () => {
+  let fetchMock: ReturnType<typeof vi.fn>;
+
+  beforeEach(() => {
+    fetchMock = vi.fn();
+    vi.stubGlobal('fetch', fetchMock);
+    vi.stubEnv('CORS_ORIGINS', 'http://localhost:3000');
+    vi.stubEnv('CORS_ORIGINS_PARAMETER', '/vow/cors-origins');
+    vi.stubEnv('AWS_SESSION_TOKEN', 'test-session-token');
+    vi.stubEnv('PARAMETERS_SECRETS_EXTENSION_HTTP_PORT', '2773');
+  });
+
+  afterEach(() => {
+    vi.unstubAllGlobals();
+    vi.unstubAllEnvs();
+    vi.useRealTimers();
+  });
+
+  it('should update origins from the SSM parameter via the extension', async () => {
+    fetchMock.mockResolvedValue(parameterResponse('["https://app.example.com","https://admin.example.com"]'));
+    const config = await importConfig();
+
+    await config.refreshCorsOrigins();
+
+    expect(fetchMock).toHaveBeenCalledWith(
+      'http://localhost:2773/systemsmanager/parameters/get?name=%2Fvow%2Fcors-origins',
+      { headers: { 'X-Aws-Parameters-Secrets-Token': 'test-session-token' } }
+    );
+    expect(config.getSettings().corsOrigins).toEqual([
+      'https://app.example.com',
+      'https://admin.example.com',
+    ]);
+  });
+
+  it('should do nothing when no parameter is configured', async () => {
+    vi.stubEnv('CORS_ORIGINS_PARAMETER', '');
+    const config = await importConfig();
+
+    await config.refreshCorsOrigins();
+
+    expect(fetchMock).not.toHaveBeenCalled();
+    expect(config.getSettings().corsOrigins).toEqual(['http://localhost:3000']);
+  });
+
+  it('should read the parameter at most once per minute', async () => {
+    vi.useFakeTimers();
+    fetchMock.mockImplementation(async () => parameterResponse('["https://app.example.com"]'));
+    const config = await importConfig();
+
+    await config.refreshCorsOrigins();
+    await config.refreshCorsOrigins();
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+
+    vi.advanceTimersByTime(60_000);
+    await config.refreshCorsOrigins();
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+  });
+
+  it('should keep the current origins when the extension request fails', async () => {
+    fetchMock.mockRejectedValueOnce(new Error('connection refused'));
+    const config = await importConfig();
+
+    await config.refreshCorsOrigins();
+
+    expect(config.getSettings().corsOrigins).toEqual(['http://localhost:3000']);
+  });
+
+  it('should keep the current origins on a non-OK response', async () => {
+    fetchMock.mockResolvedValue(new Response('not found', { status: 404 }));
+    const config = await importConfig();
+
+    await config.refreshCorsOrigins();
+
+    expect(config.getSettings().corsOrigins).toEqual(['http://localhost:3000']);
+  });
+});
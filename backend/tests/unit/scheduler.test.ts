@@ -0,0 +1,103 @@
+/**
+ * Scheduler Lambda Handler Unit Tests
+ *
+ * Tests for the dedicated scheduler Lambda that handles EventBridge
+ * Scheduler events without loading the Hono application.
+ *
+ * **Validates: Requirements 2.2, 2.3, 2.4**
+ */
+
+import { describe, it, expect, vi, beforeEach } from 'vitest';
+import type { Context as LambdaContext } from 'aws-lambda';
+
+// =============================================================================
+// Mock Setup
+// =============================================================================
+
+vi.mock('@/utils/logger', () => ({
+  getLogger: () => ({
+    info: vi.fn(),
+    warning: vi.fn(),
+    error: vi.fn(),
+    debug: vi.fn(),
+    setLambdaContext: vi.fn(),
+  }),
+}));
+
+vi.mock('@/config', () => ({
+  getSettings: () => ({
+    supabaseUrl: 'https://test.supabase.co',
+    supabaseServiceRoleKey: 'test-service-role-key',
+  }),
+}));
+
+// The scheduler must not depend on the Hono application
+vi.mock('@/index', () => {
+  throw new Error('scheduler should not import the Hono app');
+});
+
+// =============================================================================
+// Test Helpers
+// =============================================================================
+
+function createMockLambdaContext(): LambdaContext {
+  return {
+    awsRequestId: 'test-request-id-123',
+    functionName: 'vow-backend-scheduler',
+    functionVersion: '$LATEST',
+    memoryLimitInMB: '512',
+    invokedFunctionArn: 'arn:aws:lambda:ap-northeast-1:123456789:function:vow-backend-scheduler',
+    logGroupName: '/aws/lambda/vow-backend',
+    logStreamName: '2024/01/01/[$LATEST]abc123',
+    callbackWaitsForEmptyEventLoop: true,
+    getRemainingTimeInMillis: () => 300000,
+    done: vi.fn(),
+    fail: vi.fn(),
+    succeed: vi.fn(),
+  };
+}
+
+function createEventBridgeEvent(detailType: string) {
+  return {
+    source: 'aws.scheduler',
+    'detail-type': detailType,
+    detail: {},
+  };
+}
+
+// =============================================================================
+// Tests
+// =============================================================================
+
+describe('Scheduler Lambda Handler', () => {
+  let handler: typeof import('@/scheduler').handler;
+
+  beforeEach(async () => {
+    const schedulerModule = await import('@/scheduler');
+    handler = schedulerModule.handler;
+  });
+
+  it('should route reminder-check events to reminder handler', async () => {
+    const result = await handler(createEventBridgeEvent('reminder-check'), createMockLambdaContext());
+
+    expect(result.statusCode).toBe(200);
+    expect(result.body).toHaveProperty('reminders_sent');
+  });
+
+  it('should route follow-up-check events to follow-up handler', async () => {
+    const result = await handler(createEventBridgeEvent('follow-up-check'), createMockLambdaContext());
+
+    expect(result.statusCode).toBe(200);
+    expect(result.body).toHaveProperty('follow_ups_sent');
+    expect(result.body).toHaveProperty('remind_laters_sent');
+  });
+
+  it('should return 400 for unknown schedule types', async () => {
+    const result = await handler(createEventBridgeEvent('unknown-event-type'), createMockLambdaContext());
+
+    expect(result.statusCode).toBe(400);
+    const body = result.body as { error: string; valid_types: string[] };
+    expect(body.error).toContain('Unknown schedule type');
+    expect(body.valid_types).toEqual(['reminder-check', 'follow-up-check', 'weekly-report']);
+  });
+});
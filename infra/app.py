@@ -9,6 +9,8 @@ application:
 - Amazon RDS PostgreSQL for database
 """
 
+import os
+
 import aws_cdk as cdk
 from stack import VowDevStack
 from stacks.database_stack import DatabaseStack
@@ -21,6 +23,8 @@ def main():
 
     # Environment configuration
     env = cdk.Environment(
+        # Account is required for Vpc.from_lookup when vpc_id is given
+        account=os.environ.get("CDK_DEFAULT_ACCOUNT"),
         region="ap-northeast-1",  # Tokyo region for low latency
     )
 
@@ -39,6 +43,9 @@ def main():
     # =================================================================
     # Only deploy if backend is enabled via context
     deploy_backend = app.node.try_get_context("deploy_backend") == "true"
+    stage = app.node.try_get_context("stage") or "dev"
+    # Existing VPC to share across stacks (optional)
+    vpc_id = app.node.try_get_context("vpc_id")
     
     if deploy_backend:
         database_stack = DatabaseStack(
@@ -46,6 +53,8 @@ def main():
             "VowDatabaseStack",
             env=env,
             description="Vow App Database - RDS PostgreSQL",
+            stage=stage,
+            vpc_id=vpc_id,
         )
 
         # =================================================================
@@ -53,6 +62,19 @@ def main():
         # =================================================================
         # Get Amplify URL from context or use placeholder
         amplify_app_url = app.node.try_get_context("amplify_app_url") or ""
+
+        # ECR image digest pushed by CI (e.g. -c image_digest="sha256:...").
+        # Deploying the mutable "latest" tag is opt-in (-c allow_latest_image=true),
+        # only meant for the initial deploy before CI has pushed an image.
+        image_digest = app.node.try_get_context("image_digest") or ""
+        if not image_digest:
+            if app.node.try_get_context("allow_latest_image") != "true":
+                raise ValueError(
+                    "image_digest context is required when deploy_backend=true "
+                    '(-c image_digest="sha256:..."); pass -c allow_latest_image=true '
+                    "to deploy the latest tag instead"
+                )
+            image_digest = "latest"
         
         backend_stack = BackendStack(
             app,
@@ -64,6 +86,7 @@ def main():
             database_endpoint=database_stack.database.db_instance_endpoint_address,
             database_port=database_stack.database.db_instance_endpoint_port,
             amplify_app_url=amplify_app_url,
+            image_digest=image_digest,
         )
 
         # Set stack dependencies
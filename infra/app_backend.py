@@ -32,6 +32,9 @@ slack_client_secret = app.node.try_get_context("slack_client_secret") or os.envi
 slack_signing_secret = app.node.try_get_context("slack_signing_secret") or os.environ.get("SLACK_SIGNING_SECRET", "")
 token_encryption_key = app.node.try_get_context("token_encryption_key") or os.environ.get("TOKEN_ENCRYPTION_KEY", "")
 
+# API Gateway access logs are disabled unless explicitly requested (-c api_access_logs=true)
+access_logging_enabled = app.node.try_get_context("api_access_logs") == "true"
+
 # CORS origins - add your frontend URLs
 cors_origins = [
     "http://localhost:3000",
@@ -50,6 +53,7 @@ BackendLambdaStack(
     slack_signing_secret=slack_signing_secret,
     token_encryption_key=token_encryption_key,
     cors_origins=cors_origins,
+    access_logging_enabled=access_logging_enabled,
     env=cdk.Environment(
         account=os.environ.get("CDK_DEFAULT_ACCOUNT"),
         region=os.environ.get("CDK_DEFAULT_REGION", "ap-northeast-1"),
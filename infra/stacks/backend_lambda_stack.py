@@ -3,8 +3,10 @@ BackendLambdaStack - TypeScript Backend on AWS Lambda
 
 This stack creates:
 - Lambda Function for TypeScript backend (Hono framework)
+- Separate Lambda Function for scheduled jobs
+- Lambda Function URL with response streaming for large responses
 - API Gateway HTTP API for Lambda integration
-- EventBridge rules for scheduled tasks
+- EventBridge Scheduler schedules for scheduled tasks
 - IAM roles and policies
 
 The backend uses:
@@ -13,6 +15,7 @@ The backend uses:
 - jose for JWT handling
 """
 
+import json
 import os
 from pathlib import Path
 
@@ -24,10 +27,10 @@ from aws_cdk import (
     aws_lambda as lambda_,
     aws_apigatewayv2 as apigwv2,
     aws_apigatewayv2_integrations as apigwv2_integrations,
-    aws_events as events,
-    aws_events_targets as targets,
     aws_iam as iam,
     aws_logs as logs,
+    aws_scheduler as scheduler,
+    aws_ssm as ssm,
 )
 from constructs import Construct
 
@@ -36,8 +39,8 @@ class BackendLambdaStack(Stack):
     """
     CDK Stack for Backend on Lambda.
     
-    Deploys the TypeScript Hono backend with API Gateway HTTP API
-    and EventBridge scheduled events.
+    Deploys the TypeScript Hono backend with API Gateway HTTP API,
+    and a separate scheduler Lambda driven by EventBridge Scheduler.
     """
 
     def __init__(
@@ -52,6 +55,8 @@ class BackendLambdaStack(Stack):
         slack_signing_secret: str = "",
         token_encryption_key: str = "",
         cors_origins: list[str] = None,
+        access_logging_enabled: bool = False,
+        stream_reserved_concurrency: int = 10,
         **kwargs,
     ) -> None:
         super().__init__(scope, construct_id, **kwargs)
@@ -74,6 +79,21 @@ class BackendLambdaStack(Stack):
             ],
         )
 
+        # =================================================================
+        # SSM Parameter for CORS Origins
+        # =================================================================
+        # Read at runtime through the Parameters and Secrets Lambda Extension
+        # so CORS changes do not require a Lambda redeploy.
+        cors_origins_param = ssm.StringParameter(
+            self,
+            "CorsOriginsParam",
+            parameter_name="/vow/backend-lambda/cors-origins",
+            string_value=json.dumps(cors_origins),
+            description="Allowed CORS origins for backend Lambda (JSON array)",
+            tier=ssm.ParameterTier.STANDARD,
+        )
+        cors_origins_param.grant_read(lambda_role)
+
         # =================================================================
         # CloudWatch Log Group
         # =================================================================
@@ -86,8 +106,29 @@ class BackendLambdaStack(Stack):
         )
 
         # =================================================================
-        # Lambda Function
+        # Lambda Functions
         # =================================================================
+        lambda_code = lambda_.Code.from_asset(
+            # Path to lambda-package directory (relative to workspace root)
+            path=str(Path(__file__).parent.parent.parent / "backend" / "lambda-package"),
+        )
+        lambda_environment = {
+            "NODE_ENV": "production",
+            "SUPABASE_URL": supabase_url or "SET_VIA_CONSOLE",
+            "SUPABASE_SERVICE_ROLE_KEY": supabase_service_role_key or "SET_VIA_CONSOLE",
+            "JWT_SECRET": jwt_secret or "SET_VIA_CONSOLE",
+            "SLACK_CLIENT_ID": slack_client_id or "SET_VIA_CONSOLE",
+            "SLACK_CLIENT_SECRET": slack_client_secret or "SET_VIA_CONSOLE",
+            "SLACK_SIGNING_SECRET": slack_signing_secret or "SET_VIA_CONSOLE",
+            "TOKEN_ENCRYPTION_KEY": token_encryption_key or "SET_VIA_CONSOLE",
+            "CORS_ORIGINS_PARAMETER": cors_origins_param.parameter_name,
+        }
+        params_and_secrets = lambda_.ParamsAndSecretsLayerVersion.from_version(
+            lambda_.ParamsAndSecretsVersions.V1_0_103,
+            cache_size=10,
+            parameter_store_ttl=Duration.minutes(5),
+        )
+
         self.lambda_function = lambda_.Function(
             self,
             "BackendFunction",
@@ -95,28 +136,66 @@ class BackendLambdaStack(Stack):
             description="TypeScript backend for Vow habit tracking (Hono framework)",
             runtime=lambda_.Runtime.NODEJS_20_X,
             handler="lambda-package/lambda.handler",
-            # Path to lambda-package directory (relative to workspace root)
-            # CDK resolves paths from the current working directory
-            code=lambda_.Code.from_asset(
-                path=str(Path(__file__).parent.parent.parent / "backend" / "lambda-package"),
-            ),
+            code=lambda_code,
+            timeout=Duration.seconds(30),
+            memory_size=512,
+            role=lambda_role,
+            environment=lambda_environment,
+            params_and_secrets=params_and_secrets,
+            log_group=log_group,
+        )
+
+        # Streaming function for large responses. HTTP API cannot stream,
+        # so it is exposed through a Function URL in RESPONSE_STREAM mode.
+        # CORS is handled by the Hono middleware.
+        #
+        # The URL is public (auth type NONE) because clients authenticate with
+        # a JWT in the Authorization header, which CloudFront OAC / AWS_IAM
+        # auth would replace with a SigV4 signature. Unlike the HTTP API, a
+        # Function URL has no stage throttling, so reserved concurrency caps
+        # how far unauthenticated traffic can scale this function and keeps
+        # it from exhausting the account concurrency shared with the API and
+        # scheduler functions.
+        self.stream_function = lambda_.Function(
+            self,
+            "BackendStreamFunction",
+            function_name="vow-backend-stream",
+            description="Streaming HTTP handler for Vow backend (Hono framework)",
+            runtime=lambda_.Runtime.NODEJS_20_X,
+            handler="lambda-package/lambda.streamHandler",
+            code=lambda_code,
             timeout=Duration.seconds(30),
             memory_size=512,
+            reserved_concurrent_executions=stream_reserved_concurrency,
+            role=lambda_role,
+            environment=lambda_environment,
+            params_and_secrets=params_and_secrets,
+            log_group=log_group,
+        )
+
+        # Scheduled jobs run in their own function so their dependencies and
+        # concurrency do not affect cold starts of user-facing requests.
+        self.scheduler_function = lambda_.Function(
+            self,
+            "BackendSchedulerFunction",
+            function_name="vow-backend-scheduler",
+            description="Scheduled jobs for Vow backend (reminders, follow-ups, weekly reports)",
+            runtime=lambda_.Runtime.NODEJS_20_X,
+            handler="lambda-package/scheduler.handler",
+            code=lambda_code,
+            timeout=Duration.minutes(5),
+            memory_size=512,
             role=lambda_role,
-            environment={
-                "NODE_ENV": "production",
-                "SUPABASE_URL": supabase_url or "SET_VIA_CONSOLE",
-                "SUPABASE_SERVICE_ROLE_KEY": supabase_service_role_key or "SET_VIA_CONSOLE",
-                "JWT_SECRET": jwt_secret or "SET_VIA_CONSOLE",
-                "SLACK_CLIENT_ID": slack_client_id or "SET_VIA_CONSOLE",
-                "SLACK_CLIENT_SECRET": slack_client_secret or "SET_VIA_CONSOLE",
-                "SLACK_SIGNING_SECRET": slack_signing_secret or "SET_VIA_CONSOLE",
-                "TOKEN_ENCRYPTION_KEY": token_encryption_key or "SET_VIA_CONSOLE",
-                "CORS_ORIGINS": ",".join(cors_origins),
-            },
+            environment=lambda_environment,
+            params_and_secrets=params_and_secrets,
             log_group=log_group,
         )
 
+        stream_function_url = self.stream_function.add_function_url(
+            auth_type=lambda_.FunctionUrlAuthType.NONE,
+            invoke_mode=lambda_.InvokeMode.RESPONSE_STREAM,
+        )
+
         # =================================================================
         # API Gateway HTTP API
         # =================================================================
@@ -125,24 +204,18 @@ class BackendLambdaStack(Stack):
             "BackendHttpApi",
             api_name="vow-backend-api",
             description="HTTP API for backend",
-            cors_preflight=apigwv2.CorsPreflightOptions(
-                allow_origins=cors_origins,
-                allow_methods=[
-                    apigwv2.CorsHttpMethod.GET,
-                    apigwv2.CorsHttpMethod.POST,
-                    apigwv2.CorsHttpMethod.PUT,
-                    apigwv2.CorsHttpMethod.DELETE,
-                    apigwv2.CorsHttpMethod.OPTIONS,
-                ],
-                allow_headers=["*"],
-                max_age=Duration.hours(1),
-            ),
+            # No cors_preflight: when CORS is configured on an HTTP API, API
+            # Gateway answers OPTIONS itself and ignores the CORS headers the
+            # Lambda returns. Leaving it unset routes preflights through the
+            # ANY routes below to the Hono CORS middleware, which reads the
+            # allow-list from the SSM parameter at runtime.
         )
 
         # Lambda integration
         lambda_integration = apigwv2_integrations.HttpLambdaIntegration(
             "LambdaIntegration",
             self.lambda_function,
+            payload_format_version=apigwv2.PayloadFormatVersion.VERSION_2_0,
         )
 
         # Add catch-all route
@@ -159,63 +232,106 @@ class BackendLambdaStack(Stack):
             integration=lambda_integration,
         )
 
+        # Default stage settings: no detailed per-route metrics, and stage
+        # level throttling to protect the Lambda from cold-start storms.
+        # Access logs are only written when explicitly enabled.
+        default_stage = http_api.default_stage.node.default_child
+        default_stage.default_route_settings = apigwv2.CfnStage.RouteSettingsProperty(
+            detailed_metrics_enabled=False,
+            throttling_burst_limit=200,
+            throttling_rate_limit=100,
+        )
+
+        if access_logging_enabled:
+            access_log_group = logs.LogGroup(
+                self,
+                "BackendApiAccessLogGroup",
+                log_group_name="/aws/apigateway/vow-backend-api",
+                retention=logs.RetentionDays.ONE_WEEK,
+                removal_policy=RemovalPolicy.DESTROY,
+            )
+            default_stage.access_log_settings = apigwv2.CfnStage.AccessLogSettingsProperty(
+                destination_arn=access_log_group.log_group_arn,
+                format=json.dumps({
+                    "requestId": "$context.requestId",
+                    "routeKey": "$context.routeKey",
+                    "status": "$context.status",
+                    "responseLatency": "$context.responseLatency",
+                    "integrationLatency": "$context.integrationLatency",
+                }),
+            )
+
         # =================================================================
-        # EventBridge Rules for Scheduled Tasks
+        # EventBridge Scheduler for Scheduled Tasks
         # =================================================================
-        
-        # Reminder check - every 5 minutes
-        reminder_rule = events.Rule(
+        # Schedules use a flexible time window so AWS spreads invocations
+        # instead of firing all jobs on the same minute boundary, which
+        # would otherwise collide with warm-container capacity.
+        schedule_group = scheduler.CfnScheduleGroup(
             self,
-            "ReminderCheckRule",
-            rule_name="vow-reminder-check",
-            description="Trigger reminder check every 5 minutes",
-            schedule=events.Schedule.rate(Duration.minutes(5)),
-        )
-        reminder_rule.add_target(
-            targets.LambdaFunction(
-                self.lambda_function,
-                event=events.RuleTargetInput.from_object({
-                    "source": "aws.scheduler",
-                    "detail-type": "reminder-check",
-                }),
-            )
+            "BackendScheduleGroup",
+            name="vow-backend-schedules",
         )
 
-        # Follow-up check - every 15 minutes
-        followup_rule = events.Rule(
+        scheduler_role = iam.Role(
             self,
-            "FollowUpCheckRule",
-            rule_name="vow-follow-up-check",
-            description="Trigger follow-up check every 15 minutes",
-            schedule=events.Schedule.rate(Duration.minutes(15)),
-        )
-        followup_rule.add_target(
-            targets.LambdaFunction(
-                self.lambda_function,
-                event=events.RuleTargetInput.from_object({
-                    "source": "aws.scheduler",
-                    "detail-type": "follow-up-check",
-                }),
-            )
+            "BackendSchedulerRole",
+            assumed_by=iam.ServicePrincipal("scheduler.amazonaws.com"),
+            description="Role for EventBridge Scheduler to invoke scheduler Lambda",
         )
+        self.scheduler_function.grant_invoke(scheduler_role)
 
-        # Weekly report - every 15 minutes (checks if it's time to send)
-        weekly_report_rule = events.Rule(
-            self,
-            "WeeklyReportRule",
-            rule_name="vow-weekly-report",
-            description="Trigger weekly report check every 15 minutes",
-            schedule=events.Schedule.rate(Duration.minutes(15)),
-        )
-        weekly_report_rule.add_target(
-            targets.LambdaFunction(
-                self.lambda_function,
-                event=events.RuleTargetInput.from_object({
-                    "source": "aws.scheduler",
-                    "detail-type": "weekly-report",
-                }),
+        # (construct id, schedule name, description, rate minutes, flexible window minutes, detail-type)
+        scheduled_tasks = [
+            (
+                "ReminderCheckSchedule",
+                "vow-reminder-check",
+                "Trigger reminder check every 5 minutes",
+                5,
+                2,
+                "reminder-check",
+            ),
+            (
+                "FollowUpCheckSchedule",
+                "vow-follow-up-check",
+                "Trigger follow-up check every 15 minutes",
+                15,
+                5,
+                "follow-up-check",
+            ),
+            # Weekly report - every 15 minutes (checks if it's time to send)
+            (
+                "WeeklyReportSchedule",
+                "vow-weekly-report",
+                "Trigger weekly report check every 15 minutes",
+                15,
+                5,
+                "weekly-report",
+            ),
+        ]
+
+        for schedule_id, name, description, rate_minutes, window_minutes, detail_type in scheduled_tasks:
+            schedule = scheduler.CfnSchedule(
+                self,
+                schedule_id,
+                name=name,
+                description=description,
+                group_name=schedule_group.name,
+                schedule_expression=f"rate({rate_minutes} minutes)",
+                flexible_time_window=scheduler.CfnSchedule.FlexibleTimeWindowProperty(
+                    mode="FLEXIBLE",
+                    maximum_window_in_minutes=window_minutes,
+                ),
+                target=scheduler.CfnSchedule.TargetProperty(
+                    arn=self.scheduler_function.function_arn,
+                    role_arn=scheduler_role.role_arn,
+                    input=json.dumps({
+                        "source": "aws.scheduler",
+                        "detail-type": detail_type,
+                    }),
+                ),
             )
-        )
+            schedule.add_dependency(schedule_group)
 
         # =================================================================
         # Outputs
@@ -228,6 +344,14 @@ class BackendLambdaStack(Stack):
             export_name="VowBackendLambdaArn",
         )
 
+        CfnOutput(
+            self,
+            "SchedulerFunctionArn",
+            value=self.scheduler_function.function_arn,
+            description="Scheduler Lambda Function ARN",
+            export_name="VowBackendSchedulerLambdaArn",
+        )
+
         CfnOutput(
             self,
             "ApiEndpoint",
@@ -236,6 +360,14 @@ class BackendLambdaStack(Stack):
             export_name="VowBackendApiEndpoint",
         )
 
+        CfnOutput(
+            self,
+            "StreamFunctionUrl",
+            value=stream_function_url.url,
+            description="Lambda Function URL for streaming responses",
+            export_name="VowBackendStreamUrl",
+        )
+
         CfnOutput(
             self,
             "LogGroupName",
@@ -8,6 +8,8 @@ This stack creates:
 - IAM roles and policies
 """
 
+import json
+
 from aws_cdk import (
     Stack,
     Duration,
@@ -40,6 +42,7 @@ class BackendStack(Stack):
         database_endpoint: str,
         database_port: str,
         amplify_app_url: str = "",
+        image_digest: str = "latest",
         **kwargs,
     ) -> None:
         super().__init__(scope, construct_id, **kwargs)
@@ -53,6 +56,11 @@ class BackendStack(Stack):
             repository_name="vow-backend",
             removal_policy=RemovalPolicy.RETAIN,
             lifecycle_rules=[
+                ecr.LifecycleRule(
+                    tag_status=ecr.TagStatus.UNTAGGED,
+                    max_image_age=Duration.days(30),
+                    description="Expire untagged images after 30 days",
+                ),
                 ecr.LifecycleRule(
                     max_image_count=10,
                     description="Keep only 10 images",
@@ -73,6 +81,21 @@ class BackendStack(Stack):
             tier=ssm.ParameterTier.STANDARD,
         )
 
+        # CORS origins are kept in SSM so they can be edited without
+        # rebuilding the image or changing the service definition.
+        cors_origins = ["http://localhost:3000"]
+        if amplify_app_url:
+            cors_origins.append(amplify_app_url)
+
+        cors_origins_param = ssm.StringParameter(
+            self,
+            "CorsOriginsParam",
+            parameter_name="/vow/cors-origins",
+            string_value=json.dumps(cors_origins),
+            description="Allowed CORS origins for backend (JSON array)",
+            tier=ssm.ParameterTier.STANDARD,
+        )
+
         # =================================================================
         # VPC Connector for App Runner
         # =================================================================
@@ -113,13 +136,8 @@ class BackendStack(Stack):
 
         # Grant access to SSM Parameters
         jwt_secret_param.grant_read(instance_role)
+        cors_origins_param.grant_read(instance_role)
 
-        # =================================================================
-        # CORS Origins Configuration
-        # =================================================================
-        cors_origins = ["http://localhost:3000"]
-        if amplify_app_url:
-            cors_origins.append(amplify_app_url)
 
         # =================================================================
         # App Runner Service
@@ -130,16 +148,20 @@ class BackendStack(Stack):
             service_name="vow-backend",
             source=apprunner.Source.from_ecr(
                 repository=self.ecr_repository,
-                tag_or_digest="latest",
+                # Image digest pushed by CI (e.g. "sha256:..."), or "latest"
+                # when explicitly allowed in app.py.
+                tag_or_digest=image_digest,
                 image_configuration=apprunner.ImageConfiguration(
                     port=8000,
                     environment_variables={
                         "DEBUG": "false",
-                        "CORS_ORIGINS": str(cors_origins),
                         "DATABASE_HOST": database_endpoint,
                         "DATABASE_PORT": database_port,
                         "DATABASE_NAME": "vow",
                     },
+                    # Secrets are resolved by App Runner once per instance
+                    # start and exposed as env vars, so the app reads them
+                    # without per-request Secrets Manager/SSM calls.
                     environment_secrets={
                         "DATABASE_SECRET": apprunner.Secret.from_secrets_manager(
                             database_secret,
@@ -147,6 +169,9 @@ class BackendStack(Stack):
                         "JWT_SECRET": apprunner.Secret.from_ssm_parameter(
                             jwt_secret_param,
                         ),
+                        "CORS_ORIGINS": apprunner.Secret.from_ssm_parameter(
+                            cors_origins_param,
+                        ),
                     },
                 ),
             ),
@@ -155,14 +180,17 @@ class BackendStack(Stack):
             cpu=apprunner.Cpu.ONE_VCPU,
             memory=apprunner.Memory.TWO_GB,
             vpc_connector=vpc_connector,
-            health_check=apprunner.HealthCheck.http(
-                path="/health",
-                interval=Duration.seconds(10),
+            # TCP check avoids a full HTTP round trip through FastAPI every
+            # interval; /health stays available for external probes.
+            health_check=apprunner.HealthCheck.tcp(
+                interval=Duration.seconds(20),
                 timeout=Duration.seconds(5),
                 healthy_threshold=1,
                 unhealthy_threshold=3,
             ),
-            auto_deployments_enabled=True,
+            # Deploys are driven by updating image_digest in CDK context
+            # (see .github/workflows/deploy-backend.yml)
+            auto_deployments_enabled=False,
         )
 
         # =================================================================
@@ -2,12 +2,14 @@
 DatabaseStack - RDS PostgreSQL for Vow Backend
 
 This stack creates:
-- VPC with public, private, and isolated subnets
+- VPC with public, private, and isolated subnets (or an existing VPC via lookup)
 - RDS PostgreSQL instance (db.t3.micro for development)
 - Security groups for database access
 - Secrets Manager for database credentials
 """
 
+from typing import Optional
+
 from aws_cdk import (
     Stack,
     Duration,
@@ -28,36 +30,29 @@ class DatabaseStack(Stack):
     PostgreSQL instance for the Vow backend API.
     """
 
-    def __init__(self, scope: Construct, construct_id: str, **kwargs) -> None:
+    def __init__(
+        self,
+        scope: Construct,
+        construct_id: str,
+        stage: str = "dev",
+        vpc_id: Optional[str] = None,
+        **kwargs,
+    ) -> None:
         super().__init__(scope, construct_id, **kwargs)
 
+        # Monitoring agents (Enhanced Monitoring, Performance Insights, log
+        # exports) are only enabled in prod to save CPU credits on t3.micro
+        is_prod = stage == "prod"
+
         # =================================================================
         # VPC Configuration
         # =================================================================
-        self.vpc = ec2.Vpc(
-            self,
-            "BackendVpc",
-            vpc_name="vow-backend-vpc",
-            max_azs=2,
-            nat_gateways=1,  # Single NAT for cost optimization in dev
-            subnet_configuration=[
-                ec2.SubnetConfiguration(
-                    name="Public",
-                    subnet_type=ec2.SubnetType.PUBLIC,
-                    cidr_mask=24,
-                ),
-                ec2.SubnetConfiguration(
-                    name="Private",
-                    subnet_type=ec2.SubnetType.PRIVATE_WITH_EGRESS,
-                    cidr_mask=24,
-                ),
-                ec2.SubnetConfiguration(
-                    name="Isolated",
-                    subnet_type=ec2.SubnetType.PRIVATE_ISOLATED,
-                    cidr_mask=24,
-                ),
-            ],
-        )
+        # Reuse an existing VPC when one is given so stacks share a single
+        # network instead of each provisioning its own.
+        if vpc_id:
+            self.vpc = ec2.Vpc.from_lookup(self, "BackendVpc", vpc_id=vpc_id)
+        else:
+            self.vpc = self._create_vpc()
 
         # =================================================================
         # Security Group for RDS
@@ -94,6 +89,22 @@ class DatabaseStack(Stack):
             ),
         )
 
+        # =================================================================
+        # Parameter Group (tuned for db.t3.micro, 1 GiB RAM)
+        # =================================================================
+        parameter_group = rds.ParameterGroup(
+            self,
+            "DatabaseParameterGroup",
+            engine=rds.DatabaseInstanceEngine.postgres(
+                version=rds.PostgresEngineVersion.VER_15,
+            ),
+            description="PostgreSQL parameters for Vow backend",
+            parameters={
+                "shared_buffers": "16384",  # 128 MB (8 kB pages)
+                "work_mem": "4096",  # 4 MB (kB)
+            },
+        )
+
         # =================================================================
         # RDS PostgreSQL Instance
         # =================================================================
@@ -115,6 +126,11 @@ class DatabaseStack(Stack):
             security_groups=[self.db_security_group],
             credentials=rds.Credentials.from_secret(self.database_secret),
             database_name="vow",
+            parameter_group=parameter_group,
+            auto_minor_version_upgrade=True,
+            monitoring_interval=Duration.seconds(60 if is_prod else 0),
+            enable_performance_insights=is_prod,
+            cloudwatch_logs_exports=["postgresql"] if is_prod else [],
             allocated_storage=20,
             max_allocated_storage=100,
             storage_encrypted=True,
@@ -159,3 +175,36 @@ class DatabaseStack(Stack):
             description="Database Secret ARN",
             export_name="VowDatabaseSecretArn",
         )
+
+    def _create_vpc(self) -> ec2.Vpc:
+        """Create the backend VPC.
+
+        Public subnets hold the NAT gateway, private subnets with egress are
+        used by the App Runner VPC connector, and RDS stays in the isolated
+        subnets it was deployed into. A VPC passed via ``vpc_id`` must provide
+        the same isolated tier.
+        """
+        return ec2.Vpc(
+            self,
+            "BackendVpc",
+            vpc_name="vow-backend-vpc",
+            max_azs=2,
+            nat_gateways=1,  # Single NAT for cost optimization in dev
+            subnet_configuration=[
+                ec2.SubnetConfiguration(
+                    name="Public",
+                    subnet_type=ec2.SubnetType.PUBLIC,
+                    cidr_mask=24,
+                ),
+                ec2.SubnetConfiguration(
+                    name="Private",
+                    subnet_type=ec2.SubnetType.PRIVATE_WITH_EGRESS,
+                    cidr_mask=24,
+                ),
+                ec2.SubnetConfiguration(
+                    name="Isolated",
+                    subnet_type=ec2.SubnetType.PRIVATE_ISOLATED,
+                    cidr_mask=24,
+                ),
+            ],
+        )
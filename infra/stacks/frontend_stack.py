@@ -2,13 +2,18 @@
 Amplify Hosting Stack for VOW Frontend
 
 Next.jsフロントエンドをAWS Amplify Hostingでホスティングするスタック。
+CloudFrontをAmplifyとAPI Gatewayの前段に置き、圧縮とHTTP/3を有効化する。
 """
 
 from aws_cdk import (
     Stack,
     CfnOutput,
+    Duration,
+    Fn,
     RemovalPolicy,
     aws_amplify as amplify,
+    aws_cloudfront as cloudfront,
+    aws_cloudfront_origins as origins,
     aws_iam as iam,
     aws_secretsmanager as secretsmanager,
 )
@@ -142,6 +147,12 @@ class FrontendStack(Stack):
                 ],
             )
         
+        # CloudFront Distribution
+        self.distribution = self._create_distribution(
+            amplify_domain=f"{github_branch}.{self.amplify_app.attr_default_domain}",
+            api_gateway_url=api_gateway_url,
+        )
+        
         # Outputs
         CfnOutput(
             self, "AmplifyAppId",
@@ -155,6 +166,12 @@ class FrontendStack(Stack):
             description="Amplify App URL"
         )
         
+        CfnOutput(
+            self, "CloudFrontUrl",
+            value=f"https://{self.distribution.distribution_domain_name}",
+            description="CloudFront Distribution URL"
+        )
+        
         if custom_domain:
             CfnOutput(
                 self, "CustomDomainUrl",
@@ -162,6 +179,67 @@ class FrontendStack(Stack):
                 description="Custom Domain URL"
             )
     
+    def _create_distribution(
+        self,
+        amplify_domain: str,
+        api_gateway_url: str,
+    ) -> cloudfront.Distribution:
+        """Amplify (デフォルト) と API Gateway (/api/*) を束ねるCloudFront"""
+        
+        # オリジンのCache-Controlに従う（デフォルトはキャッシュしない）。
+        # TTLが0固定だと圧縮が無効になるため max_ttl を設定する。
+        frontend_cache_policy = cloudfront.CachePolicy(
+            self, "FrontendCachePolicy",
+            default_ttl=Duration.seconds(0),
+            min_ttl=Duration.seconds(0),
+            max_ttl=Duration.days(1),
+            query_string_behavior=cloudfront.CacheQueryStringBehavior.all(),
+            enable_accept_encoding_gzip=True,
+            enable_accept_encoding_brotli=True,
+        )
+        
+        # Authorization ヘッダーはキャッシュポリシー経由でのみ転送される
+        api_cache_policy = cloudfront.CachePolicy(
+            self, "ApiCachePolicy",
+            default_ttl=Duration.seconds(0),
+            min_ttl=Duration.seconds(0),
+            max_ttl=Duration.days(1),
+            header_behavior=cloudfront.CacheHeaderBehavior.allow_list("Authorization"),
+            query_string_behavior=cloudfront.CacheQueryStringBehavior.all(),
+            enable_accept_encoding_gzip=True,
+            enable_accept_encoding_brotli=True,
+        )
+        
+        # "https://xxx.execute-api.region.amazonaws.com" -> ドメイン部分
+        api_domain = Fn.select(2, Fn.split("/", api_gateway_url))
+        
+        return cloudfront.Distribution(
+            self, "Distribution",
+            comment="VOW frontend (Amplify) and API",
+            http_version=cloudfront.HttpVersion.HTTP2_AND_3,
+            price_class=cloudfront.PriceClass.PRICE_CLASS_200,
+            default_behavior=cloudfront.BehaviorOptions(
+                origin=origins.HttpOrigin(amplify_domain),
+                viewer_protocol_policy=cloudfront.ViewerProtocolPolicy.REDIRECT_TO_HTTPS,
+                allowed_methods=cloudfront.AllowedMethods.ALLOW_ALL,
+                cache_policy=frontend_cache_policy,
+                origin_request_policy=cloudfront.OriginRequestPolicy.ALL_VIEWER_EXCEPT_HOST_HEADER,
+                response_headers_policy=cloudfront.ResponseHeadersPolicy.SECURITY_HEADERS,
+                compress=True,
+            ),
+            additional_behaviors={
+                "/api/*": cloudfront.BehaviorOptions(
+                    origin=origins.HttpOrigin(api_domain),
+                    viewer_protocol_policy=cloudfront.ViewerProtocolPolicy.REDIRECT_TO_HTTPS,
+                    allowed_methods=cloudfront.AllowedMethods.ALLOW_ALL,
+                    cache_policy=api_cache_policy,
+                    origin_request_policy=cloudfront.OriginRequestPolicy.ALL_VIEWER_EXCEPT_HOST_HEADER,
+                    response_headers_policy=cloudfront.ResponseHeadersPolicy.SECURITY_HEADERS,
+                    compress=True,
+                ),
+            },
+        )
+    
     def _get_build_spec(self) -> str:
         """Amplify Build Spec for Next.js"""
         return """
@@ -15,7 +15,90 @@ from aws_cdk import (
     aws_lambda as lambda_,
 )
 from constructs import Construct
-from typing import Optional, List
+from dataclasses import dataclass
+from functools import partial
+from typing import Callable, Dict, Optional, List, Tuple
+
+
+@dataclass(frozen=True, slots=True)
+class AlarmSpec:
+    """アラーム定義（しきい値超過で通知）"""
+    construct_id: str
+    alarm_name: str
+    description: str
+    metric_name: str
+    statistic: str
+    threshold: float
+    evaluation_periods: int
+
+
+# =============================================================================
+# Alarm Definitions
+# =============================================================================
+
+_LAMBDA_ALARMS: List[AlarmSpec] = [
+    # Error Rate Alarm
+    AlarmSpec(
+        "LambdaErrorAlarm", "vow-lambda-errors",
+        "Lambda function error rate is high",
+        "Errors", "Sum", threshold=5, evaluation_periods=2,
+    ),
+    # Duration Alarm (Cold Start Detection)
+    AlarmSpec(
+        "LambdaDurationAlarm", "vow-lambda-duration",
+        "Lambda p99 duration is high (possible cold starts)",
+        "Duration", "p99", threshold=10000, evaluation_periods=3,  # 10 seconds
+    ),
+    # Throttles Alarm
+    AlarmSpec(
+        "LambdaThrottleAlarm", "vow-lambda-throttles",
+        "Lambda function is being throttled",
+        "Throttles", "Sum", threshold=1, evaluation_periods=1,
+    ),
+]
+
+_API_GATEWAY_ALARMS: List[AlarmSpec] = [
+    # 5XX Error Alarm
+    AlarmSpec(
+        "ApiGateway5xxAlarm", "vow-api-5xx-errors",
+        "API Gateway 5XX error rate is high",
+        "5XXError", "Sum", threshold=10, evaluation_periods=2,
+    ),
+    # 4XX Error Alarm (High Rate)
+    AlarmSpec(
+        "ApiGateway4xxAlarm", "vow-api-4xx-errors",
+        "API Gateway 4XX error rate is unusually high",
+        "4XXError", "Sum", threshold=100, evaluation_periods=3,
+    ),
+    # Latency Alarm
+    AlarmSpec(
+        "ApiGatewayLatencyAlarm", "vow-api-latency",
+        "API Gateway p99 latency is high",
+        "Latency", "p99", threshold=5000, evaluation_periods=3,  # 5 seconds
+    ),
+]
+
+_AURORA_ALARMS: List[AlarmSpec] = [
+    # CPU Utilization Alarm
+    AlarmSpec(
+        "AuroraCpuAlarm", "vow-aurora-cpu",
+        "Aurora CPU utilization is high",
+        "CPUUtilization", "Average", threshold=80, evaluation_periods=3,
+    ),
+    # ACU Utilization Alarm
+    AlarmSpec(
+        "AuroraAcuAlarm", "vow-aurora-acu",
+        "Aurora ACU capacity is high",
+        # 4 ACU (approaching max for cost control)
+        "ServerlessDatabaseCapacity", "Average", threshold=4, evaluation_periods=3,
+    ),
+    # Database Connections Alarm
+    AlarmSpec(
+        "AuroraConnectionsAlarm", "vow-aurora-connections",
+        "Aurora database connections are high",
+        "DatabaseConnections", "Average", threshold=50, evaluation_periods=2,
+    ),
+]
 
 
 class MonitoringStack(Stack):
@@ -41,27 +124,57 @@ class MonitoringStack(Stack):
             display_name="VOW Application Alerts"
         )
         
+        # 全複合アラームで共有する通知アクション
+        self._alarm_action = cw_actions.SnsAction(self.alert_topic)
+        
         # Email Subscription
         if alert_email:
             self.alert_topic.add_subscription(
                 subscriptions.EmailSubscription(alert_email)
             )
         
+        # namespaceごとの監視対象ディメンション
+        self._dimensions: Dict[str, Dict[str, str]] = {
+            "AWS/Lambda": {"FunctionName": lambda_function_name},
+            "AWS/ApiGateway": {"ApiName": api_gateway_name},
+            "AWS/RDS": {"DBClusterIdentifier": aurora_cluster_id},
+        }
+        
+        # 同一定義のメトリクスはアラームとダッシュボードで1つのオブジェクトを共有
+        self._metrics: Dict[Tuple[str, str, str, int], cloudwatch.Metric] = {}
+        
         # Lambda Alarms
-        self._create_lambda_alarms(lambda_function_name)
+        lambda_alarms = self._create_lambda_alarms()
         
         # API Gateway Alarms
-        self._create_api_gateway_alarms(api_gateway_name)
+        api_gateway_alarms = self._create_api_gateway_alarms()
         
         # Aurora Alarms
-        self._create_aurora_alarms(aurora_cluster_id)
+        aurora_alarms = self._create_aurora_alarms()
+        
+        # Composite Alarms
+        # 同じ層のアラームが同時に発火しても通知は層ごとに1件にまとめる
+        self._create_composite_alarm(
+            "LambdaHealthComposite",
+            alarm_name="vow-lambda-health",
+            alarm_description="One or more Lambda alarms are in ALARM state",
+            alarms=lambda_alarms
+        )
+        self._create_composite_alarm(
+            "ApiGatewayHealthComposite",
+            alarm_name="vow-api-health",
+            alarm_description="One or more API Gateway alarms are in ALARM state",
+            alarms=api_gateway_alarms
+        )
+        self._create_composite_alarm(
+            "AuroraHealthComposite",
+            alarm_name="vow-aurora-health",
+            alarm_description="One or more Aurora alarms are in ALARM state",
+            alarms=aurora_alarms
+        )
         
         # Dashboard
-        self._create_dashboard(
-            lambda_function_name,
-            api_gateway_name,
-            aurora_cluster_id
-        )
+        self._create_dashboard()
         
         # Outputs
         CfnOutput(
@@ -76,203 +189,86 @@ class MonitoringStack(Stack):
             description="CloudWatch Dashboard URL"
         )
     
-    def _create_lambda_alarms(self, function_name: str) -> None:
+    def _create_lambda_alarms(self) -> List[cloudwatch.Alarm]:
         """Lambda関数のアラームを作成"""
-        
-        # Error Rate Alarm
-        error_metric = cloudwatch.Metric(
-            namespace="AWS/Lambda",
-            metric_name="Errors",
-            dimensions_map={"FunctionName": function_name},
-            statistic="Sum",
-            period=Duration.minutes(5)
-        )
-        
-        cloudwatch.Alarm(
-            self, "LambdaErrorAlarm",
-            alarm_name="vow-lambda-errors",
-            alarm_description="Lambda function error rate is high",
-            metric=error_metric,
-            threshold=5,
-            evaluation_periods=2,
-            comparison_operator=cloudwatch.ComparisonOperator.GREATER_THAN_THRESHOLD,
-            treat_missing_data=cloudwatch.TreatMissingData.NOT_BREACHING,
-        ).add_alarm_action(cw_actions.SnsAction(self.alert_topic))
-        
-        # Duration Alarm (Cold Start Detection)
-        duration_metric = cloudwatch.Metric(
-            namespace="AWS/Lambda",
-            metric_name="Duration",
-            dimensions_map={"FunctionName": function_name},
-            statistic="p99",
-            period=Duration.minutes(5)
-        )
-        
-        cloudwatch.Alarm(
-            self, "LambdaDurationAlarm",
-            alarm_name="vow-lambda-duration",
-            alarm_description="Lambda p99 duration is high (possible cold starts)",
-            metric=duration_metric,
-            threshold=10000,  # 10 seconds
-            evaluation_periods=3,
-            comparison_operator=cloudwatch.ComparisonOperator.GREATER_THAN_THRESHOLD,
-            treat_missing_data=cloudwatch.TreatMissingData.NOT_BREACHING,
-        ).add_alarm_action(cw_actions.SnsAction(self.alert_topic))
-        
-        # Throttles Alarm
-        throttle_metric = cloudwatch.Metric(
-            namespace="AWS/Lambda",
-            metric_name="Throttles",
-            dimensions_map={"FunctionName": function_name},
-            statistic="Sum",
-            period=Duration.minutes(5)
-        )
-        
-        cloudwatch.Alarm(
-            self, "LambdaThrottleAlarm",
-            alarm_name="vow-lambda-throttles",
-            alarm_description="Lambda function is being throttled",
-            metric=throttle_metric,
-            threshold=1,
-            evaluation_periods=1,
-            comparison_operator=cloudwatch.ComparisonOperator.GREATER_THAN_THRESHOLD,
-            treat_missing_data=cloudwatch.TreatMissingData.NOT_BREACHING,
-        ).add_alarm_action(cw_actions.SnsAction(self.alert_topic))
+        lambda_metric = partial(self._metric, "AWS/Lambda", period_minutes=5)
+        return self._create_alarms(_LAMBDA_ALARMS, lambda_metric)
     
-    def _create_api_gateway_alarms(self, api_name: str) -> None:
+    def _create_api_gateway_alarms(self) -> List[cloudwatch.Alarm]:
         """API Gatewayのアラームを作成"""
-        
-        # 5XX Error Alarm
-        error_5xx_metric = cloudwatch.Metric(
-            namespace="AWS/ApiGateway",
-            metric_name="5XXError",
-            dimensions_map={"ApiName": api_name},
-            statistic="Sum",
-            period=Duration.minutes(5)
-        )
-        
-        cloudwatch.Alarm(
-            self, "ApiGateway5xxAlarm",
-            alarm_name="vow-api-5xx-errors",
-            alarm_description="API Gateway 5XX error rate is high",
-            metric=error_5xx_metric,
-            threshold=10,
-            evaluation_periods=2,
-            comparison_operator=cloudwatch.ComparisonOperator.GREATER_THAN_THRESHOLD,
-            treat_missing_data=cloudwatch.TreatMissingData.NOT_BREACHING,
-        ).add_alarm_action(cw_actions.SnsAction(self.alert_topic))
-        
-        # 4XX Error Alarm (High Rate)
-        error_4xx_metric = cloudwatch.Metric(
-            namespace="AWS/ApiGateway",
-            metric_name="4XXError",
-            dimensions_map={"ApiName": api_name},
-            statistic="Sum",
-            period=Duration.minutes(5)
-        )
-        
-        cloudwatch.Alarm(
-            self, "ApiGateway4xxAlarm",
-            alarm_name="vow-api-4xx-errors",
-            alarm_description="API Gateway 4XX error rate is unusually high",
-            metric=error_4xx_metric,
-            threshold=100,
-            evaluation_periods=3,
-            comparison_operator=cloudwatch.ComparisonOperator.GREATER_THAN_THRESHOLD,
-            treat_missing_data=cloudwatch.TreatMissingData.NOT_BREACHING,
-        ).add_alarm_action(cw_actions.SnsAction(self.alert_topic))
-        
-        # Latency Alarm
-        latency_metric = cloudwatch.Metric(
-            namespace="AWS/ApiGateway",
-            metric_name="Latency",
-            dimensions_map={"ApiName": api_name},
-            statistic="p99",
-            period=Duration.minutes(5)
-        )
-        
-        cloudwatch.Alarm(
-            self, "ApiGatewayLatencyAlarm",
-            alarm_name="vow-api-latency",
-            alarm_description="API Gateway p99 latency is high",
-            metric=latency_metric,
-            threshold=5000,  # 5 seconds
-            evaluation_periods=3,
-            comparison_operator=cloudwatch.ComparisonOperator.GREATER_THAN_THRESHOLD,
-            treat_missing_data=cloudwatch.TreatMissingData.NOT_BREACHING,
-        ).add_alarm_action(cw_actions.SnsAction(self.alert_topic))
+        api_metric = partial(self._metric, "AWS/ApiGateway", period_minutes=5)
+        return self._create_alarms(_API_GATEWAY_ALARMS, api_metric)
     
-    def _create_aurora_alarms(self, cluster_id: str) -> None:
+    def _create_aurora_alarms(self) -> List[cloudwatch.Alarm]:
         """Aurora Serverless v2のアラームを作成"""
-        
-        # CPU Utilization Alarm
-        cpu_metric = cloudwatch.Metric(
-            namespace="AWS/RDS",
-            metric_name="CPUUtilization",
-            dimensions_map={"DBClusterIdentifier": cluster_id},
-            statistic="Average",
-            period=Duration.minutes(5)
-        )
-        
-        cloudwatch.Alarm(
-            self, "AuroraCpuAlarm",
-            alarm_name="vow-aurora-cpu",
-            alarm_description="Aurora CPU utilization is high",
-            metric=cpu_metric,
-            threshold=80,
-            evaluation_periods=3,
-            comparison_operator=cloudwatch.ComparisonOperator.GREATER_THAN_THRESHOLD,
-            treat_missing_data=cloudwatch.TreatMissingData.NOT_BREACHING,
-        ).add_alarm_action(cw_actions.SnsAction(self.alert_topic))
-        
-        # ACU Utilization Alarm
-        acu_metric = cloudwatch.Metric(
-            namespace="AWS/RDS",
-            metric_name="ServerlessDatabaseCapacity",
-            dimensions_map={"DBClusterIdentifier": cluster_id},
-            statistic="Average",
-            period=Duration.minutes(5)
-        )
-        
-        cloudwatch.Alarm(
-            self, "AuroraAcuAlarm",
-            alarm_name="vow-aurora-acu",
-            alarm_description="Aurora ACU capacity is high",
-            metric=acu_metric,
-            threshold=4,  # 4 ACU (approaching max for cost control)
-            evaluation_periods=3,
-            comparison_operator=cloudwatch.ComparisonOperator.GREATER_THAN_THRESHOLD,
-            treat_missing_data=cloudwatch.TreatMissingData.NOT_BREACHING,
-        ).add_alarm_action(cw_actions.SnsAction(self.alert_topic))
-        
-        # Database Connections Alarm
-        connections_metric = cloudwatch.Metric(
-            namespace="AWS/RDS",
-            metric_name="DatabaseConnections",
-            dimensions_map={"DBClusterIdentifier": cluster_id},
-            statistic="Average",
-            period=Duration.minutes(5)
-        )
-        
-        cloudwatch.Alarm(
-            self, "AuroraConnectionsAlarm",
-            alarm_name="vow-aurora-connections",
-            alarm_description="Aurora database connections are high",
-            metric=connections_metric,
-            threshold=50,
-            evaluation_periods=2,
-            comparison_operator=cloudwatch.ComparisonOperator.GREATER_THAN_THRESHOLD,
-            treat_missing_data=cloudwatch.TreatMissingData.NOT_BREACHING,
-        ).add_alarm_action(cw_actions.SnsAction(self.alert_topic))
+        aurora_metric = partial(self._metric, "AWS/RDS", period_minutes=5)
+        return self._create_alarms(_AURORA_ALARMS, aurora_metric)
     
-    def _create_dashboard(
+    def _metric(
         self,
-        lambda_function_name: str,
-        api_name: str,
-        cluster_id: str
-    ) -> None:
+        namespace: str,
+        metric_name: str,
+        statistic: str,
+        period_minutes: int
+    ) -> cloudwatch.Metric:
+        """メトリクスを取得（同一定義は作成済みのオブジェクトを返す）"""
+        key = (namespace, metric_name, statistic, period_minutes)
+        if key not in self._metrics:
+            self._metrics[key] = cloudwatch.Metric(
+                namespace=namespace,
+                metric_name=metric_name,
+                dimensions_map=self._dimensions[namespace],
+                statistic=statistic,
+                period=Duration.minutes(period_minutes)
+            )
+        return self._metrics[key]
+    
+    def _create_alarms(
+        self,
+        specs: List[AlarmSpec],
+        metric: Callable[..., cloudwatch.Metric]
+    ) -> List[cloudwatch.Alarm]:
+        """アラーム定義からアラームを作成（通知は複合アラームで行う）"""
+        return [
+            cloudwatch.Alarm(
+                self, spec.construct_id,
+                alarm_name=spec.alarm_name,
+                alarm_description=spec.description,
+                metric=metric(metric_name=spec.metric_name, statistic=spec.statistic),
+                threshold=spec.threshold,
+                evaluation_periods=spec.evaluation_periods,
+                comparison_operator=cloudwatch.ComparisonOperator.GREATER_THAN_THRESHOLD,
+                treat_missing_data=cloudwatch.TreatMissingData.NOT_BREACHING,
+            )
+            for spec in specs
+        ]
+    
+    def _create_composite_alarm(
+        self,
+        construct_id: str,
+        *,
+        alarm_name: str,
+        alarm_description: str,
+        alarms: List[cloudwatch.Alarm]
+    ) -> cloudwatch.CompositeAlarm:
+        """いずれかのアラームが発火したら通知する複合アラームを作成"""
+        composite = cloudwatch.CompositeAlarm(
+            self, construct_id,
+            composite_alarm_name=alarm_name,
+            alarm_description=alarm_description,
+            alarm_rule=cloudwatch.AlarmRule.any_of(*alarms),
+        )
+        composite.add_alarm_action(self._alarm_action)
+        return composite
+    
+    def _create_dashboard(self) -> None:
         """CloudWatch Dashboardを作成"""
         
+        # ダッシュボードは1分粒度のメトリクスで統一
+        lambda_metric = partial(self._metric, "AWS/Lambda", period_minutes=1)
+        api_metric = partial(self._metric, "AWS/ApiGateway", period_minutes=1)
+        aurora_metric = partial(self._metric, "AWS/RDS", period_minutes=1)
+        
         dashboard = cloudwatch.Dashboard(
             self, "VowDashboard",
             dashboard_name="VOW-Dashboard"
@@ -291,53 +287,23 @@ class MonitoringStack(Stack):
             cloudwatch.GraphWidget(
                 title="Lambda Invocations",
                 left=[
-                    cloudwatch.Metric(
-                        namespace="AWS/Lambda",
-                        metric_name="Invocations",
-                        dimensions_map={"FunctionName": lambda_function_name},
-                        statistic="Sum",
-                        period=Duration.minutes(1)
-                    )
+                    lambda_metric(metric_name="Invocations", statistic="Sum")
                 ],
                 width=8
             ),
             cloudwatch.GraphWidget(
                 title="Lambda Duration",
                 left=[
-                    cloudwatch.Metric(
-                        namespace="AWS/Lambda",
-                        metric_name="Duration",
-                        dimensions_map={"FunctionName": lambda_function_name},
-                        statistic="Average",
-                        period=Duration.minutes(1)
-                    ),
-                    cloudwatch.Metric(
-                        namespace="AWS/Lambda",
-                        metric_name="Duration",
-                        dimensions_map={"FunctionName": lambda_function_name},
-                        statistic="p99",
-                        period=Duration.minutes(1)
-                    )
+                    lambda_metric(metric_name="Duration", statistic="Average"),
+                    lambda_metric(metric_name="Duration", statistic="p99")
                 ],
                 width=8
             ),
             cloudwatch.GraphWidget(
                 title="Lambda Errors & Throttles",
                 left=[
-                    cloudwatch.Metric(
-                        namespace="AWS/Lambda",
-                        metric_name="Errors",
-                        dimensions_map={"FunctionName": lambda_function_name},
-                        statistic="Sum",
-                        period=Duration.minutes(1)
-                    ),
-                    cloudwatch.Metric(
-                        namespace="AWS/Lambda",
-                        metric_name="Throttles",
-                        dimensions_map={"FunctionName": lambda_function_name},
-                        statistic="Sum",
-                        period=Duration.minutes(1)
-                    )
+                    lambda_metric(metric_name="Errors", statistic="Sum"),
+                    lambda_metric(metric_name="Throttles", statistic="Sum")
                 ],
                 width=8
             )
@@ -356,53 +322,23 @@ class MonitoringStack(Stack):
             cloudwatch.GraphWidget(
                 title="API Requests",
                 left=[
-                    cloudwatch.Metric(
-                        namespace="AWS/ApiGateway",
-                        metric_name="Count",
-                        dimensions_map={"ApiName": api_name},
-                        statistic="Sum",
-                        period=Duration.minutes(1)
-                    )
+                    api_metric(metric_name="Count", statistic="Sum")
                 ],
                 width=8
             ),
             cloudwatch.GraphWidget(
                 title="API Latency",
                 left=[
-                    cloudwatch.Metric(
-                        namespace="AWS/ApiGateway",
-                        metric_name="Latency",
-                        dimensions_map={"ApiName": api_name},
-                        statistic="Average",
-                        period=Duration.minutes(1)
-                    ),
-                    cloudwatch.Metric(
-                        namespace="AWS/ApiGateway",
-                        metric_name="Latency",
-                        dimensions_map={"ApiName": api_name},
-                        statistic="p99",
-                        period=Duration.minutes(1)
-                    )
+                    api_metric(metric_name="Latency", statistic="Average"),
+                    api_metric(metric_name="Latency", statistic="p99")
                 ],
                 width=8
             ),
             cloudwatch.GraphWidget(
                 title="API Errors",
                 left=[
-                    cloudwatch.Metric(
-                        namespace="AWS/ApiGateway",
-                        metric_name="4XXError",
-                        dimensions_map={"ApiName": api_name},
-                        statistic="Sum",
-                        period=Duration.minutes(1)
-                    ),
-                    cloudwatch.Metric(
-                        namespace="AWS/ApiGateway",
-                        metric_name="5XXError",
-                        dimensions_map={"ApiName": api_name},
-                        statistic="Sum",
-                        period=Duration.minutes(1)
-                    )
+                    api_metric(metric_name="4XXError", statistic="Sum"),
+                    api_metric(metric_name="5XXError", statistic="Sum")
                 ],
                 width=8
             )
@@ -421,48 +357,24 @@ class MonitoringStack(Stack):
             cloudwatch.GraphWidget(
                 title="Aurora ACU Capacity",
                 left=[
-                    cloudwatch.Metric(
-                        namespace="AWS/RDS",
-                        metric_name="ServerlessDatabaseCapacity",
-                        dimensions_map={"DBClusterIdentifier": cluster_id},
-                        statistic="Average",
-                        period=Duration.minutes(1)
-                    )
+                    aurora_metric(metric_name="ServerlessDatabaseCapacity", statistic="Average")
                 ],
                 width=8
             ),
             cloudwatch.GraphWidget(
                 title="Aurora CPU & Memory",
                 left=[
-                    cloudwatch.Metric(
-                        namespace="AWS/RDS",
-                        metric_name="CPUUtilization",
-                        dimensions_map={"DBClusterIdentifier": cluster_id},
-                        statistic="Average",
-                        period=Duration.minutes(1)
-                    )
+                    aurora_metric(metric_name="CPUUtilization", statistic="Average")
                 ],
                 right=[
-                    cloudwatch.Metric(
-                        namespace="AWS/RDS",
-                        metric_name="FreeableMemory",
-                        dimensions_map={"DBClusterIdentifier": cluster_id},
-                        statistic="Average",
-                        period=Duration.minutes(1)
-                    )
+                    aurora_metric(metric_name="FreeableMemory", statistic="Average")
                 ],
                 width=8
             ),
             cloudwatch.GraphWidget(
                 title="Aurora Connections",
                 left=[
-                    cloudwatch.Metric(
-                        namespace="AWS/RDS",
-                        metric_name="DatabaseConnections",
-                        dimensions_map={"DBClusterIdentifier": cluster_id},
-                        statistic="Average",
-                        period=Duration.minutes(1)
-                    )
+                    aurora_metric(metric_name="DatabaseConnections", statistic="Average")
                 ],
                 width=8
             )
@@ -4,39 +4,72 @@ Supabaseからデータをエクスポートするスクリプト
 
 Usage:
     python export_supabase.py --output ./export_data
+    python export_supabase.py --output ./export_data --copy
+    python export_supabase.py --output ./export_data --format parquet
 
 Environment Variables:
     SUPABASE_CONNECTION_STRING: Supabase PostgreSQL connection string
 """
 
 import asyncio
-import json
+import gzip
 import hashlib
 import os
 import sys
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict
-from datetime import datetime, date
+from typing import Dict, List, Any, Optional, Set, Tuple
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from decimal import Decimal
-from uuid import UUID
 
 try:
     import asyncpg
+    import orjson
 except ImportError:
     print("Required packages not installed. Run:")
-    print("  pip install asyncpg")
+    print("  pip install asyncpg orjson")
     sys.exit(1)
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+try:
+    from blake3 import blake3
+    HAS_BLAKE3 = True
+except ImportError:
+    HAS_BLAKE3 = False
+
+# チェックサムのハッシュアルゴリズム（blake3があれば高速なblake3を使う）
+HASH_ALG = "blake3" if HAS_BLAKE3 else "sha256"
+_new_hash = blake3 if HAS_BLAKE3 else hashlib.sha256
+
+
+@dataclass
+class ExportPart:
+    """分割エクスポートの1ファイル分の結果"""
+    file_name: str
+    row_count: int
+    checksum: str
+
 
 @dataclass
 class ExportResult:
     """エクスポート結果"""
     table_name: str
+    file_name: str
     row_count: int
     checksum: str
     exported_at: str
+    # カラム名 → PostgreSQL型名（Parquet出力時のみ）
+    column_types: Optional[Dict[str, str]] = None
+    # 分割ファイル（JSONL出力時のみ、順序どおり）
+    parts: Optional[List[ExportPart]] = None
 
 
 @dataclass
@@ -46,23 +79,71 @@ class ExportMetadata:
     source: str
     tables: List[ExportResult]
     total_rows: int
+    # チェックサムのハッシュアルゴリズム（"blake3" または "sha256"）
+    hash_alg: str = HASH_ALG
 
 
-class JSONEncoder(json.JSONEncoder):
-    """カスタムJSONエンコーダー"""
-    
-    def default(self, obj):
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        if isinstance(obj, date):
-            return obj.isoformat()
-        if isinstance(obj, Decimal):
-            return float(obj)
-        if isinstance(obj, UUID):
-            return str(obj)
-        if isinstance(obj, bytes):
-            return obj.decode('utf-8', errors='replace')
-        return super().default(obj)
+def _default(obj):
+    """orjsonが直接扱えない型の変換
+
+    datetime / date / UUID はorjsonがネイティブに処理する。
+    """
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, bytes):
+        return obj.decode('utf-8', errors='replace')
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _serialize_rows(rows: List[Any]) -> bytes:
+    """行（asyncpg.Recordまたは値のタプル）のリストを値配列のJSONLバイト列に変換
+
+    カラム名はヘッダ行に1度だけ書くため、各行は値のみを出力する。
+    """
+    return b"".join(
+        orjson.dumps(tuple(row), default=_default) + b"\n" for row in rows
+    )
+
+
+def _parquet_type(pg_type: str) -> "pa.DataType":
+    """PostgreSQLの型名に対応するArrow型（対応がない型は文字列で保持）
+
+    numericは精度が列ごとに異なるため、uuid / json と同様に文字列とする。
+    配列型（"_text" など先頭が "_" の型名）は要素型のリストとする。
+    """
+    if pg_type.startswith("_"):
+        return pa.list_(_parquet_type(pg_type[1:]))
+    return {
+        "int2": pa.int16(),
+        "int4": pa.int32(),
+        "int8": pa.int64(),
+        "float4": pa.float32(),
+        "float8": pa.float64(),
+        "bool": pa.bool_(),
+        "date": pa.date32(),
+        "timestamp": pa.timestamp("us"),
+        "timestamptz": pa.timestamp("us", tz="UTC"),
+    }.get(pg_type, pa.string())
+
+
+def _parquet_values(values: Any, data_type: "pa.DataType") -> List[Any]:
+    """列の値をArrow型に合わせて変換（文字列型は str()、リスト型は要素ごとに変換）"""
+    if pa.types.is_list(data_type):
+        return [
+            None if v is None else _parquet_values(v, data_type.value_type)
+            for v in values
+        ]
+    if data_type == pa.string():
+        return [None if v is None else str(v) for v in values]
+    return list(values)
+
+
+def _write_parquet_batch(writer, schema: "pa.Schema", rows: List[Any]) -> None:
+    """行（asyncpg.Record）のリストを列ごとの配列に変換してParquetに書き込む"""
+    arrays = []
+    for field, values in zip(schema, zip(*rows)):
+        arrays.append(pa.array(_parquet_values(values, field.type), type=field.type))
+    writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=schema))
 
 
 class SupabaseExporter:
@@ -84,10 +165,39 @@ class SupabaseExporter:
         "slack_follow_up_status",
     ]
     
-    def __init__(self, connection_string: str, output_dir: str):
+    # 並列エクスポートの接続数
+    POOL_SIZE = 4
+    
+    # カーソルの先読み行数
+    CURSOR_PREFETCH = 1000
+    
+    # gzip圧縮レベル（速度優先）
+    GZIP_LEVEL = 1
+    
+    # 分割ファイル1つあたりの最大行数
+    PART_ROWS = 50000
+    
+    # 推定行数がこれ以下のテーブルは1クエリにまとめてエクスポート
+    SMALL_TABLE_ROWS = 1000
+    
+    # JSON出力時はPythonオブジェクトを経由せずテキスト表現のまま受け取る型
+    # （json / jsonb はasyncpgが元々テキストで返す）
+    TEXT_DECODED_TYPES = ("uuid", "numeric", "date", "timestamp", "timestamptz")
+    
+    def __init__(
+        self,
+        connection_string: str,
+        output_dir: str,
+        use_copy: bool = False,
+        output_format: str = "jsonl"
+    ):
         self.connection_string = connection_string
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.use_copy = use_copy
+        self.output_format = output_format
+        # 行のシリアライズをイベントループ外で行うためのスレッドプール
+        self._executor = ThreadPoolExecutor(max_workers=os.cpu_count())
     
     async def export_all(self) -> ExportMetadata:
         """全テーブルをエクスポート"""
@@ -95,61 +205,79 @@ class SupabaseExporter:
         print("Supabase Data Export")
         print("=" * 60)
         print(f"Output directory: {self.output_dir}")
-        print(f"Started at: {datetime.now().isoformat()}")
+        # 1回のエクスポートで共通のタイムスタンプ（UTC）
+        self._export_stamp = datetime.now(tz=timezone.utc).isoformat()
+        print(f"Started at: {self._export_stamp}")
         print()
         
-        conn = await asyncpg.connect(self.connection_string)
-        results: List[ExportResult] = []
-        total_rows = 0
+        # テーブルごとに接続を取得して並列エクスポート
+        pool = await asyncpg.create_pool(
+            self.connection_string,
+            min_size=self.POOL_SIZE,
+            max_size=self.POOL_SIZE,
+            # Parquetは型付きの値が必要なため既定のコーデックのまま
+            init=None if self.output_format == "parquet" else self._use_text_codecs,
+        )
         
         try:
-            for table in self.TABLES:
-                print(f"Exporting {table}...", end=" ")
-                
-                try:
-                    # テーブル存在確認
-                    exists = await self._table_exists(conn, table)
-                    if not exists:
-                        print("⏭️  SKIPPED (table not found)")
-                        continue
-                    
-                    # データエクスポート
-                    data = await self._export_table(conn, table)
-                    checksum = self._calculate_checksum(data)
-                    
-                    # JSONファイルに保存
-                    output_file = self.output_dir / f"{table}.json"
-                    with open(output_file, "w", encoding="utf-8") as f:
-                        json.dump(data, f, cls=JSONEncoder, ensure_ascii=False, indent=2)
-                    
-                    result = ExportResult(
-                        table_name=table,
-                        row_count=len(data),
-                        checksum=checksum,
-                        exported_at=datetime.now().isoformat()
-                    )
-                    results.append(result)
-                    total_rows += len(data)
-                    
-                    print(f"✅ {len(data)} rows (checksum: {checksum[:8]}...)")
-                    
-                except Exception as e:
-                    print(f"❌ ERROR: {e}")
-                    
+            # テーブル存在確認は1クエリでまとめて行う
+            existing = await self._existing_tables(pool)
+            
+            # 小さいテーブルは往復回数を減らすため1クエリでまとめて取得
+            small_tables: Set[str] = set()
+            if self.output_format == "jsonl" and not self.use_copy:
+                small_tables = await self._small_tables(pool, existing)
+            
+            small_outcome, *outcomes = await asyncio.gather(
+                self._export_small_tables(pool, small_tables),
+                *[
+                    self._export_one(pool, table)
+                    for table in self.TABLES
+                    if table in existing and table not in small_tables
+                ],
+                return_exceptions=True,
+            )
         finally:
-            await conn.close()
+            await pool.close()
+            self._executor.shutdown()
+        
+        # 依存関係順に結果を整列（gatherは入力順を保持する）
+        results: List[ExportResult] = []
+        outcome_iter = iter(outcomes)
+        for table in self.TABLES:
+            if table not in existing:
+                print(f"Exporting {table}... ⏭️  SKIPPED (table not found)")
+                continue
+            
+            if table not in small_tables:
+                outcome = next(outcome_iter)
+            elif isinstance(small_outcome, BaseException):
+                outcome = small_outcome
+            else:
+                outcome = small_outcome[table]
+            
+            if isinstance(outcome, BaseException):
+                print(f"Exporting {table}... ❌ ERROR: {outcome}")
+            else:
+                results.append(outcome)
+                print(
+                    f"Exporting {table}... ✅ {outcome.row_count} rows "
+                    f"(checksum: {outcome.checksum[:8]}...)"
+                )
+        total_rows = sum(r.row_count for r in results)
         
         # メタデータ保存
         metadata = ExportMetadata(
-            exported_at=datetime.now().isoformat(),
+            exported_at=self._export_stamp,
             source="supabase",
             tables=results,
             total_rows=total_rows
         )
         
         metadata_file = self.output_dir / "metadata.json"
-        with open(metadata_file, "w", encoding="utf-8") as f:
-            json.dump(asdict(metadata), f, indent=2)
+        with open(metadata_file, "wb") as f:
+            # dataclassはorjsonが直接シリアライズする（asdictによる中間dictを作らない）
+            f.write(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
         
         print()
         print("=" * 60)
@@ -163,26 +291,324 @@ class SupabaseExporter:
         
         return metadata
     
-    async def _table_exists(self, conn, table: str) -> bool:
-        """テーブルの存在確認"""
-        result = await conn.fetchval("""
-            SELECT EXISTS (
-                SELECT FROM information_schema.tables 
-                WHERE table_schema = 'public' 
-                AND table_name = $1
+    async def _export_one(self, pool, table: str) -> ExportResult:
+        """1テーブルをエクスポート"""
+        column_types = None
+        
+        async with pool.acquire() as conn:
+            if self.output_format == "parquet":
+                output_file = self.output_dir / f"{table}.parquet"
+                row_count, checksum, column_types = await self._export_table_parquet(
+                    conn, table, output_file
+                )
+            elif self.use_copy:
+                # COPYでPostgreSQL側からJSONLを直接書き出し
+                output_file = self.output_dir / f"{table}.jsonl.gz"
+                row_count, checksum = await self._export_table_copy(
+                    conn, table, output_file
+                )
+            else:
+                # データエクスポート（PART_ROWS行ごとのJSONLファイルに分割）
+                parts = await self._export_table(conn, table)
+                return self._result_from_parts(table, parts)
+        
+        return ExportResult(
+            table_name=table,
+            file_name=output_file.name,
+            row_count=row_count,
+            checksum=checksum,
+            exported_at=self._export_stamp,
+            column_types=column_types
+        )
+    
+    def _result_from_parts(self, table: str, parts: List[ExportPart]) -> ExportResult:
+        """分割ファイルの結果からテーブルのエクスポート結果を作成"""
+        return ExportResult(
+            table_name=table,
+            file_name=f"{table}.part-*.jsonl.gz",
+            row_count=sum(p.row_count for p in parts),
+            # テーブル全体のチェックサムは各ファイルのチェックサムから計算
+            checksum=_new_hash(
+                "\n".join(p.checksum for p in parts).encode()
+            ).hexdigest(),
+            exported_at=self._export_stamp,
+            parts=parts
+        )
+    
+    async def _small_tables(self, conn, tables: Set[str]) -> Set[str]:
+        """pg_classの推定行数がSMALL_TABLE_ROWS以下のテーブルを取得
+        
+        未ANALYZEのテーブル（reltuples < 0）は大きさが分からないため含めない。
+        """
+        rows = await conn.fetch("""
+            SELECT c.relname, c.reltuples
+            FROM pg_class c
+            JOIN pg_namespace n ON n.oid = c.relnamespace
+            WHERE n.nspname = 'public'
+            AND c.relkind = 'r'
+            AND c.relname = ANY($1::text[])
+        """, list(tables))
+        return {
+            r["relname"] for r in rows
+            if 0 <= r["reltuples"] <= self.SMALL_TABLE_ROWS
+        }
+    
+    async def _export_small_tables(
+        self,
+        pool,
+        tables: Set[str]
+    ) -> Dict[str, ExportResult]:
+        """複数の小さいテーブルを1回のjson_build_objectクエリでエクスポート
+        
+        出力形式・値の表現は通常の分割エクスポートと同じ（1ファイルのpart-0001）。
+        TEXT_DECODED_TYPES と json / jsonb（およびそれらの配列）はサーバー側で
+        テキストにキャストし、numericが浮動小数点数に丸められたり、jsonが
+        解析済みのオブジェクトになったりしないようにする。
+        """
+        if not tables:
+            return {}
+        
+        ordered = [t for t in self.TABLES if t in tables]
+        
+        async with pool.acquire() as conn:
+            async with conn.transaction(isolation="repeatable_read", readonly=True):
+                columns = await self._small_table_columns(conn, ordered)
+                # json_aggはカラム順を保持する（jsonb_aggはキーを並べ替える）
+                sql = "SELECT json_build_object(" + ", ".join(
+                    f"'{t}', (SELECT COALESCE(json_agg("
+                    f"(SELECT r FROM (SELECT {', '.join(columns[t])}) r) ORDER BY x.id"
+                    f"), '[]'::json) FROM {t} x)"
+                    for t in ordered
+                ) + ")"
+                document = orjson.loads(await conn.fetchval(sql))
+        
+        loop = asyncio.get_running_loop()
+        results: Dict[str, ExportResult] = {}
+        for table in ordered:
+            records = document[table]
+            columns = list(records[0].keys()) if records else []
+            output_file = self.output_dir / f"{table}.part-0001.jsonl.gz"
+            part = await loop.run_in_executor(
+                self._executor,
+                self._write_part,
+                output_file,
+                columns,
+                [tuple(r.values()) for r in records],
+            )
+            results[table] = self._result_from_parts(table, [part])
+        
+        return results
+    
+    async def _use_text_codecs(self, conn) -> None:
+        """TEXT_DECODED_TYPESの値をPostgreSQLのテキスト表現のまま受け取る"""
+        for type_name in self.TEXT_DECODED_TYPES:
+            await conn.set_type_codec(
+                type_name,
+                schema="pg_catalog",
+                encoder=str,
+                decoder=str,
+                format="text",
             )
-        """, table)
-        return result
     
-    async def _export_table(self, conn, table: str) -> List[Dict[str, Any]]:
-        """テーブルデータをエクスポート"""
-        rows = await conn.fetch(f"SELECT * FROM {table} ORDER BY id")
-        return [dict(row) for row in rows]
+    async def _existing_tables(self, conn) -> Set[str]:
+        """エクスポート対象のうち存在するテーブル名を取得"""
+        rows = await conn.fetch("""
+            SELECT table_name FROM information_schema.tables 
+            WHERE table_schema = 'public' 
+            AND table_name = ANY($1::text[])
+        """, self.TABLES)
+        return {r["table_name"] for r in rows}
+    
+    async def _small_table_columns(self, conn, tables: List[str]) -> Dict[str, List[str]]:
+        """テーブルごとのjson_agg用の列式（通常のエクスポートと同じ値の表現になるよう変換）"""
+        text_types = set(self.TEXT_DECODED_TYPES) | {"json", "jsonb"}
+        rows = await conn.fetch("""
+            SELECT
+                a.attrelid::regclass::text AS table_name,
+                a.attname,
+                t.typname,
+                e.typname AS elem_typname
+            FROM pg_attribute a
+            JOIN pg_type t ON t.oid = a.atttypid
+            LEFT JOIN pg_type e ON e.oid = t.typelem AND t.typcategory = 'A'
+            WHERE a.attrelid = ANY($1::text[]::regclass[])
+            AND a.attnum > 0
+            AND NOT a.attisdropped
+            ORDER BY a.attrelid, a.attnum
+        """, tables)
+        
+        columns: Dict[str, List[str]] = {t: [] for t in tables}
+        for row in rows:
+            name = row["attname"]
+            if row["typname"] in text_types:
+                expr = f"x.{name}::text AS {name}"
+            elif row["elem_typname"] in text_types:
+                expr = f"x.{name}::text[] AS {name}"
+            else:
+                expr = f"x.{name}"
+            columns[row["table_name"]].append(expr)
+        return columns
+    
+    async def _export_table(self, conn, table: str) -> List[ExportPart]:
+        """テーブルデータをキーセットページングでPART_ROWS行ずつ分割して書き出す
+        
+        各ファイル（{table}.part-0001.jsonl.gz ...）はgzip圧縮したJSONLで、
+        1行目は {"columns": [...]} のヘッダ、以降は1行1レコードの値配列
+        （カラム順）となる。ファイルごとに独立して読めるため、インポート側で
+        並列に処理できる。
+        書き込み（シリアライズ・圧縮）はスレッドプールで行い、その間に
+        次のページを取得する。ページ間で一貫したスナップショットを読むため
+        REPEATABLE READの読み取り専用トランザクション内で実行する。
+        
+        Returns:
+            分割ファイルごとの結果（順序どおり）
+        """
+        loop = asyncio.get_running_loop()
+        parts: List[ExportPart] = []
+        writing = None
+        last_id = None
+        
+        async with conn.transaction(isolation="repeatable_read", readonly=True):
+            while True:
+                if last_id is None:
+                    rows = await conn.fetch(
+                        f"SELECT * FROM {table} ORDER BY id LIMIT $1",
+                        self.PART_ROWS,
+                    )
+                else:
+                    rows = await conn.fetch(
+                        f"SELECT * FROM {table} WHERE id > $1 ORDER BY id LIMIT $2",
+                        last_id,
+                        self.PART_ROWS,
+                    )
+                
+                # 前のページの書き込み完了を待つ（取得と書き込みを重ねる）
+                if writing is not None:
+                    parts.append(await writing)
+                    writing = None
+                
+                # 行数がPART_ROWSの倍数だった場合は最後のページが空になる
+                if not rows and parts:
+                    break
+                
+                output_file = self.output_dir / f"{table}.part-{len(parts) + 1:04d}.jsonl.gz"
+                writing = loop.run_in_executor(
+                    self._executor,
+                    self._write_part,
+                    output_file,
+                    list(rows[0].keys()) if rows else [],
+                    rows,
+                )
+                
+                if len(rows) < self.PART_ROWS:
+                    parts.append(await writing)
+                    break
+                last_id = rows[-1]["id"]
+        
+        return parts
     
-    def _calculate_checksum(self, data: List[Dict[str, Any]]) -> str:
-        """データのチェックサムを計算"""
-        content = json.dumps(data, sort_keys=True, cls=JSONEncoder)
-        return hashlib.sha256(content.encode()).hexdigest()
+    def _write_part(
+        self,
+        output_file: Path,
+        columns: List[str],
+        rows: List[Any]
+    ) -> ExportPart:
+        """1ページ分の行をgzip圧縮したJSONLファイルに書き込む（スレッドプールで実行）"""
+        with self._gzip_writer(output_file) as f:
+            if rows:
+                f.write(orjson.dumps({"columns": columns}) + b"\n")
+                f.write(_serialize_rows(rows))
+        
+        return ExportPart(
+            file_name=output_file.name,
+            row_count=len(rows),
+            checksum=self._file_checksum(output_file),
+        )
+    
+    async def _export_table_copy(
+        self,
+        conn,
+        table: str,
+        output_file: Path
+    ) -> Tuple[int, str]:
+        """COPY TOでテーブルデータをgzip圧縮したJSONL（1行1オブジェクト）として書き出す
+        
+        行のJSON化はPostgreSQLのrow_to_jsonが行うため、Pythonでの
+        Record/dict変換を経由しない。text形式のCOPYはバックスラッシュを
+        エスケープしてしまうため、JSON中に現れない制御文字を区切り・引用符に
+        指定したCSV形式で出力する。
+        
+        Returns:
+            (行数, ファイル内容のチェックサム)
+        """
+        with self._gzip_writer(output_file) as f:
+            status = await conn.copy_from_query(
+                f"SELECT row_to_json(t) FROM {table} t ORDER BY id",
+                output=f,
+                format="csv",
+                delimiter="\x02",
+                quote="\x01",
+            )
+        # statusは "COPY <行数>" 形式
+        row_count = int(status.split()[-1])
+        
+        return row_count, self._file_checksum(output_file)
+    
+    async def _export_table_parquet(
+        self,
+        conn,
+        table: str,
+        output_file: Path
+    ) -> Tuple[int, str, Dict[str, str]]:
+        """テーブルデータをzstd圧縮のParquetとして書き出す
+        
+        スキーマはプリペアドステートメントのカラム型から決め、カーソルで
+        読んだ行をCURSOR_PREFETCH行ごとのRecordBatchとして追記する。
+        
+        Returns:
+            (行数, ファイル内容のチェックサム, カラム名 → PostgreSQL型名)
+        """
+        loop = asyncio.get_running_loop()
+        row_count = 0
+        
+        async with conn.transaction():
+            stmt = await conn.prepare(f"SELECT * FROM {table} ORDER BY id")
+            attributes = stmt.get_attributes()
+            column_types = {a.name: a.type.name for a in attributes}
+            schema = pa.schema(
+                [(a.name, _parquet_type(a.type.name)) for a in attributes]
+            )
+            
+            with pq.ParquetWriter(output_file, schema, compression="zstd") as writer:
+                batch: List[Any] = []
+                async for row in stmt.cursor(prefetch=self.CURSOR_PREFETCH):
+                    batch.append(row)
+                    row_count += 1
+                    if len(batch) >= self.CURSOR_PREFETCH:
+                        await loop.run_in_executor(
+                            self._executor, _write_parquet_batch, writer, schema, batch
+                        )
+                        batch = []
+                if batch:
+                    await loop.run_in_executor(
+                        self._executor, _write_parquet_batch, writer, schema, batch
+                    )
+        
+        return row_count, self._file_checksum(output_file), column_types
+    
+    def _gzip_writer(self, path: Path) -> gzip.GzipFile:
+        """gzip書き込み用のファイル
+        
+        ヘッダに書き込み時刻を埋め込まない（mtime=0）ことで、同じデータからは
+        同じバイト列（同じチェックサム）になるようにする。
+        """
+        return gzip.GzipFile(path, "wb", compresslevel=self.GZIP_LEVEL, mtime=0)
+    
+    @staticmethod
+    def _file_checksum(path: Path) -> str:
+        """書き出し済みファイルのチェックサム（HASH_ALG、再シリアライズせずに計算）"""
+        with open(path, "rb") as f:
+            return hashlib.file_digest(f, _new_hash).hexdigest()
 
 
 async def export_users(connection_string: str, output_dir: Path) -> int:
@@ -218,8 +644,8 @@ async def export_users(connection_string: str, output_dir: Path) -> int:
         
         # JSONファイルに保存
         output_file = output_dir / "auth_users.json"
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(users, f, cls=JSONEncoder, ensure_ascii=False, indent=2)
+        with open(output_file, "wb") as f:
+            f.write(orjson.dumps(users, default=_default, option=orjson.OPT_INDENT_2))
         
         print(f"✅ {len(users)} users")
         return len(users)
@@ -246,8 +672,27 @@ def main():
         action="store_true",
         help="Include auth.users table for Cognito migration"
     )
+    parser.add_argument(
+        "--copy",
+        action="store_true",
+        help="Export tables as JSONL via PostgreSQL COPY"
+    )
+    parser.add_argument(
+        "--format",
+        choices=["jsonl", "parquet"],
+        default="jsonl",
+        help="Output format for table data (default: jsonl)"
+    )
     args = parser.parse_args()
     
+    if args.format == "parquet":
+        if args.copy:
+            parser.error("--copy cannot be combined with --format parquet")
+        if not HAS_PYARROW:
+            print("Parquet export requires pyarrow. Run:")
+            print("  pip install pyarrow")
+            sys.exit(1)
+    
     # 環境変数から接続文字列を取得
     conn_string = os.environ.get("SUPABASE_CONNECTION_STRING")
     
@@ -259,7 +704,12 @@ def main():
     output_dir = Path(args.output)
     
     # データエクスポート
-    exporter = SupabaseExporter(conn_string, str(output_dir))
+    exporter = SupabaseExporter(
+        conn_string,
+        str(output_dir),
+        use_copy=args.copy,
+        output_format=args.format,
+    )
     asyncio.run(exporter.export_all())
     
     # ユーザーエクスポート（オプション）
@@ -11,24 +11,43 @@ Environment Variables:
 """
 
 import asyncio
-import json
+import gzip
 import os
 import sys
 import argparse
+from contextlib import aclosing
+from itertools import chain, islice
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import (
+    Any, AsyncIterable, AsyncIterator, Callable, Dict, Iterable, Iterator, List,
+    Optional, Set,
+)
 from dataclasses import dataclass
-from datetime import datetime
-from uuid import UUID
+from datetime import date, datetime
 
 try:
     import asyncpg
     import boto3
+    import orjson
+    from botocore.config import Config
 except ImportError:
     print("Required packages not installed. Run:")
-    print("  pip install asyncpg boto3")
+    print("  pip install asyncpg boto3 orjson")
     sys.exit(1)
 
+try:
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
 
 @dataclass
 class ImportResult:
@@ -60,8 +79,21 @@ class AuroraImporter:
         "slack_follow_up_status",
     ]
     
-    # バッチサイズ
-    BATCH_SIZE = 100
+    # バッチサイズ（1トランザクション・1回のexecutemanyで送る行数）
+    BATCH_SIZE = 1000
+    
+    # 並列インポートの接続プールサイズ
+    POOL_MIN_SIZE = 5
+    POOL_MAX_SIZE = 10
+    
+    # インポートセッションのwork_mem（ステージングからのINSERT ... SELECT用）
+    SESSION_WORK_MEM = "256MB"
+    
+    # この行数以上のテーブルはCOPYでステージングテーブルに投入してからUPSERT
+    COPY_THRESHOLD = 1024
+    
+    # 書き込みと並行して先読みしておくバッチ数
+    PREFETCH_BATCHES = 4
     
     def __init__(
         self,
@@ -72,6 +104,12 @@ class AuroraImporter:
         self.secret_arn = secret_arn
         self.input_dir = Path(input_dir)
         self.region = region
+        # AWSクライアントは1つのセッション・設定を共有し、リトライ方針を揃える
+        self._session = boto3.Session(region_name=region)
+        self._config = Config(
+            retries={"mode": "adaptive", "total_max_attempts": 5},
+            max_pool_connections=self.POOL_MAX_SIZE,
+        )
         self._conn_string: Optional[str] = None
     
     def _get_connection_string(self) -> str:
@@ -79,9 +117,9 @@ class AuroraImporter:
         if self._conn_string:
             return self._conn_string
         
-        client = boto3.client("secretsmanager", region_name=self.region)
+        client = self._session.client("secretsmanager", config=self._config)
         response = client.get_secret_value(SecretId=self.secret_arn)
-        secret = json.loads(response["SecretString"])
+        secret = orjson.loads(response["SecretString"])
         
         self._conn_string = (
             f"postgresql://{secret['username']}:{secret['password']}"
@@ -105,30 +143,62 @@ class AuroraImporter:
             print("Error: metadata.json not found in input directory")
             sys.exit(1)
         
-        with open(metadata_file) as f:
-            metadata = json.load(f)
+        with open(metadata_file, "rb") as f:
+            metadata = orjson.loads(f.read())
         
         print(f"Source export: {metadata.get('exported_at', 'unknown')}")
         print(f"Total rows in export: {metadata.get('total_rows', 'unknown')}")
         print()
         
-        conn = await asyncpg.connect(self._get_connection_string())
         results: List[ImportResult] = []
         total_imported = 0
         total_errors = 0
         
+        # エクスポート時のファイル名またはパターン（メタデータに記録されている場合）
+        file_names = {
+            t["table_name"]: t["file_name"]
+            for t in metadata.get("tables", [])
+            if t.get("file_name")
+        }
+        
+        pool = await asyncpg.create_pool(
+            self._get_connection_string(),
+            min_size=self.POOL_MIN_SIZE,
+            max_size=self.POOL_MAX_SIZE,
+            # 一括投入向けのセッション設定（エクスポートから再実行できるため、
+            # コミット時のWAL書き込み待ちを省略する）。プールへの返却時のRESET ALLで
+            # 消えないよう、SETではなく接続パラメータとして指定する
+            server_settings={
+                "synchronous_commit": "off",
+                "work_mem": self.SESSION_WORK_MEM,
+            },
+            init=self._configure_session,
+        )
+        
         try:
-            for table in self.TABLES:
-                input_file = self.input_dir / f"{table}.json"
-                
-                if not input_file.exists():
-                    print(f"Importing {table}... ⏭️  SKIPPED (file not found)")
-                    continue
-                
-                print(f"Importing {table}...", end=" ")
+            # 外部キーの依存関係ごとのフェーズに分け、同じフェーズのテーブルは並列にインポート
+            async with pool.acquire() as conn:
+                phases = await self._import_phases(conn)
+            
+            for phase in phases:
+                input_files = {
+                    table: self._find_input_files(table, file_names.get(table))
+                    for table in phase
+                }
+                targets = [table for table in phase if input_files[table]]
+                phase_results = await asyncio.gather(*[
+                    self._import_one(pool, table, input_files[table], dry_run)
+                    for table in targets
+                ])
+                outcomes = dict(zip(targets, phase_results))
                 
-                try:
-                    result = await self._import_table(conn, table, input_file, dry_run)
+                # 依存関係順（TABLESの順序）に結果を表示
+                for table in phase:
+                    if table not in outcomes:
+                        print(f"Importing {table}... ⏭️  SKIPPED (file not found)")
+                        continue
+                    
+                    result = outcomes[table]
                     results.append(result)
                     
                     if result.success:
@@ -136,25 +206,13 @@ class AuroraImporter:
                         status = "✅"
                         if dry_run:
                             status = "🔍"
-                        print(f"{status} {result.imported_count} rows imported, {result.skipped_count} skipped")
+                        print(f"Importing {table}... {status} {result.imported_count} rows imported, {result.skipped_count} skipped")
                     else:
                         total_errors += result.error_count
-                        print(f"❌ ERROR: {result.error_message}")
-                        
-                except Exception as e:
-                    total_errors += 1
-                    results.append(ImportResult(
-                        table_name=table,
-                        imported_count=0,
-                        skipped_count=0,
-                        error_count=1,
-                        success=False,
-                        error_message=str(e)
-                    ))
-                    print(f"❌ ERROR: {e}")
+                        print(f"Importing {table}... ❌ ERROR: {result.error_message or f'{result.error_count} rows failed'}")
                     
         finally:
-            await conn.close()
+            await pool.close()
         
         print()
         print("=" * 60)
@@ -177,18 +235,177 @@ class AuroraImporter:
         
         return results
     
+    def _find_input_files(
+        self,
+        table: str,
+        file_name: Optional[str] = None
+    ) -> List[Path]:
+        """テーブルのエクスポートファイルを探す（メタデータ記載のファイル優先）
+        
+        分割エクスポート（{table}.part-0001.jsonl.gz ...）は全ファイルを順序どおり返す。
+        """
+        candidates = [file_name] if file_name else []
+        candidates.append(f"{table}.part-*.jsonl.gz")
+        candidates += [
+            f"{table}{suffix}"
+            for suffix in (".parquet", ".jsonl.gz", ".json.gz", ".jsonl", ".json")
+        ]
+        for pattern in candidates:
+            input_files = sorted(self.input_dir.glob(pattern))
+            if input_files:
+                return input_files
+        return []
+    
+    def _iter_rows(self, input_files: List[Path]) -> Iterator[Dict[str, Any]]:
+        """エクスポートファイルから行データを1行ずつ読み込む（gzipは透過的に展開）
+        
+        ファイル全体をメモリに展開しないよう、JSONL・Parquetは行（バッチ）単位で
+        読み込む。JSON配列はijsonがあればストリーミングで解析する。
+        """
+        for input_file in input_files:
+            if input_file.suffix == ".parquet":
+                if not HAS_PYARROW:
+                    raise RuntimeError("pyarrow is required to read Parquet exports (pip install pyarrow)")
+                for record_batch in pq.ParquetFile(input_file).iter_batches(batch_size=self.BATCH_SIZE):
+                    yield from record_batch.to_pylist()
+                continue
+            
+            opener = gzip.open if input_file.suffix == ".gz" else open
+            with opener(input_file, "rb") as f:
+                if ".jsonl" not in input_file.suffixes:
+                    if HAS_IJSON:
+                        yield from ijson.items(f, "item", use_float=True)
+                    else:
+                        yield from orjson.loads(f.read())
+                    continue
+                
+                lines = (orjson.loads(line) for line in f if line.strip())
+                first = next(lines, None)
+                if first is None:
+                    continue
+                
+                # 列指向形式: ヘッダ行のカラム名と各行の値配列を組み合わせる
+                if isinstance(first, dict) and first.keys() == {"columns"}:
+                    columns = first["columns"]
+                    yield from (dict(zip(columns, values)) for values in lines)
+                    continue
+                
+                # 1行1オブジェクト形式（COPYエクスポート）
+                yield first
+                yield from lines
+    
+    async def _configure_session(self, conn) -> None:
+        """接続ごとの型コーデックの設定（クライアント側のため返却時のリセット後も残る）"""
+        # json / jsonbはorjsonで直接エンコードし、Python側での文字列化を省く
+        # （バイナリ形式: jsonbは先頭にバージョン番号1を付ける）
+        await conn.set_type_codec(
+            "json",
+            schema="pg_catalog",
+            encoder=self._json_bytes,
+            decoder=orjson.loads,
+            format="binary",
+        )
+        await conn.set_type_codec(
+            "jsonb",
+            schema="pg_catalog",
+            encoder=lambda value: b"\x01" + self._json_bytes(value),
+            decoder=lambda data: orjson.loads(data[1:]),
+            format="binary",
+        )
+    
+    @staticmethod
+    def _json_bytes(value: Any) -> bytes:
+        """JSONカラムの値をJSONテキストのバイト列に変換
+        
+        エクスポートでJSONテキストのまま出力された値（文字列）はそのまま送る。
+        """
+        if isinstance(value, str):
+            return value.encode()
+        return orjson.dumps(value, default=str)
+    
+    @staticmethod
+    def _parse_json_columns(row: Dict[str, Any], json_columns: List[str]) -> Dict[str, Any]:
+        """JSONテキスト（文字列）のjson / jsonbカラムを解析済みの値に変換
+        
+        JSONとして解析できない文字列は、解析済みの文字列スカラーとみなしてそのまま残す。
+        """
+        for col in json_columns:
+            value = row.get(col)
+            if isinstance(value, str):
+                try:
+                    row[col] = orjson.loads(value)
+                except orjson.JSONDecodeError:
+                    pass
+        return row
+    
+    async def _import_phases(self, conn) -> List[List[str]]:
+        """外部キー制約からテーブルを依存関係順のフェーズに分ける
+        
+        各フェーズのテーブルは、それ以前のフェーズのテーブルにのみ依存する。
+        自己参照は無視し、循環がある場合は残りをTABLES順に1つずつ処理する。
+        """
+        rows = await conn.fetch("""
+            SELECT
+                c.conrelid::regclass::text AS child,
+                c.confrelid::regclass::text AS parent
+            FROM pg_constraint c
+            WHERE c.contype = 'f'
+            AND c.conrelid::regclass::text = ANY($1::text[])
+            AND c.confrelid::regclass::text = ANY($1::text[])
+        """, self.TABLES)
+        
+        depends_on: Dict[str, Set[str]] = {table: set() for table in self.TABLES}
+        for r in rows:
+            if r["child"] != r["parent"]:
+                depends_on[r["child"]].add(r["parent"])
+        
+        phases: List[List[str]] = []
+        done: Set[str] = set()
+        while len(done) < len(self.TABLES):
+            remaining = [t for t in self.TABLES if t not in done]
+            phase = [t for t in remaining if depends_on[t] <= done] or remaining[:1]
+            phases.append(phase)
+            done.update(phase)
+        return phases
+    
+    async def _import_one(
+        self,
+        pool,
+        table: str,
+        input_files: List[Path],
+        dry_run: bool
+    ) -> ImportResult:
+        """プールから接続を取得して1テーブルをインポート（例外は結果として返す）"""
+        try:
+            async with pool.acquire() as conn:
+                return await self._import_table(conn, table, input_files, dry_run)
+        except Exception as e:
+            return ImportResult(
+                table_name=table,
+                imported_count=0,
+                skipped_count=0,
+                error_count=1,
+                success=False,
+                error_message=str(e)
+            )
+    
     async def _import_table(
         self,
         conn,
         table: str,
-        input_file: Path,
+        input_files: List[Path],
         dry_run: bool
     ) -> ImportResult:
-        """テーブルデータをインポート"""
-        with open(input_file, encoding="utf-8") as f:
-            data = json.load(f)
+        """テーブルデータをインポート
+        
+        行はファイルからストリーミングで読み込み、BATCH_SIZE行ずつ投入する。
+        """
+        rows = self._iter_rows(input_files)
         
-        if not data:
+        # 先頭のCOPY_THRESHOLD行だけ先読みしてテーブルの大きさを判定
+        head = list(islice(rows, self.COPY_THRESHOLD))
+        
+        if not head:
             return ImportResult(
                 table_name=table,
                 imported_count=0,
@@ -198,47 +415,127 @@ class AuroraImporter:
             )
         
         # カラム情報を取得
-        columns = list(data[0].keys())
+        columns = list(head[0].keys())
+        rows = chain(head, rows)
+        
+        # UPSERT（ON CONFLICT DO UPDATE）の更新句
+        update_set = ", ".join([
+            f"{col} = EXCLUDED.{col}" 
+            for col in columns 
+            if col != "id"
+        ])
         
         imported_count = 0
         skipped_count = 0
         error_count = 0
         
-        # バッチ処理
-        for i in range(0, len(data), self.BATCH_SIZE):
-            batch = data[i:i + self.BATCH_SIZE]
+        if not dry_run:
+            column_types = await self._column_types(conn, table)
+        
+        # 大きいテーブルはCOPY + 1回のINSERT ... SELECTでまとめて取り込む
+        if not dry_run and len(head) >= self.COPY_THRESHOLD:
+            # 変換方法はカラムの型で決まるため、行ごとに判定せず事前に用意する
+            # （変換不要なカラムは値をそのまま使い、関数呼び出しも省く）
+            converters = [
+                (i, convert)
+                for i, col in enumerate(columns)
+                if (convert := self._converter(column_types[col])) is not None
+            ]
+            copied = 0
+            
+            # 行（dict）から値をカラム順のタプルで一度に取り出す
+            # （全行が同じカラムを持つエクスポート形式が前提）
+            getter = itemgetter(*columns)
+            if len(columns) == 1:
+                getter = lambda row, col=columns[0]: (row[col],)
+            
+            def to_record(row: Dict[str, Any]) -> tuple:
+                values = getter(row)
+                if not converters:
+                    return values
+                values = list(values)
+                for i, convert in converters:
+                    if values[i] is not None:
+                        values[i] = convert(values[i])
+                return tuple(values)
+            
+            try:
+                # 読み込み・変換は別スレッドで先行させ、COPYの送信と重ねる
+                async with aclosing(
+                    self._prefetch(self._batched(map(to_record, rows)))
+                ) as batches:
+                    async def records():
+                        nonlocal copied
+                        async for batch in batches:
+                            copied += len(batch)
+                            for record in batch:
+                                yield record
+                    
+                    await self._copy_upsert(conn, table, columns, records(), update_set)
+                return ImportResult(
+                    table_name=table,
+                    imported_count=copied,
+                    skipped_count=0,
+                    error_count=0,
+                    success=True
+                )
+            except Exception as e:
+                print(f"\n  Warning: COPY import failed, falling back to batched upsert: {e}")
+                # ストリームは途中まで消費されているため先頭から読み直す
+                rows = self._iter_rows(input_files)
+        
+        if not dry_run:
+            # バッチ全体を1つのJSONパラメータで送り、サーバー側で行に展開する
+            # （型変換もサーバー側で行う）
+            column_names = ", ".join(columns)
+            col_defs = ", ".join(f"{col} {column_types[col]}" for col in columns)
+            query = f"""
+                INSERT INTO {table} ({column_names})
+                SELECT {column_names} FROM json_to_recordset($1::json) AS x({col_defs})
+                ON CONFLICT (id) DO UPDATE SET {update_set}
+            """
+            # テーブルごとに1度だけ準備し、以降のバッチは同じ実行計画を使う
+            stmt = await conn.prepare(query)
             
-            for row in batch:
+            # json_to_recordsetはJSON文字列をjsonbの文字列スカラーとして格納するため、
+            # JSONテキストのまま出力された値（既定のエクスポート）は解析済みの値に揃える
+            json_columns = [
+                col for col in columns if column_types[col] in ("json", "jsonb")
+            ]
+            if json_columns:
+                rows = map(
+                    lambda row: self._parse_json_columns(row, json_columns), rows
+                )
+        
+        # バッチ処理（次のバッチの読み込みを別スレッドで先行させ、書き込みと重ねる）
+        async with aclosing(self._prefetch(self._batched(rows))) as batches:
+            async for batch in batches:
+                if dry_run:
+                    imported_count += len(batch)
+                    continue
+                
                 try:
-                    if dry_run:
+                    # バッチ単位で1トランザクション・1回の送信
+                    async with conn.transaction():
+                        await stmt.fetch(batch)
+                    imported_count += len(batch)
+                    continue
+                except Exception:
+                    # バッチ全体がロールバックされるため、1行ずつ再実行して
+                    # 失敗した行だけを特定する
+                    pass
+                
+                for row in batch:
+                    try:
+                        await stmt.fetch([row])
                         imported_count += 1
-                        continue
-                    
-                    # UPSERT（ON CONFLICT DO UPDATE）
-                    placeholders = ", ".join([f"${j+1}" for j in range(len(columns))])
-                    column_names = ", ".join(columns)
-                    update_set = ", ".join([
-                        f"{col} = EXCLUDED.{col}" 
-                        for col in columns 
-                        if col != "id"
-                    ])
-                    
-                    query = f"""
-                        INSERT INTO {table} ({column_names})
-                        VALUES ({placeholders})
-                        ON CONFLICT (id) DO UPDATE SET {update_set}
-                    """
-                    
-                    values = [self._convert_value(row.get(col)) for col in columns]
-                    await conn.execute(query, *values)
-                    imported_count += 1
-                    
-                except asyncpg.UniqueViolationError:
-                    skipped_count += 1
-                except Exception as e:
-                    error_count += 1
-                    if error_count <= 5:  # 最初の5件のエラーのみログ
-                        print(f"\n  Warning: Error importing row: {e}")
+                        
+                    except asyncpg.UniqueViolationError:
+                        skipped_count += 1
+                    except Exception as e:
+                        error_count += 1
+                        if error_count <= 5:  # 最初の5件のエラーのみログ
+                            print(f"\n  Warning: Error importing row: {e}")
         
         return ImportResult(
             table_name=table,
@@ -248,24 +545,84 @@ class AuroraImporter:
             success=error_count == 0
         )
     
-    def _convert_value(self, value: Any) -> Any:
-        """値をPostgreSQL互換形式に変換"""
-        if value is None:
-            return None
-        if isinstance(value, str):
-            # UUID文字列の場合はそのまま
+    def _batched(self, items: Iterable[Any]) -> Iterator[List[Any]]:
+        """BATCH_SIZE件ずつのリストに分割"""
+        items = iter(items)
+        while batch := list(islice(items, self.BATCH_SIZE)):
+            yield batch
+    
+    async def _prefetch(self, batches: Iterator[List[Any]]) -> AsyncIterator[List[Any]]:
+        """バッチの読み込み（ファイルI/O・JSON解析）を別スレッドで先行させる
+        
+        呼び出し側が1バッチを書き込んでいる間に、最大PREFETCH_BATCHES件まで
+        次のバッチを読み込んでおく。
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.PREFETCH_BATCHES)
+        done = object()
+        
+        async def produce():
             try:
-                UUID(value)
-                return value
-            except (ValueError, TypeError):
-                pass
-            # ISO日時文字列の場合はそのまま
-            return value
-        if isinstance(value, dict):
-            return json.dumps(value)
-        if isinstance(value, list):
-            return json.dumps(value)
-        return value
+                while (batch := await asyncio.to_thread(next, batches, None)) is not None:
+                    await queue.put(batch)
+            finally:
+                await queue.put(done)
+        
+        producer = asyncio.create_task(produce())
+        try:
+            while (batch := await queue.get()) is not done:
+                yield batch
+            # 読み込み中の例外を呼び出し側に伝える
+            await producer
+        finally:
+            producer.cancel()
+    
+    async def _column_types(self, conn, table: str) -> Dict[str, str]:
+        """テーブルのカラム名 → 型（format_type表記、例: "timestamp with time zone"）"""
+        rows = await conn.fetch("""
+            SELECT a.attname, format_type(a.atttypid, a.atttypmod) AS type
+            FROM pg_attribute a
+            WHERE a.attrelid = $1::regclass
+            AND a.attnum > 0
+            AND NOT a.attisdropped
+        """, table)
+        return {r["attname"]: r["type"] for r in rows}
+    
+    async def _copy_upsert(
+        self,
+        conn,
+        table: str,
+        columns: List[str],
+        records: AsyncIterable[tuple],
+        update_set: str
+    ) -> None:
+        """COPYで一時テーブルに投入し、1回のINSERT ... SELECTでUPSERT"""
+        staging = f"_stg_{table}"
+        column_names = ", ".join(columns)
+        
+        async with conn.transaction():
+            await conn.execute(
+                f"CREATE TEMP TABLE {staging} (LIKE {table} INCLUDING DEFAULTS) ON COMMIT DROP"
+            )
+            await conn.copy_records_to_table(staging, records=records, columns=columns)
+            await conn.execute(f"""
+                INSERT INTO {table} ({column_names})
+                SELECT {column_names} FROM {staging}
+                ON CONFLICT (id) DO UPDATE SET {update_set}
+            """)
+    
+    @staticmethod
+    def _converter(column_type: str) -> Optional[Callable[[Any], Any]]:
+        """カラムの型に応じた値の変換関数（COPYのバイナリ形式向け、NULLは呼び出し側で処理）
+        
+        エクスポートでは日時がテキストになっているため、asyncpgが受け付ける
+        Pythonオブジェクトに戻す。uuid / numeric などは文字列のまま、json / jsonb は
+        セッションのコーデックでそのまま渡せるため変換不要（Noneを返す）。
+        """
+        if column_type.startswith("timestamp"):
+            return lambda v: datetime.fromisoformat(v) if isinstance(v, str) else v
+        if column_type == "date":
+            return lambda v: date.fromisoformat(v) if isinstance(v, str) else v
+        return None
 
 
 def main():
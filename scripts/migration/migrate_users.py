@@ -15,13 +15,15 @@ import asyncio
 import json
 import os
 import sys
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Set
 from dataclasses import dataclass, field
 from datetime import datetime
 
 try:
     import asyncpg
     import boto3
+    from botocore.config import Config
     from botocore.exceptions import ClientError
 except ImportError:
     print("Required packages not installed. Run:")
@@ -53,6 +55,24 @@ class MigrationReport:
 class UserMigrator:
     """ユーザー移行クラス"""
 
+    # Cognito APIの同時実行数
+    MAX_CONCURRENCY = 20
+    # カーソルで一度に取得する行数
+    CURSOR_PREFETCH = 1000
+
+    USERS_QUERY = """
+        SELECT
+            id,
+            email,
+            raw_user_meta_data,
+            created_at,
+            app_metadata,
+            email_confirmed_at
+        FROM auth.users
+        WHERE email IS NOT NULL
+        ORDER BY created_at
+    """
+
     def __init__(
         self,
         supabase_conn_string: str,
@@ -60,7 +80,15 @@ class UserMigrator:
         region: str = "ap-northeast-1"
     ):
         self.supabase_conn_string = supabase_conn_string
-        self.cognito_client = boto3.client("cognito-idp", region_name=region)
+        # 並列呼び出し用にHTTP接続プールを広げ、スロットリング時は適応的にリトライ
+        self._session = boto3.Session(region_name=region)
+        self.cognito_client = self._session.client(
+            "cognito-idp",
+            config=Config(
+                max_pool_connections=self.MAX_CONCURRENCY * 2,
+                retries={"mode": "adaptive", "total_max_attempts": 5},
+            ),
+        )
         self.user_pool_id = cognito_user_pool_id
 
     async def migrate_all(self, dry_run: bool = False) -> MigrationReport:
@@ -74,85 +102,62 @@ class UserMigrator:
 
         conn = await asyncpg.connect(self.supabase_conn_string)
 
-        results: List[UserMigrationResult] = []
-        success_count = 0
-        skipped_count = 0
-        failed_count = 0
+        # Cognito APIはブロッキングのため、スレッドで同時にMAX_CONCURRENCY件まで実行
+        # （既定のto_threadはCPU数でスレッド数が決まるため専用のプールを使う）
+        loop = asyncio.get_running_loop()
+        processed = 0
+        # 未処理のユーザーを溜め込まないよう、処理中の件数に上限を設ける
+        in_flight = asyncio.Semaphore(self.MAX_CONCURRENCY * 2)
+
+        async def migrate(user) -> UserMigrationResult:
+            nonlocal processed
+            try:
+                result = await loop.run_in_executor(
+                    executor, self._migrate_user, user, existing, dry_run
+                )
+            finally:
+                in_flight.release()
+            processed += 1
+            # 進捗は約1%ごとに表示し、失敗したユーザーはその都度表示する
+            if result.action == "failed":
+                print(f"[{processed}/{total}] {result.email}... {self._status_label(result)}")
+            elif processed % progress_interval == 0 or processed == total:
+                print(f"[{processed}/{total}] processed")
+            return result
 
         try:
-            # Supabase auth.usersテーブルからユーザー取得
-            users = await conn.fetch("""
-                SELECT 
-                    id,
-                    email,
-                    raw_user_meta_data,
-                    created_at,
-                    app_metadata,
-                    email_confirmed_at
-                FROM auth.users
-                WHERE email IS NOT NULL
-                ORDER BY created_at
-            """)
-
-            total = len(users)
-            print(f"Found {total} users to migrate")
-            print()
-
-            for i, user in enumerate(users, 1):
-                email = user["email"]
-                user_id = str(user["id"])
-
-                print(f"[{i}/{total}] Processing: {email}...", end=" ")
-
-                try:
-                    # 既存ユーザーチェック
-                    if self._user_exists(email):
-                        skipped_count += 1
-                        results.append(UserMigrationResult(
-                            user_id=user_id,
-                            email=email,
-                            success=True,
-                            action="skipped"
-                        ))
-                        print("⏭️  Skipped (already exists)")
-                        continue
-
-                    if dry_run:
-                        success_count += 1
-                        results.append(UserMigrationResult(
-                            user_id=user_id,
-                            email=email,
-                            success=True,
-                            action="dry_run"
-                        ))
-                        print("🔍 Would create (dry run)")
-                        continue
-
-                    # Cognitoにユーザー作成
-                    self._create_cognito_user(user)
-                    success_count += 1
-                    results.append(UserMigrationResult(
-                        user_id=user_id,
-                        email=email,
-                        success=True,
-                        action="created"
-                    ))
-                    print("✅ Created")
-
-                except Exception as e:
-                    failed_count += 1
-                    results.append(UserMigrationResult(
-                        user_id=user_id,
-                        email=email,
-                        success=False,
-                        action="failed",
-                        error=str(e)
-                    ))
-                    print(f"❌ Failed: {e}")
-
+            # 件数とカーソルが同じスナップショットを参照するようにする
+            async with conn.transaction(isolation="repeatable_read", readonly=True):
+                total = await conn.fetchval(
+                    "SELECT count(*) FROM auth.users WHERE email IS NOT NULL"
+                )
+                print(f"Found {total} users to migrate")
+                print()
+                progress_interval = max(1, total // 100)
+
+                with ThreadPoolExecutor(max_workers=self.MAX_CONCURRENCY) as executor:
+                    # 既存ユーザーはユーザーごとに問い合わせず、事前に一括取得しておく
+                    existing = await loop.run_in_executor(executor, self._existing_emails)
+                    print(f"Found {len(existing)} existing Cognito users")
+                    print()
+
+                    # Supabase auth.usersテーブルからサーバーサイドカーソルで逐次取得
+                    tasks = []
+                    async for user in conn.cursor(
+                        self.USERS_QUERY, prefetch=self.CURSOR_PREFETCH
+                    ):
+                        await in_flight.acquire()
+                        tasks.append(asyncio.create_task(migrate(user)))
+                    results: List[UserMigrationResult] = list(
+                        await asyncio.gather(*tasks)
+                    )
         finally:
             await conn.close()
 
+        success_count = sum(1 for r in results if r.action in ("created", "dry_run"))
+        skipped_count = sum(1 for r in results if r.action == "skipped")
+        failed_count = sum(1 for r in results if r.action == "failed")
+
         print()
         print("=" * 60)
         print("Summary")
@@ -177,16 +182,73 @@ class UserMigrator:
             results=results
         )
 
-    def _user_exists(self, email: str) -> bool:
-        """Cognitoにユーザーが存在するかチェック"""
+    def _migrate_user(self, user, existing: Set[str], dry_run: bool) -> UserMigrationResult:
+        """1ユーザーを移行（スレッドで実行）"""
+        email = user["email"]
+        user_id = str(user["id"])
+
         try:
-            self.cognito_client.admin_get_user(
-                UserPoolId=self.user_pool_id,
-                Username=email
+            # 既存ユーザーチェック
+            if email in existing:
+                return UserMigrationResult(
+                    user_id=user_id,
+                    email=email,
+                    success=True,
+                    action="skipped"
+                )
+
+            if dry_run:
+                return UserMigrationResult(
+                    user_id=user_id,
+                    email=email,
+                    success=True,
+                    action="dry_run"
+                )
+
+            # Cognitoにユーザー作成
+            self._create_cognito_user(user)
+            return UserMigrationResult(
+                user_id=user_id,
+                email=email,
+                success=True,
+                action="created"
             )
-            return True
-        except self.cognito_client.exceptions.UserNotFoundException:
-            return False
+
+        except Exception as e:
+            return UserMigrationResult(
+                user_id=user_id,
+                email=email,
+                success=False,
+                action="failed",
+                error=str(e)
+            )
+
+    @staticmethod
+    def _status_label(result: UserMigrationResult) -> str:
+        """進捗表示用のステータス"""
+        if result.action == "skipped":
+            return "⏭️  Skipped (already exists)"
+        if result.action == "dry_run":
+            return "🔍 Would create (dry run)"
+        if result.action == "created":
+            return "✅ Created"
+        return f"❌ Failed: {result.error}"
+
+    def _existing_emails(self) -> Set[str]:
+        """Cognitoに登録済みのユーザー（ユーザー名・メールアドレス）を取得"""
+        existing: Set[str] = set()
+        paginator = self.cognito_client.get_paginator("list_users")
+        for page in paginator.paginate(
+            UserPoolId=self.user_pool_id,
+            AttributesToGet=["email"]
+        ):
+            for cognito_user in page["Users"]:
+                # ユーザー名にはメールアドレスを使用しているため両方を登録しておく
+                existing.add(cognito_user["Username"])
+                for attr in cognito_user.get("Attributes", []):
+                    if attr["Name"] == "email":
+                        existing.add(attr["Value"])
+        return existing
 
     def _create_cognito_user(self, user: dict) -> None:
         """Cognitoにユーザーを作成"""
@@ -196,6 +258,7 @@ class UserMigrator:
         # 基本属性
         attributes = [
             {"Name": "email", "Value": user["email"]},
+            # メール確認済みの場合は作成時に確認済みとして登録する
             {"Name": "email_verified", "Value": "true" if user.get("email_confirmed_at") else "false"},
         ]
 
@@ -234,16 +297,6 @@ class UserMigrator:
             MessageAction="SUPPRESS"
         )
 
-        # メール確認済みの場合、ユーザーを確認済みに設定
-        if user.get("email_confirmed_at"):
-            self.cognito_client.admin_update_user_attributes(
-                UserPoolId=self.user_pool_id,
-                Username=user["email"],
-                UserAttributes=[
-                    {"Name": "email_verified", "Value": "true"}
-                ]
-            )
-
 
 def main():
     """メイン関数"""
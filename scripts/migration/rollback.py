@@ -14,6 +14,9 @@ Environment Variables:
     SNS_TOPIC_ARN: SNS topic for notifications
     VERCEL_TOKEN: Vercel API token (optional)
     SUPABASE_URL: Supabase project URL
+    ROUTE53_HOSTED_ZONE_ID: Route53 hosted zone ID (optional)
+    ROLLBACK_DNS_RECORDS: Records to point back to Vercel (optional)
+        e.g. "vow.example.com=A:76.76.21.21,www.vow.example.com=CNAME:cname.vercel-dns.com"
 """
 
 import asyncio
@@ -21,14 +24,16 @@ import json
 import os
 import sys
 import argparse
-from dataclasses import dataclass, field
-from datetime import datetime
-from typing import List, Optional, Dict, Any
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import List, Optional, Dict, Any, Tuple
 from enum import Enum
+from functools import cached_property
 
 try:
     import boto3
-    from botocore.exceptions import ClientError
+    from botocore.config import Config
+    from botocore.exceptions import BotoCoreError, ClientError
 except ImportError:
     print("Required packages not installed. Run:")
     print("  pip install boto3")
@@ -40,6 +45,12 @@ try:
 except ImportError:
     HAS_HTTPX = False
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 class RollbackStep(Enum):
     """ロールバックステップ"""
@@ -69,46 +80,127 @@ class RollbackReport:
     success: bool
     steps: List[StepResult] = field(default_factory=list)
     errors: List[str] = field(default_factory=list)
+    # 各ステップの表示用の1行（サマリー表示と通知で共用）
+    formatted_lines: List[str] = field(default_factory=list, init=False, repr=False)
+    
+    def add_step(self, result: StepResult) -> None:
+        """ステップ結果を追加し、表示用の行も合わせて作成"""
+        self.steps.append(result)
+        status = "✅" if result.success else "❌"
+        self.formatted_lines.append(f"{status} {result.step.value}: {result.message}")
 
 
 class RollbackController:
     """ロールバックコントローラー"""
     
+    # HTTPチェックのタイムアウト（秒）
+    HTTP_TIMEOUT = 10.0
+    
+    # ロールバック時に設定するDNSレコードのTTL（秒）
+    DNS_TTL = 60
+    
+    # Vercelが応答しているとみなすステータス（401はDeployment Protection）
+    VERCEL_OK_STATUSES = (200, 301, 302, 401)
+    
     def __init__(
         self,
         region: str = "ap-northeast-1",
         sns_topic_arn: Optional[str] = None,
         vercel_token: Optional[str] = None,
-        supabase_url: Optional[str] = None
+        supabase_url: Optional[str] = None,
+        hosted_zone_id: Optional[str] = None,
+        rollback_records: Optional[List[Tuple[str, str, str]]] = None
     ):
         self.region = region
         self.sns_topic_arn = sns_topic_arn
         self.vercel_token = vercel_token
         self.supabase_url = supabase_url
+        self.hosted_zone_id = hosted_zone_id
+        # Vercelに戻すDNSレコード: (レコード名, タイプ, 値)
+        self.rollback_records = rollback_records or []
+        
+        # AWS clients（使用するサービスのみ、初回アクセス時に生成）
+        # 接続をkeep-aliveで維持し、ロールバック中に応答しない呼び出しで長く待たないようにする
+        # max_pool_connections: DMSタスク停止などをスレッドで並行に呼び出すため、
+        # 既定の10接続で接続待ちにならないよう広めに確保する（縮小しないこと）
+        self._config = Config(
+            tcp_keepalive=True,
+            connect_timeout=3,
+            read_timeout=10,
+            retries={"mode": "adaptive", "max_attempts": 3},
+            max_pool_connections=50
+        )
+        
+        # 呼び出し元のAWSアカウント情報（プロセス内では変わらないため一度だけ取得）
+        self._identity: Optional[Dict[str, Any]] = None
+        
+        # 端末以外（CIログ等）では進捗表示を省き、最後にJSONレポートのみ出力する
+        self._tty = sys.stdout.isatty()
         
-        # AWS clients
-        self.dms_client = boto3.client("dms", region_name=region)
-        self.sns_client = boto3.client("sns", region_name=region)
-        self.route53_client = boto3.client("route53")
+        # 検証ステップで共有するHTTPクライアント（execute中のみ有効）
+        self._http: Optional["httpx.AsyncClient"] = None
+    
+    def _print(self, *args: Any) -> None:
+        """進捗表示（端末に出力している場合のみ）"""
+        if self._tty:
+            print(*args)
+    
+    @cached_property
+    def sts_client(self):
+        return boto3.client("sts", config=self._config)
+    
+    @cached_property
+    def dms_client(self):
+        return boto3.client("dms", region_name=self.region, config=self._config)
+    
+    @cached_property
+    def sns_client(self):
+        return boto3.client("sns", region_name=self.region, config=self._config)
+    
+    @cached_property
+    def route53_client(self):
+        return boto3.client("route53", config=self._config)
     
     async def execute(self, dry_run: bool = True) -> RollbackReport:
         """ロールバックを実行"""
-        print("=" * 60)
-        print("VOW Production Migration Rollback")
-        print("=" * 60)
-        print(f"Started at: {datetime.now().isoformat()}")
-        print(f"Dry run: {dry_run}")
-        print()
+        # HTTPチェックは1つのクライアントで接続（TCP/TLS）を使い回す
+        if HAS_HTTPX:
+            self._http = httpx.AsyncClient(
+                timeout=httpx.Timeout(self.HTTP_TIMEOUT),
+                limits=httpx.Limits(max_keepalive_connections=10)
+            )
+        try:
+            report = await self._execute_steps(dry_run)
+        finally:
+            if self._http is not None:
+                await self._http.aclose()
+                self._http = None
+        
+        # 途中で終了した場合（事前チェック失敗など）も、必ずサマリー・保存・JSON出力を行う
+        self._finish_report(report)
+        return report
+    
+    async def _execute_steps(self, dry_run: bool) -> RollbackReport:
+        """ロールバックの各ステップを順に実行"""
+        # 表示とレポートで同じ開始時刻を使う
+        started_at = datetime.now(timezone.utc).isoformat()
+        
+        self._print("=" * 60)
+        self._print("VOW Production Migration Rollback")
+        self._print("=" * 60)
+        self._print(f"Started at: {started_at}")
+        self._print(f"Dry run: {dry_run}")
+        self._print()
         
         report = RollbackReport(
-            timestamp=datetime.now().isoformat(),
+            timestamp=started_at,
             dry_run=dry_run,
             success=True
         )
         
         # Step 1: Pre-check
         result = await self._pre_check()
-        report.steps.append(result)
+        report.add_step(result)
         if not result.success:
             report.success = False
             report.errors.append(f"Pre-check failed: {result.message}")
@@ -116,66 +208,88 @@ class RollbackController:
         
         # Step 2: Stop DMS
         result = await self._stop_dms(dry_run)
-        report.steps.append(result)
+        report.add_step(result)
         
         # Step 3: Update DNS (if applicable)
         result = await self._update_dns(dry_run)
-        report.steps.append(result)
-        
-        # Step 4: Verify Vercel
-        result = await self._verify_vercel()
-        report.steps.append(result)
+        report.add_step(result)
         if not result.success:
-            report.errors.append(f"Vercel verification failed: {result.message}")
+            report.errors.append(f"DNS update failed: {result.message}")
         
-        # Step 5: Verify Supabase
-        result = await self._verify_supabase()
-        report.steps.append(result)
-        if not result.success:
-            report.errors.append(f"Supabase verification failed: {result.message}")
+        # Step 4-5: Verify Vercel / Supabase（互いに独立したHTTPチェックのため並行実行）
+        verifications = await asyncio.gather(
+            self._verify_vercel(),
+            self._verify_supabase(),
+            return_exceptions=True
+        )
+        for step, label, result in zip(
+            (RollbackStep.VERIFY_VERCEL, RollbackStep.VERIFY_SUPABASE),
+            ("Vercel", "Supabase"),
+            verifications
+        ):
+            # 一方の例外でもう一方の結果を失わないよう、例外は失敗として記録
+            if isinstance(result, BaseException):
+                result = StepResult(
+                    step=step,
+                    success=False,
+                    message=f"{label} check failed: {result}"
+                )
+            report.add_step(result)
+            if not result.success:
+                report.errors.append(f"{label} verification failed: {result.message}")
         
         # Step 6: Send notification
         result = await self._send_notification(dry_run, report)
-        report.steps.append(result)
+        report.add_step(result)
         
         # Step 7: Post-check
         result = await self._post_check()
-        report.steps.append(result)
+        report.add_step(result)
         
-        # Summary
-        print()
-        print("=" * 60)
-        print("Rollback Summary")
-        print("=" * 60)
+        return report
+    
+    def _finish_report(self, report: RollbackReport) -> None:
+        """サマリーを表示し、レポートを保存・出力"""
+        self._print()
+        self._print("=" * 60)
+        self._print("Rollback Summary")
+        self._print("=" * 60)
         
-        for step in report.steps:
-            status = "✅" if step.success else "❌"
-            print(f"{status} {step.step.value}: {step.message}")
+        for line in report.formatted_lines:
+            self._print(line)
         
         if report.errors:
-            print()
-            print("Errors:")
+            self._print()
+            self._print("Errors:")
             for error in report.errors:
-                print(f"  - {error}")
+                self._print(f"  - {error}")
         
-        print()
-        if dry_run:
-            print("🔍 This was a DRY RUN - no changes were made")
+        self._print()
+        if report.dry_run:
+            self._print("🔍 This was a DRY RUN - no changes were made")
         
         report.success = len(report.errors) == 0
-        return report
+        
+        # 事後調査用にレポートをJSONで保存
+        report_file = f"rollback-{report.timestamp.replace(':', '-')}.json"
+        with open(report_file, "wb") as f:
+            f.write(self._dump_report(report, indent=True))
+        self._print(f"Report saved to: {report_file}")
+        
+        if not self._tty:
+            print(self._dump_report(report).decode())
     
     async def _pre_check(self) -> StepResult:
         """事前チェック"""
-        print("Step 1: Pre-check...")
+        self._print("Step 1: Pre-check...")
         
         checks = []
         
         # AWS credentials
         try:
-            sts = boto3.client("sts")
-            identity = sts.get_caller_identity()
-            checks.append(f"AWS Account: {identity['Account']}")
+            if self._identity is None:
+                self._identity = await asyncio.to_thread(self.sts_client.get_caller_identity)
+            checks.append(f"AWS Account: {self._identity['Account']}")
         except Exception as e:
             return StepResult(
                 step=RollbackStep.PRE_CHECK,
@@ -195,7 +309,7 @@ class RollbackController:
         else:
             checks.append("Supabase URL: not configured")
         
-        print(f"  ✅ Pre-check passed")
+        self._print(f"  ✅ Pre-check passed")
         return StepResult(
             step=RollbackStep.PRE_CHECK,
             success=True,
@@ -205,20 +319,14 @@ class RollbackController:
     
     async def _stop_dms(self, dry_run: bool) -> StepResult:
         """DMS レプリケーションを停止"""
-        print("Step 2: Stop DMS replication...")
+        self._print("Step 2: Stop DMS replication...")
         
         try:
             # DMS タスクを検索
-            response = self.dms_client.describe_replication_tasks(
-                Filters=[
-                    {"Name": "replication-task-id", "Values": ["vow-*"]}
-                ]
-            )
-            
-            tasks = response.get("ReplicationTasks", [])
+            tasks = await asyncio.to_thread(self._list_dms_tasks)
             
             if not tasks:
-                print("  ⏭️  No DMS tasks found")
+                self._print("  ⏭️  No DMS tasks found")
                 return StepResult(
                     step=RollbackStep.STOP_DMS,
                     success=True,
@@ -226,63 +334,145 @@ class RollbackController:
                 )
             
             stopped_tasks = []
+            pending_arns = []
             for task in tasks:
                 task_arn = task["ReplicationTaskArn"]
                 task_status = task["Status"]
                 
                 if task_status == "running":
                     if dry_run:
-                        print(f"  🔍 Would stop: {task_arn}")
+                        self._print(f"  🔍 Would stop: {task_arn}")
+                        stopped_tasks.append(task_arn)
                     else:
-                        self.dms_client.stop_replication_task(
-                            ReplicationTaskArn=task_arn
-                        )
-                        print(f"  ✅ Stopped: {task_arn}")
-                    stopped_tasks.append(task_arn)
+                        pending_arns.append(task_arn)
+                else:
+                    self._print(f"  ⏭️  Task not running ({task_status}): {task_arn}")
+            
+            # タスクの停止は互いに独立しているため、まとめて並行に要求する
+            outcomes = await asyncio.gather(
+                *[
+                    asyncio.to_thread(
+                        self.dms_client.stop_replication_task,
+                        ReplicationTaskArn=task_arn
+                    )
+                    for task_arn in pending_arns
+                ],
+                return_exceptions=True
+            )
+            failed_tasks = []
+            for task_arn, outcome in zip(pending_arns, outcomes):
+                if isinstance(outcome, Exception):
+                    self._print(f"  ⚠️  Failed to stop {task_arn}: {outcome}")
+                    failed_tasks.append(task_arn)
                 else:
-                    print(f"  ⏭️  Task not running ({task_status}): {task_arn}")
+                    self._print(f"  ✅ Stopped: {task_arn}")
+                    stopped_tasks.append(task_arn)
             
+            message = f"Stopped {len(stopped_tasks)} DMS tasks"
+            if failed_tasks:
+                message += f" ({len(failed_tasks)} failed to stop)"
             return StepResult(
                 step=RollbackStep.STOP_DMS,
-                success=True,
-                message=f"Stopped {len(stopped_tasks)} DMS tasks",
-                details={"stopped_tasks": stopped_tasks}
+                success=True,  # Non-critical
+                message=message,
+                details={"stopped_tasks": stopped_tasks, "failed_tasks": failed_tasks}
             )
             
-        except ClientError as e:
-            print(f"  ⚠️  DMS error: {e}")
+        except (ClientError, BotoCoreError) as e:
+            # 接続エラー・タイムアウトも含め、DMSの失敗でロールバック全体を止めない
+            self._print(f"  ⚠️  DMS error: {e}")
             return StepResult(
                 step=RollbackStep.STOP_DMS,
                 success=True,  # Non-critical
                 message=f"DMS check skipped: {e}"
             )
     
+    def _list_dms_tasks(self) -> List[Dict[str, Any]]:
+        """VOWのDMSタスクを取得（複数ページにわたる場合も全件取得）"""
+        paginator = self.dms_client.get_paginator("describe_replication_tasks")
+        pages = paginator.paginate(
+            Filters=[
+                {"Name": "replication-task-id", "Values": ["vow-*"]}
+            ]
+        )
+        return [
+            task
+            for page in pages
+            for task in page.get("ReplicationTasks", [])
+        ]
+    
     async def _update_dns(self, dry_run: bool) -> StepResult:
         """DNS を更新（Route53）"""
-        print("Step 3: Update DNS...")
+        self._print("Step 3: Update DNS...")
+        
+        if not self.hosted_zone_id or not self.rollback_records:
+            self._print("  ℹ️  DNS update requires manual configuration")
+            self._print("  Instructions:")
+            self._print("    1. Go to Route53 console (if using Route53)")
+            self._print("    2. Update A/CNAME record to point to Vercel")
+            self._print("    3. Or update your DNS provider settings")
+            
+            return StepResult(
+                step=RollbackStep.UPDATE_DNS,
+                success=True,
+                message="DNS update instructions provided (manual step)"
+            )
         
-        # Note: This is a placeholder. In production, you would:
-        # 1. Get the hosted zone ID
-        # 2. Update the A/CNAME record to point to Vercel
+        # 全レコードを1つのChangeBatchにまとめ、1回のAPI呼び出しで切り替える
+        # （Route53のレート制限を受けず、レコード間で切り替えのずれも生じない）
+        changes = [
+            {
+                "Action": "UPSERT",
+                "ResourceRecordSet": {
+                    "Name": name,
+                    "Type": record_type,
+                    "TTL": self.DNS_TTL,
+                    "ResourceRecords": [{"Value": value}]
+                }
+            }
+            for name, record_type, value in self.rollback_records
+        ]
+        records = [f"{name} {record_type} {value}" for name, record_type, value in self.rollback_records]
         
-        print("  ℹ️  DNS update requires manual configuration")
-        print("  Instructions:")
-        print("    1. Go to Route53 console (if using Route53)")
-        print("    2. Update A/CNAME record to point to Vercel")
-        print("    3. Or update your DNS provider settings")
+        if dry_run:
+            for record in records:
+                self._print(f"  🔍 Would update: {record}")
+            return StepResult(
+                step=RollbackStep.UPDATE_DNS,
+                success=True,
+                message=f"{len(changes)} DNS records would be updated (dry run)",
+                details={"records": records}
+            )
+        
+        try:
+            response = await asyncio.to_thread(
+                self.route53_client.change_resource_record_sets,
+                HostedZoneId=self.hosted_zone_id,
+                ChangeBatch={"Comment": "VOW rollback", "Changes": changes}
+            )
+        except (ClientError, BotoCoreError) as e:
+            self._print(f"  ❌ DNS update failed: {e}")
+            return StepResult(
+                step=RollbackStep.UPDATE_DNS,
+                success=False,
+                message=f"DNS update failed: {e}"
+            )
         
+        for record in records:
+            self._print(f"  ✅ Updated: {record}")
         return StepResult(
             step=RollbackStep.UPDATE_DNS,
             success=True,
-            message="DNS update instructions provided (manual step)"
+            message=f"Updated {len(changes)} DNS records",
+            details={"records": records, "change_id": response["ChangeInfo"]["Id"]}
         )
     
     async def _verify_vercel(self) -> StepResult:
         """Vercel デプロイメントを検証"""
-        print("Step 4: Verify Vercel...")
+        self._print("Step 4: Verify Vercel...")
         
         if not HAS_HTTPX:
-            print("  ⚠️  httpx not installed, skipping HTTP check")
+            self._print("  ⚠️  httpx not installed, skipping HTTP check")
             return StepResult(
                 step=RollbackStep.VERIFY_VERCEL,
                 success=True,
@@ -292,27 +482,26 @@ class RollbackController:
         vercel_url = "https://vow-sigma.vercel.app"
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(vercel_url, timeout=10.0)
-                
-                if response.status_code == 200:
-                    print(f"  ✅ Vercel responding: {vercel_url}")
-                    return StepResult(
-                        step=RollbackStep.VERIFY_VERCEL,
-                        success=True,
-                        message=f"Vercel responding (status: {response.status_code})",
-                        details={"url": vercel_url, "status": response.status_code}
-                    )
-                else:
-                    print(f"  ⚠️  Vercel returned status {response.status_code}")
-                    return StepResult(
-                        step=RollbackStep.VERIFY_VERCEL,
-                        success=False,
-                        message=f"Vercel returned status {response.status_code}"
-                    )
-                    
+            response = await self._probe(vercel_url)
+            
+            if response.status_code in self.VERCEL_OK_STATUSES:
+                self._print(f"  ✅ Vercel responding: {vercel_url}")
+                return StepResult(
+                    step=RollbackStep.VERIFY_VERCEL,
+                    success=True,
+                    message=f"Vercel responding (status: {response.status_code})",
+                    details={"url": vercel_url, "status": response.status_code}
+                )
+            else:
+                self._print(f"  ⚠️  Vercel returned status {response.status_code}")
+                return StepResult(
+                    step=RollbackStep.VERIFY_VERCEL,
+                    success=False,
+                    message=f"Vercel returned status {response.status_code}"
+                )
+            
         except Exception as e:
-            print(f"  ❌ Vercel check failed: {e}")
+            self._print(f"  ❌ Vercel check failed: {e}")
             return StepResult(
                 step=RollbackStep.VERIFY_VERCEL,
                 success=False,
@@ -321,10 +510,10 @@ class RollbackController:
     
     async def _verify_supabase(self) -> StepResult:
         """Supabase を検証"""
-        print("Step 5: Verify Supabase...")
+        self._print("Step 5: Verify Supabase...")
         
         if not self.supabase_url:
-            print("  ⚠️  Supabase URL not configured")
+            self._print("  ⚠️  Supabase URL not configured")
             return StepResult(
                 step=RollbackStep.VERIFY_SUPABASE,
                 success=True,
@@ -332,7 +521,7 @@ class RollbackController:
             )
         
         if not HAS_HTTPX:
-            print("  ⚠️  httpx not installed, skipping HTTP check")
+            self._print("  ⚠️  httpx not installed, skipping HTTP check")
             return StepResult(
                 step=RollbackStep.VERIFY_SUPABASE,
                 success=True,
@@ -343,97 +532,139 @@ class RollbackController:
             # Supabase health check endpoint
             health_url = f"{self.supabase_url}/rest/v1/"
             
-            async with httpx.AsyncClient() as client:
-                response = await client.get(health_url, timeout=10.0)
-                
-                # Supabase returns 401 without auth, but that means it's responding
-                if response.status_code in [200, 401]:
-                    print(f"  ✅ Supabase responding: {self.supabase_url}")
-                    return StepResult(
-                        step=RollbackStep.VERIFY_SUPABASE,
-                        success=True,
-                        message="Supabase responding",
-                        details={"url": self.supabase_url}
-                    )
-                else:
-                    return StepResult(
-                        step=RollbackStep.VERIFY_SUPABASE,
-                        success=False,
-                        message=f"Supabase returned status {response.status_code}"
-                    )
-                    
+            response = await self._probe(health_url)
+            
+            # Supabase returns 401 without auth, but that means it's responding
+            if response.status_code in [200, 401]:
+                self._print(f"  ✅ Supabase responding: {self.supabase_url}")
+                return StepResult(
+                    step=RollbackStep.VERIFY_SUPABASE,
+                    success=True,
+                    message="Supabase responding",
+                    details={"url": self.supabase_url}
+                )
+            else:
+                return StepResult(
+                    step=RollbackStep.VERIFY_SUPABASE,
+                    success=False,
+                    message=f"Supabase returned status {response.status_code}"
+                )
+            
         except Exception as e:
-            print(f"  ❌ Supabase check failed: {e}")
+            self._print(f"  ❌ Supabase check failed: {e}")
             return StepResult(
                 step=RollbackStep.VERIFY_SUPABASE,
                 success=False,
                 message=f"Supabase check failed: {e}"
             )
     
+    async def _probe(self, url: str) -> "httpx.Response":
+        """ステータスコードのみ確認するため、本文を取得しないHEADで問い合わせる
+        
+        HEADを受け付けないサーバー（405）の場合のみGETで再確認する。
+        """
+        response = await self._http.head(url, follow_redirects=True)
+        if response.status_code == 405:
+            response = await self._http.get(url, follow_redirects=True)
+        return response
+    
     async def _send_notification(
         self,
         dry_run: bool,
         report: RollbackReport
     ) -> StepResult:
         """通知を送信"""
-        print("Step 6: Send notification...")
+        self._print("Step 6: Send notification...")
         
         if not self.sns_topic_arn:
-            print("  ⏭️  SNS topic not configured")
+            self._print("  ⏭️  SNS topic not configured")
             return StepResult(
                 step=RollbackStep.NOTIFY,
                 success=True,
                 message="Skipped (SNS topic not configured)"
             )
         
-        message = f"""
-VOW Production Rollback Report
-==============================
-Timestamp: {report.timestamp}
-Dry Run: {report.dry_run}
-
-Steps:
-"""
-        for step in report.steps:
-            status = "✅" if step.success else "❌"
-            message += f"  {status} {step.step.value}: {step.message}\n"
-        
-        if report.errors:
-            message += "\nErrors:\n"
-            for error in report.errors:
-                message += f"  - {error}\n"
-        
         if dry_run:
-            print(f"  🔍 Would send notification to: {self.sns_topic_arn}")
+            self._print(f"  🔍 Would send notification to: {self.sns_topic_arn}")
             return StepResult(
                 step=RollbackStep.NOTIFY,
                 success=True,
                 message="Notification would be sent (dry run)"
             )
         
+        lines = [
+            "VOW Production Rollback Report",
+            "==============================",
+            f"Timestamp: {report.timestamp}",
+            f"Dry Run: {report.dry_run}",
+            "",
+            "Steps:",
+        ]
+        lines += [f"  {line}" for line in report.formatted_lines]
+        
+        if report.errors:
+            lines += ["", "Errors:"]
+            lines += [f"  - {error}" for error in report.errors]
+        
+        body = "\n".join(lines)
+        # メール等にはテキスト、機械的に処理する購読先（SQS / Lambda / HTTPS）にはJSONを送る
+        report_json = self._dump_report(report).decode()
+        message = {
+            "default": body,
+            "sqs": report_json,
+            "lambda": report_json,
+            "https": report_json,
+        }
+        
         try:
-            self.sns_client.publish(
+            await asyncio.to_thread(
+                self.sns_client.publish,
                 TopicArn=self.sns_topic_arn,
                 Subject="[VOW] Production Rollback Report",
-                Message=message
+                Message=json.dumps(message, ensure_ascii=False),
+                MessageStructure="json"
             )
-            print(f"  ✅ Notification sent")
+            self._print(f"  ✅ Notification sent")
             return StepResult(
                 step=RollbackStep.NOTIFY,
                 success=True,
                 message="Notification sent"
             )
         except Exception as e:
-            print(f"  ⚠️  Notification failed: {e}")
+            self._print(f"  ⚠️  Notification failed: {e}")
             return StepResult(
                 step=RollbackStep.NOTIFY,
                 success=True,  # Non-critical
                 message=f"Notification failed: {e}"
             )
     
+    @staticmethod
+    def _json_default(obj: Any) -> Any:
+        """レポートのJSON化（Enumは値に変換）"""
+        if isinstance(obj, Enum):
+            return obj.value
+        return str(obj)
+    
+    @classmethod
+    def _dump_report(cls, report: RollbackReport, indent: bool = False) -> bytes:
+        """レポートをJSON（UTF-8）に変換（orjsonがあれば使用）"""
+        if HAS_ORJSON:
+            # orjsonはdataclass・Enumをそのまま変換できる
+            return orjson.dumps(
+                report,
+                default=cls._json_default,
+                option=orjson.OPT_INDENT_2 if indent else 0
+            )
+        return json.dumps(
+            asdict(report),
+            default=cls._json_default,
+            ensure_ascii=False,
+            indent=2 if indent else None
+        ).encode()
+    
     async def _post_check(self) -> StepResult:
         """事後チェック"""
-        print("Step 7: Post-check...")
+        self._print("Step 7: Post-check...")
         
         checklist = [
             "Verify Vercel deployment is serving traffic",
@@ -444,9 +675,9 @@ Steps:
             "Update status page (if applicable)",
         ]
         
-        print("  Manual verification checklist:")
+        self._print("  Manual verification checklist:")
         for item in checklist:
-            print(f"    [ ] {item}")
+            self._print(f"    [ ] {item}")
         
         return StepResult(
             step=RollbackStep.POST_CHECK,
@@ -461,35 +692,50 @@ def main():
     parser = argparse.ArgumentParser(
         description="VOW Production Migration Rollback Controller"
     )
-    parser.add_argument(
+    # --dry-run（既定）と --execute は同時に指定できない
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
         "--dry-run",
+        dest="dry_run",
         action="store_true",
         default=True,
         help="Perform a dry run (default)"
     )
-    parser.add_argument(
+    mode.add_argument(
         "--execute",
-        action="store_true",
+        dest="dry_run",
+        action="store_false",
         help="Actually execute the rollback"
     )
     args = parser.parse_args()
     
-    dry_run = not args.execute
-    
     # 環境変数
     region = os.environ.get("AWS_REGION", "ap-northeast-1")
     sns_topic_arn = os.environ.get("SNS_TOPIC_ARN")
     vercel_token = os.environ.get("VERCEL_TOKEN")
     supabase_url = os.environ.get("SUPABASE_URL")
+    hosted_zone_id = os.environ.get("ROUTE53_HOSTED_ZONE_ID")
+    
+    # ROLLBACK_DNS_RECORDS: "name=TYPE:value" をカンマ区切りで指定
+    rollback_records = []
+    for entry in filter(None, os.environ.get("ROLLBACK_DNS_RECORDS", "").split(",")):
+        try:
+            name, target = entry.strip().split("=", 1)
+            record_type, value = target.split(":", 1)
+        except ValueError:
+            parser.error(f"Invalid ROLLBACK_DNS_RECORDS entry: {entry!r} (expected name=TYPE:value)")
+        rollback_records.append((name, record_type.upper(), value))
     
     controller = RollbackController(
         region=region,
         sns_topic_arn=sns_topic_arn,
         vercel_token=vercel_token,
-        supabase_url=supabase_url
+        supabase_url=supabase_url,
+        hosted_zone_id=hosted_zone_id,
+        rollback_records=rollback_records
     )
     
-    report = asyncio.run(controller.execute(dry_run=dry_run))
+    report = asyncio.run(controller.execute(dry_run=args.dry_run))
     
     # 終了コード
     sys.exit(0 if report.success else 1)
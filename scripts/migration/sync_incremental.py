@@ -4,10 +4,15 @@ SupabaseからAuroraへの増分同期スクリプト
 
 移行期間中にSupabaseで発生した変更をAuroraに同期します。
 タイムスタンプベースの追跡とlast-write-winsコンフリクト解決を使用。
+--slotを指定した場合は、論理レプリケーションスロット（wal2json）から変更を読み、
+変更・削除された行のみを同期する。
 
 Usage:
     python sync_incremental.py --since "2026-01-19T00:00:00"
     python sync_incremental.py --state ./sync_state.json
+    python sync_incremental.py --sweep
+    python sync_incremental.py --catchup
+    python sync_incremental.py --slot vow_sync --state ./sync_state.json
 
 Environment Variables:
     SUPABASE_CONNECTION_STRING: Supabase PostgreSQL connection string
@@ -20,8 +25,11 @@ import json
 import os
 import sys
 import argparse
+from contextlib import aclosing, suppress
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import (
+    Any, AsyncIterable, AsyncIterator, Dict, List, Optional, Set, Tuple,
+)
 from dataclasses import dataclass, asdict
 from datetime import datetime, timezone
 from uuid import UUID
@@ -40,6 +48,7 @@ class SyncState:
     """同期状態"""
     last_sync: str
     tables: Dict[str, str]  # table_name -> last_updated_at
+    last_lsn: Optional[str] = None  # --slot使用時に消費済みのLSN
 
 
 @dataclass
@@ -82,6 +91,22 @@ class IncrementalSyncer:
     # バッチサイズ
     BATCH_SIZE = 100
     
+    # カーソルで一度に取得・反映する行数
+    CURSOR_PREFETCH = 1000
+    
+    # ターゲットへの書き込み中に先読みしておくチャンク数
+    PREFETCH_CHUNKS = 4
+    
+    # asyncpgの1クエリあたりの引数の上限
+    MAX_QUERY_ARGS = 32767
+    
+    # 並列同期の接続プールサイズ（ソース・ターゲットそれぞれ）
+    POOL_MIN_SIZE = 4
+    POOL_MAX_SIZE = 8
+    
+    # catchupでインデックスを作り直す最小行数（これ未満は作り直しの方が高くつく）
+    CATCHUP_MIN_ROWS = 100_000
+    
     def __init__(
         self,
         source_conn_string: str,
@@ -92,6 +117,49 @@ class IncrementalSyncer:
         self.target_secret_arn = target_secret_arn
         self.region = region
         self._target_conn_string: Optional[str] = None
+        # テーブル名 → 同期するカラム（ソース・ターゲットの両方にあるもの）
+        self._columns_cache: Dict[str, List[str]] = {}
+        # テーブル名 → ソースのカラム名（sync()の開始時に1クエリで読み込む）
+        self._schema_cache: Dict[str, Set[str]] = {}
+        # テーブル名 → 固定のSQL（識別子はクォート済み）
+        self._queries: Dict[str, Dict[str, str]] = {
+            table: self._table_queries(table) for table in self.TABLES
+        }
+    
+    @staticmethod
+    def _quote_ident(name: str) -> str:
+        """SQL識別子としてクォート"""
+        return '"' + name.replace('"', '""') + '"'
+    
+    @classmethod
+    def _table_queries(cls, table: str) -> Dict[str, str]:
+        """テーブルごとの固定のSQL（呼び出しのたびに組み立てない）"""
+        t = cls._quote_ident(table)
+        # ハッシュにはupdated_atのテキスト表現（セッションのTimeZoneで変わる）ではなく
+        # エポック秒を使い、ソース・ターゲットで同じ値になるようにする
+        return {
+            "max_updated": f"SELECT MAX(updated_at) FROM {t}",
+            "existing_ids": f"SELECT id FROM {t} WHERE id = ANY($1)",
+            "delete_ids": f"DELETE FROM {t} WHERE id = ANY($1)",
+            "bucket_hashes": f"""
+                SELECT
+                    date_trunc('hour', updated_at) AS bucket,
+                    md5(string_agg(id::text || ':' || extract(epoch FROM updated_at)::text, ',' ORDER BY id)) AS hash
+                FROM {t}
+                WHERE updated_at IS NOT NULL
+                GROUP BY 1
+            """,
+            "fingerprint": f"""
+                SELECT
+                    count(*) AS count,
+                    max(updated_at) AS max_updated,
+                    md5(string_agg(id::text || ':' || extract(epoch FROM updated_at)::text, ',' ORDER BY id)) AS hash
+                FROM {t}
+                WHERE updated_at > $1
+            """,
+            "disable_triggers": f"ALTER TABLE {t} DISABLE TRIGGER USER",
+            "enable_triggers": f"ALTER TABLE {t} ENABLE TRIGGER USER",
+        }
     
     def _get_target_connection_string(self) -> str:
         """Secrets Managerから接続文字列を取得"""
@@ -112,14 +180,34 @@ class IncrementalSyncer:
         self,
         since: Optional[datetime] = None,
         state_file: Optional[Path] = None,
-        dry_run: bool = False
+        dry_run: bool = False,
+        sweep: bool = False,
+        catchup: bool = False,
+        slot: Optional[str] = None
     ) -> List[SyncResult]:
-        """増分同期を実行"""
+        """増分同期を実行
+        
+        sweepの場合は期間に関係なく、updated_atの1時間単位のバケットごとのハッシュを
+        ソース・ターゲットで比較し、差異のあるバケットのみ同期する（整合性の総点検）。
+        catchupの場合は全件を同期し、大きいテーブルはターゲットのインデックスを削除・
+        ユーザートリガーを無効化してCOPYした後に作り直す（初回・大量の追いつき用）。
+        slotの場合はレプリケーションスロットの未消費の変更のみを同期し、
+        エラーがなければスロットを進める（削除も変更イベントから反映する）。
+        """
         print("=" * 60)
         print("VOW Incremental Sync: Supabase → Aurora")
         print("=" * 60)
         print(f"Started at: {datetime.now().isoformat()}")
         print(f"Dry run: {dry_run}")
+        if slot:
+            mode = f"replication slot ({slot})"
+        elif catchup:
+            mode = "catchup (full copy, indexes rebuilt)"
+        elif sweep:
+            mode = "sweep (hourly bucket hashes)"
+        else:
+            mode = "incremental"
+        print(f"Mode: {mode}")
         print()
         
         # 同期状態の読み込み
@@ -137,8 +225,24 @@ class IncrementalSyncer:
         print(f"Syncing changes since: {sync_since.isoformat()}")
         print()
         
-        source_conn = await asyncpg.connect(self.source_conn_string)
-        target_conn = await asyncpg.connect(self._get_target_connection_string())
+        # date_trunc('hour', ...) のバケット境界がセッションのTimeZoneに依存しないよう、
+        # 両側ともUTCに揃える
+        source_pool = await asyncpg.create_pool(
+            self.source_conn_string,
+            min_size=self.POOL_MIN_SIZE,
+            max_size=self.POOL_MAX_SIZE,
+            server_settings={"TimeZone": "UTC"}
+        )
+        try:
+            target_pool = await asyncpg.create_pool(
+                self._get_target_connection_string(),
+                min_size=self.POOL_MIN_SIZE,
+                max_size=self.POOL_MAX_SIZE,
+                server_settings={"TimeZone": "UTC"}
+            )
+        except Exception:
+            await source_pool.close()
+            raise
         
         results: List[SyncResult] = []
         new_state = SyncState(
@@ -147,53 +251,76 @@ class IncrementalSyncer:
         )
         
         try:
-            for table in self.TABLES:
-                print(f"Syncing {table}...", end=" ")
+            # ソースのテーブル・カラムの有無を1クエリでまとめて取得
+            async with source_pool.acquire() as conn:
+                await self._load_schema(conn)
+            
+            # スロットから未消費の変更を読む（同期に成功するまでスロットは進めない）
+            changes: Optional[Dict[str, Dict[Any, str]]] = None
+            if slot:
+                async with source_pool.acquire() as conn:
+                    upto_lsn, changes = await self._slot_changes(conn, slot)
+                print(f"Consuming changes up to LSN: {upto_lsn}")
+                print()
+            
+            # 外部キーの依存関係ごとのフェーズに分け、同じフェーズのテーブルは並列に同期
+            async with target_pool.acquire() as conn:
+                phases = await self._sync_phases(conn)
+            
+            for phase in phases:
+                outcomes = await asyncio.gather(
+                    *[
+                        self._sync_one(
+                            source_pool, target_pool, table, sync_since, dry_run, sweep,
+                            catchup,
+                            changes.get(table, {}) if changes is not None else None
+                        )
+                        for table in phase
+                    ],
+                    return_exceptions=True
+                )
                 
-                try:
-                    # テーブル存在確認
-                    if not await self._table_exists(source_conn, table):
-                        print("⏭️  SKIPPED (not found)")
+                # 依存関係順（TABLESの順序）に結果を表示
+                for table, outcome in zip(phase, outcomes):
+                    if isinstance(outcome, Exception):
+                        results.append(SyncResult(
+                            table_name=table,
+                            inserted=0,
+                            updated=0,
+                            deleted=0,
+                            errors=1
+                        ))
+                        print(f"Syncing {table}... ❌ ERROR: {outcome}")
                         continue
                     
-                    # updated_atカラム確認
-                    has_updated_at = await self._has_column(
-                        source_conn, table, "updated_at"
-                    )
+                    if outcome is None:
+                        print(f"Syncing {table}... ⏭️  SKIPPED (not found)")
+                        continue
                     
-                    result = await self._sync_table(
-                        source_conn,
-                        target_conn,
-                        table,
-                        sync_since if has_updated_at else None,
-                        dry_run
-                    )
+                    result, max_updated = outcome
                     results.append(result)
                     
                     # 状態更新
-                    if has_updated_at:
-                        max_updated = await source_conn.fetchval(
-                            f"SELECT MAX(updated_at) FROM {table}"
-                        )
-                        if max_updated:
-                            new_state.tables[table] = max_updated.isoformat()
+                    if max_updated:
+                        new_state.tables[table] = max_updated.isoformat()
                     
                     status = "🔍" if dry_run else "✅"
-                    print(f"{status} +{result.inserted} ~{result.updated} -{result.deleted}")
-                    
-                except Exception as e:
-                    results.append(SyncResult(
-                        table_name=table,
-                        inserted=0,
-                        updated=0,
-                        deleted=0,
-                        errors=1
-                    ))
-                    print(f"❌ ERROR: {e}")
+                    print(f"Syncing {table}... {status} +{result.inserted} ~{result.updated} -{result.deleted}")
+            
+            if slot and not dry_run:
+                if any(r.errors > 0 for r in results):
+                    print("\n  Warning: errors occurred, replication slot not advanced")
+                else:
+                    async with source_pool.acquire() as conn:
+                        await conn.execute(
+                            "SELECT pg_replication_slot_advance($1, $2::pg_lsn)",
+                            slot, upto_lsn
+                        )
+                    new_state.last_lsn = upto_lsn
         
         finally:
-            await source_conn.close()
-            await target_conn.close()
+            await source_pool.close()
+            await target_pool.close()
         
         # 状態の保存
         if state_file and not dry_run:
@@ -221,183 +348,643 @@ class IncrementalSyncer:
         
         return results
     
+    async def _sync_phases(self, conn) -> List[List[str]]:
+        """外部キー制約からテーブルを依存関係順のフェーズに分ける
+        
+        各フェーズのテーブルは、それ以前のフェーズのテーブルにのみ依存する。
+        自己参照は無視し、循環がある場合は残りをTABLES順に1つずつ処理する。
+        """
+        rows = await conn.fetch("""
+            SELECT
+                c.conrelid::regclass::text AS child,
+                c.confrelid::regclass::text AS parent
+            FROM pg_constraint c
+            WHERE c.contype = 'f'
+            AND c.conrelid::regclass::text = ANY($1::text[])
+            AND c.confrelid::regclass::text = ANY($1::text[])
+        """, self.TABLES)
+        
+        depends_on: Dict[str, Set[str]] = {table: set() for table in self.TABLES}
+        for r in rows:
+            if r["child"] != r["parent"]:
+                depends_on[r["child"]].add(r["parent"])
+        
+        phases: List[List[str]] = []
+        done: Set[str] = set()
+        while len(done) < len(self.TABLES):
+            remaining = [t for t in self.TABLES if t not in done]
+            phase = [t for t in remaining if depends_on[t] <= done] or remaining[:1]
+            phases.append(phase)
+            done.update(phase)
+        return phases
+    
+    async def _sync_one(
+        self,
+        source_pool,
+        target_pool,
+        table: str,
+        since: datetime,
+        dry_run: bool,
+        sweep: bool = False,
+        catchup: bool = False,
+        changes: Optional[Dict[Any, str]] = None
+    ) -> Optional[Tuple[SyncResult, Optional[datetime]]]:
+        """プールから接続を取得して1テーブルを同期
+        
+        changes（ID → 最後の操作）を指定した場合は、それらの行のみを同期する。
+        
+        Returns:
+            (同期結果, ソースの最新updated_at)。テーブルが存在しない場合はNone
+        """
+        async with source_pool.acquire() as source_conn, target_pool.acquire() as target_conn:
+            # テーブル存在確認
+            if not self._table_exists(table):
+                return None
+            
+            # updated_atカラム確認
+            has_updated_at = self._has_column(table, "updated_at")
+            
+            buckets = None
+            if sweep and has_updated_at and changes is None:
+                buckets = await self._diverged_buckets(source_conn, target_conn, table)
+            
+            # 通常の増分同期では、期間内の行の要約が両側で一致するテーブルを丸ごとスキップ
+            unchanged = False
+            if has_updated_at and changes is None and not sweep and not catchup:
+                source_fp, target_fp = await asyncio.gather(
+                    self._table_fingerprint(source_conn, table, since),
+                    self._table_fingerprint(target_conn, table, since)
+                )
+                unchanged = source_fp == target_fp
+            
+            if changes is not None:
+                result = await self._sync_changes(
+                    source_conn, target_conn, table, changes, dry_run
+                )
+            elif buckets == [] or unchanged:
+                # 全バケット・期間内の要約が一致（行の転送は不要）
+                result = SyncResult(table, 0, 0, 0, 0)
+            else:
+                result = await self._sync_table(
+                    source_conn,
+                    target_conn,
+                    table,
+                    since if has_updated_at and not catchup else None,
+                    dry_run,
+                    buckets,
+                    catchup
+                )
+            
+            max_updated = None
+            if has_updated_at:
+                max_updated = await source_conn.fetchval(
+                    self._queries[table]["max_updated"]
+                )
+            return result, max_updated
+    
     async def _sync_table(
         self,
         source_conn,
         target_conn,
         table: str,
         since: Optional[datetime],
-        dry_run: bool
+        dry_run: bool,
+        buckets: Optional[List[datetime]] = None,
+        catchup: bool = False,
+        ids: Optional[List[Any]] = None
     ) -> SyncResult:
-        """テーブルの増分同期"""
+        """テーブルの増分同期
+        
+        bucketsを指定した場合は、updated_atがそれらの1時間バケットに含まれる行を同期する。
+        idsを指定した場合は、それらのIDの行のみを同期する（削除の検出は行わない）。
+        catchupの場合、CATCHUP_MIN_ROWS行以上のテーブルはインデックスを作り直して投入する。
+        """
         inserted = 0
         updated = 0
         deleted = 0
         errors = 0
         
-        # 変更されたレコードを取得
-        if since:
+        # 変更されたレコードを取得（ターゲットにあるカラムのみ）
+        projection = ", ".join(
+            self._quote_ident(col)
+            for col in await self._sync_columns(source_conn, target_conn, table)
+        )
+        quoted_table = self._quote_ident(table)
+        if ids:
+            # IDの指定はupdated_atの有無に関係なく使える
+            where, args = self._change_filter(since, buckets, ids)
+            query = f"SELECT {projection} FROM {quoted_table} WHERE {where}"
+        elif since or buckets:
+            where, args = self._change_filter(since, buckets)
             query = f"""
-                SELECT * FROM {table}
-                WHERE updated_at > $1
+                SELECT {projection} FROM {quoted_table}
+                WHERE {where}
                 ORDER BY updated_at
             """
-            rows = await source_conn.fetch(query, since)
         else:
             # updated_atがない場合は全件
-            rows = await source_conn.fetch(f"SELECT * FROM {table}")
+            query = f"SELECT {projection} FROM {quoted_table}"
+            args = []
         
-        if not rows:
-            return SyncResult(table, 0, 0, 0, 0)
-        
-        # カラム情報
-        columns = list(rows[0].keys())
-        
-        for row in rows:
-            try:
-                row_dict = dict(row)
-                row_id = row_dict.get("id")
-                
-                if dry_run:
-                    # dry-runの場合は存在チェックのみ
-                    exists = await self._record_exists(target_conn, table, row_id)
-                    if exists:
-                        updated += 1
-                    else:
-                        inserted += 1
-                    continue
-                
-                # UPSERT（last-write-wins）
-                result = await self._upsert_record(
-                    target_conn, table, columns, row_dict
+        # 全件をメモリに載せないよう、サーバーサイドカーソルでCURSOR_PREFETCH行ずつ読み込む
+        # （読み直しても同じ結果になるよう、同一スナップショットで読む）
+        async with source_conn.transaction(isolation="repeatable_read", readonly=True):
+            stmt = await source_conn.prepare(query)
+            # カラム情報
+            columns = [attr.name for attr in stmt.get_attributes()]
+            
+            def chunks() -> AsyncIterator[List[Any]]:
+                # ソースからの読み込みとターゲットへの書き込みを並行させる
+                return self._prefetch(
+                    self._chunked(stmt.cursor(*args, prefetch=self.CURSOR_PREFETCH))
                 )
-                
-                if result == "inserted":
-                    inserted += 1
-                elif result == "updated":
-                    updated += 1
-                    
-            except Exception as e:
-                errors += 1
-                if errors <= 3:
-                    print(f"\n  Warning: {e}")
+            
+            if dry_run:
+                # dry-runの場合は存在チェックのみ（チャンクごとに1クエリでまとめて確認）
+                async with aclosing(chunks()) as rows:
+                    async for chunk in rows:
+                        existing = await self._existing_ids(
+                            target_conn, table, [row["id"] for row in chunk]
+                        )
+                        chunk_updated = sum(1 for row in chunk if row["id"] in existing)
+                        updated += chunk_updated
+                        inserted += len(chunk) - chunk_updated
+            else:
+                # COPYでステージングテーブルに投入し、1回のINSERT ... SELECTでUPSERT
+                merge = self._copy_merge
+                if catchup and await self._estimated_rows(source_conn, table) >= self.CATCHUP_MIN_ROWS:
+                    merge = self._catchup_table
+                try:
+                    async with aclosing(chunks()) as rows:
+                        inserted, updated = await merge(target_conn, table, columns, rows)
+                except Exception as e:
+                    print(f"\n  Warning: COPY merge failed, falling back to row-by-row upsert: {e}")
+                    inserted = updated = 0
+                    # 先頭から読み直してUPSERT（last-write-wins）
+                    async with aclosing(chunks()) as rows:
+                        async for chunk in rows:
+                            chunk_inserted, chunk_updated, chunk_errors = await self._upsert_rows(
+                                target_conn, table, columns, chunk
+                            )
+                            inserted += chunk_inserted
+                            updated += chunk_updated
+                            errors += chunk_errors
+        
+        if inserted + updated + errors == 0:
+            return SyncResult(table, 0, 0, 0, 0)
         
         # 削除されたレコードの同期（オプション）
-        if since:
+        if since or buckets:
             deleted = await self._sync_deletions(
-                source_conn, target_conn, table, since, dry_run
+                source_conn, target_conn, table, since, dry_run, buckets
             )
         
         return SyncResult(table, inserted, updated, deleted, errors)
     
-    async def _upsert_record(
+    async def _copy_merge(
         self,
         conn,
         table: str,
         columns: List[str],
-        row: Dict[str, Any]
-    ) -> str:
-        """レコードをUPSERT"""
-        placeholders = ", ".join([f"${i+1}" for i in range(len(columns))])
-        column_names = ", ".join(columns)
-        update_set = ", ".join([
-            f"{col} = EXCLUDED.{col}"
-            for col in columns
-            if col != "id"
-        ])
+        chunks: AsyncIterable[List[Any]]
+    ) -> Tuple[int, int]:
+        """COPYで一時テーブルに投入し、1回のINSERT ... SELECTでUPSERT（last-write-wins）
+        
+        行はチャンクごとにCOPYし、全件を一度にメモリに載せない。
+        
+        Returns:
+            (挿入件数, 更新件数)
+        """
+        quoted_table = self._quote_ident(table)
+        staging = self._quote_ident(f"_stg_{table}")
+        column_names = ", ".join(self._quote_ident(col) for col in columns)
+        update_set = self._update_set(columns)
+        
+        async with conn.transaction():
+            # 遅延可能な制約（外部キー等）はコミット時にまとめてチェック
+            await conn.execute("SET CONSTRAINTS ALL DEFERRED")
+            await conn.execute(
+                f"CREATE TEMP TABLE {staging} (LIKE {quoted_table} INCLUDING DEFAULTS) ON COMMIT DROP"
+            )
+            async for chunk in chunks:
+                # ソースから読んだ値（UUID・datetime・配列のlist・JSONテキスト）は
+                # そのままバイナリ形式でCOPYできる。Recordもシーケンスなので
+                # 行ごとのタプル化や値の変換はしない（列の順序はcolumnsと同じ）
+                await conn.copy_records_to_table(
+                    f"_stg_{table}", records=chunk, columns=columns
+                )
+            # xmax = 0 の行は新規挿入、それ以外はON CONFLICTによる更新
+            counts = await conn.fetchrow(f"""
+                WITH merged AS (
+                    INSERT INTO {quoted_table} ({column_names})
+                    SELECT {column_names} FROM {staging}
+                    ON CONFLICT (id) DO UPDATE SET {update_set}
+                    RETURNING (xmax = 0) AS inserted
+                )
+                SELECT
+                    count(*) FILTER (WHERE inserted) AS inserted,
+                    count(*) FILTER (WHERE NOT inserted) AS updated
+                FROM merged
+            """)
+        
+        return counts["inserted"], counts["updated"]
+    
+    async def _catchup_table(
+        self,
+        conn,
+        table: str,
+        columns: List[str],
+        chunks: AsyncIterable[List[Any]]
+    ) -> Tuple[int, int]:
+        """インデックスを削除・ユーザートリガーを無効化してCOPY merge し、作り直す
+        
+        インデックスを1行ずつ更新する代わりに、投入後にソートして一括で構築する。
+        制約のインデックス（主キー・一意制約）はON CONFLICTに必要なため、制約のない
+        一意インデックスは投入中も一意性を保証するため、いずれも削除しない。
+        
+        Returns:
+            (挿入件数, 更新件数)
+        """
+        indexes = await conn.fetch("""
+            SELECT i.relname AS name, pg_get_indexdef(i.oid) AS definition
+            FROM pg_index x
+            JOIN pg_class i ON i.oid = x.indexrelid
+            WHERE x.indrelid = $1::regclass
+            AND NOT x.indisunique
+            AND NOT EXISTS (
+                SELECT 1 FROM pg_constraint c WHERE c.conindid = x.indexrelid
+            )
+        """, table)
+        
+        for index in indexes:
+            await conn.execute(
+                f"DROP INDEX CONCURRENTLY IF EXISTS {self._quote_ident(index['name'])}"
+            )
+        await conn.execute(self._queries[table]["disable_triggers"])
+        try:
+            counts = await self._copy_merge(conn, table, columns, chunks)
+        except BaseException:
+            # 失敗しても元の状態に戻し、投入時の例外をそのまま伝える
+            await self._restore_table(conn, table, indexes)
+            raise
+        await self._restore_table(conn, table, indexes)
+        return counts
+    
+    async def _restore_table(self, conn, table: str, indexes: List[Any]) -> None:
+        """_catchup_tableで無効化したトリガーと削除したインデックスを元に戻す
+        
+        1つの失敗で残りを戻し損ねないよう、それぞれ個別に実行して失敗は警告に留める。
+        """
+        statements = [self._queries[table]["enable_triggers"]] + [
+            index["definition"].replace(" INDEX ", " INDEX CONCURRENTLY ", 1)
+            for index in indexes
+        ]
+        for statement in statements:
+            try:
+                await conn.execute(statement)
+            except Exception as e:
+                print(f"\n  Warning: failed to restore {table}, run manually: {statement} ({e})")
+    
+    async def _estimated_rows(self, conn, table: str) -> int:
+        """統計情報による推定行数（未ANALYZEの場合は0）"""
+        estimate = await conn.fetchval(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = $1::regclass",
+            table
+        )
+        return max(estimate or 0, 0)
+    
+    async def _sync_changes(
+        self,
+        source_conn,
+        target_conn,
+        table: str,
+        changes: Dict[Any, str],
+        dry_run: bool
+    ) -> SyncResult:
+        """スロットから読んだ変更を同期（挿入・更新はソースから読み直し、削除はIDで反映）"""
+        upserted = [record_id for record_id, action in changes.items() if action != "D"]
+        deleted = [record_id for record_id, action in changes.items() if action == "D"]
+        
+        result = SyncResult(table, 0, 0, 0, 0)
+        if upserted:
+            result = await self._sync_table(
+                source_conn, target_conn, table, None, dry_run, ids=upserted
+            )
+        if deleted and not dry_run:
+            await target_conn.execute(self._queries[table]["delete_ids"], deleted)
+        result.deleted = len(deleted)
+        return result
+    
+    async def _slot_changes(
+        self,
+        conn,
+        slot: str
+    ) -> Tuple[str, Dict[str, Dict[Any, str]]]:
+        """論理レプリケーションスロットから未消費の変更を読む
+        
+        スロットがなければwal2jsonで作成する。peekで読むだけでスロットは進めない。
+        
+        Returns:
+            (読み込んだ上限のLSN, テーブル名 → (ID → 最後の操作 "I"/"U"/"D"))
+        """
+        await conn.execute("""
+            SELECT pg_create_logical_replication_slot($1, 'wal2json')
+            WHERE NOT EXISTS (
+                SELECT 1 FROM pg_replication_slots WHERE slot_name = $1
+            )
+        """, slot)
+        upto_lsn = await conn.fetchval("SELECT pg_current_wal_lsn()::text")
         
-        # 既存レコードの確認
-        exists = await self._record_exists(conn, table, row.get("id"))
+        changes: Dict[str, Dict[Any, str]] = {table: {} for table in self.TABLES}
+        async with conn.transaction():
+            rows = conn.cursor("""
+                SELECT data FROM pg_logical_slot_peek_changes(
+                    $1, $2::pg_lsn, NULL,
+                    'format-version', '2',
+                    'include-transaction', 'false',
+                    'add-tables', $3
+                )
+            """, slot, upto_lsn, ",".join(f"public.{t}" for t in self.TABLES),
+                prefetch=self.CURSOR_PREFETCH)
+            async for row in rows:
+                message = json.loads(row["data"])
+                action = message["action"]
+                if action == "T":
+                    print(f"\n  Warning: TRUNCATE on {message['table']} is not synced (run --sweep)")
+                    continue
+                # 削除はレプリカアイデンティティ（主キー）のみを持つ
+                columns = message["identity"] if action == "D" else message["columns"]
+                record_id = next(c["value"] for c in columns if c["name"] == "id")
+                changes[message["table"]][record_id] = action
+        
+        return upto_lsn, changes
+    
+    @staticmethod
+    def _change_filter(
+        since: Optional[datetime],
+        buckets: Optional[List[datetime]],
+        ids: Optional[List[Any]] = None
+    ) -> Tuple[str, List[Any]]:
+        """同期対象の行を絞り込むWHERE句とパラメータ"""
+        if ids:
+            return "id = ANY($1)", [ids]
+        if buckets:
+            return "date_trunc('hour', updated_at) = ANY($1)", [buckets]
+        return "updated_at > $1", [since]
+    
+    async def _bucket_hashes(self, conn, table: str) -> Dict[datetime, str]:
+        """updated_atの1時間バケットごとのハッシュ（バケット内の id と updated_at から計算）"""
+        rows = await conn.fetch(self._queries[table]["bucket_hashes"])
+        return {row["bucket"]: row["hash"] for row in rows}
+    
+    async def _table_fingerprint(
+        self,
+        conn,
+        table: str,
+        since: datetime
+    ) -> Tuple[int, Optional[datetime], Optional[str]]:
+        """sinceより後に更新された行の (件数, 最新updated_at, id・updated_atのハッシュ)"""
+        row = await conn.fetchrow(self._queries[table]["fingerprint"], since)
+        return row["count"], row["max_updated"], row["hash"]
+    
+    async def _diverged_buckets(
+        self,
+        source_conn,
+        target_conn,
+        table: str
+    ) -> List[datetime]:
+        """ソース・ターゲットでハッシュが異なる（片側にしかないものを含む）バケット"""
+        source_hashes, target_hashes = await asyncio.gather(
+            self._bucket_hashes(source_conn, table),
+            self._bucket_hashes(target_conn, table)
+        )
+        return sorted(
+            bucket
+            for bucket in source_hashes.keys() | target_hashes.keys()
+            if source_hashes.get(bucket) != target_hashes.get(bucket)
+        )
+    
+    async def _chunked(self, rows: AsyncIterable[Any]) -> AsyncIterator[List[Any]]:
+        """CURSOR_PREFETCH行ずつのリストに分割"""
+        chunk = []
+        async for row in rows:
+            chunk.append(row)
+            if len(chunk) >= self.CURSOR_PREFETCH:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+    
+    async def _prefetch(self, chunks: AsyncIterable[List[Any]]) -> AsyncIterator[List[Any]]:
+        """チャンクの読み込みを別タスクで先行させる
+        
+        呼び出し側が1チャンクをターゲットに書き込んでいる間に、最大PREFETCH_CHUNKS件まで
+        次のチャンクをソースから読み込んでおく。
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.PREFETCH_CHUNKS)
+        done = object()
+        stopping = False
+        
+        async def produce():
+            try:
+                async for chunk in chunks:
+                    if stopping:
+                        break
+                    await queue.put(chunk)
+            finally:
+                await queue.put(done)
+        
+        producer = asyncio.create_task(produce())
+        try:
+            while (chunk := await queue.get()) is not done:
+                yield chunk
+            # 読み込み中の例外を呼び出し側に伝える
+            await producer
+        finally:
+            # 途中で終了した場合は、読み込みを止めるよう伝えて終了を待つ。
+            # キャンセルすると実行中のfetchにキャンセル要求が送られ、ソースの
+            # トランザクションが中断されて読み直しができなくなるため、キャンセルはしない
+            stopping = True
+            if not producer.done():
+                # 書き込み待ちの読み込み側が進めるよう、終了マーカーまでキューを空ける
+                while (await queue.get()) is not done:
+                    pass
+            # 途中終了時の読み込み側の例外は呼び出し側の例外を優先して無視する
+            with suppress(Exception):
+                await producer
+    
+    @staticmethod
+    def _update_set(columns: List[str]) -> str:
+        """ON CONFLICT DO UPDATEの更新句"""
+        return ", ".join([
+            f"{quoted} = EXCLUDED.{quoted}"
+            for quoted in map(IncrementalSyncer._quote_ident, columns)
+            if quoted != '"id"'
+        ])
+    
+    def _upsert_query(self, table: str, columns: List[str], row_count: int = 1) -> str:
+        """複数行VALUESのUPSERTのSQL（各行が挿入か更新かをRETURNINGで返す）"""
+        width = len(columns)
+        values = ", ".join(
+            "(" + ", ".join(f"${i * width + j + 1}" for j in range(width)) + ")"
+            for i in range(row_count)
+        )
+        column_names = ", ".join(self._quote_ident(col) for col in columns)
+        update_set = self._update_set(columns)
         
-        query = f"""
-            INSERT INTO {table} ({column_names})
-            VALUES ({placeholders})
+        # xmax = 0 の行は新規挿入、それ以外はON CONFLICTによる更新
+        return f"""
+            INSERT INTO {self._quote_ident(table)} ({column_names})
+            VALUES {values}
             ON CONFLICT (id) DO UPDATE SET {update_set}
+            RETURNING (xmax = 0) AS inserted
+        """
+    
+    async def _upsert_rows(
+        self,
+        conn,
+        table: str,
+        columns: List[str],
+        rows: List[Any]
+    ) -> Tuple[int, int, int]:
+        """複数行VALUESのINSERTでBATCH_SIZE行ずつUPSERT
+        
+        失敗したバッチは1行ずつ再実行し、失敗した行だけをエラーとして数える。
+        
+        Returns:
+            (挿入件数, 更新件数, エラー件数)
         """
+        inserted = 0
+        updated = 0
+        errors = 0
+        
+        # 1文あたりのパラメータ数の上限を超えないようにバッチの行数を決める
+        batch_size = max(1, min(self.BATCH_SIZE, self.MAX_QUERY_ARGS // len(columns)))
+        # 行数ごとの準備済みステートメント（端数のバッチ・1行用は別の文になる）
+        statements: Dict[int, Any] = {}
+        
+        async def upsert(batch: List[Any]) -> List[bool]:
+            stmt = statements.get(len(batch))
+            if stmt is None:
+                stmt = statements[len(batch)] = await conn.prepare(
+                    self._upsert_query(table, columns, len(batch))
+                )
+            values = [value for row in batch for value in row]
+            return [r["inserted"] for r in await stmt.fetch(*values)]
         
-        values = [self._convert_value(row.get(col)) for col in columns]
-        await conn.execute(query, *values)
+        # テーブル全体を1トランザクションで反映し、コミット（WAL書き込み）を1回にする
+        # 失敗したバッチ・行はセーブポイント（入れ子のトランザクション）で取り消す
+        async with conn.transaction():
+            # 遅延可能な制約（外部キー等）はコミット時にまとめてチェック
+            await conn.execute("SET CONSTRAINTS ALL DEFERRED")
+            
+            for start in range(0, len(rows), batch_size):
+                batch = rows[start:start + batch_size]
+                try:
+                    async with conn.transaction():
+                        flags = await upsert(batch)
+                except Exception:
+                    # 同じIDが重複している場合などはバッチ全体が失敗するため、1行ずつ再実行する
+                    flags = []
+                    for row in batch:
+                        try:
+                            async with conn.transaction():
+                                flags += await upsert([row])
+                        except Exception as e:
+                            errors += 1
+                            if errors <= 3:
+                                print(f"\n  Warning: {e}")
+                
+                batch_inserted = sum(flags)
+                inserted += batch_inserted
+                updated += len(flags) - batch_inserted
         
-        return "updated" if exists else "inserted"
+        return inserted, updated, errors
     
     async def _sync_deletions(
         self,
         source_conn,
         target_conn,
         table: str,
-        since: datetime,
-        dry_run: bool
+        since: Optional[datetime],
+        dry_run: bool,
+        buckets: Optional[List[datetime]] = None
     ) -> int:
         """削除されたレコードを同期"""
         # ソースに存在しないがターゲットに存在するIDを検出
         # 注: これは大規模データでは非効率なので、
         # 本番では削除フラグやイベントログを使用することを推奨
         
-        # サンプル実装: 最近更新されたIDのみチェック
+        # サンプル実装: 最近更新されたID（またはバケット内のID）のみチェック
+        where, args = self._change_filter(since, buckets)
         target_ids = await target_conn.fetch(f"""
-            SELECT id FROM {table}
-            WHERE updated_at > $1
+            SELECT id FROM {self._quote_ident(table)}
+            WHERE {where}
             LIMIT 1000
-        """, since)
+        """, *args)
         
         if not target_ids:
             return 0
         
-        deleted = 0
-        for row in target_ids:
-            target_id = row["id"]
-            exists_in_source = await self._record_exists(
-                source_conn, table, target_id
-            )
-            
-            if not exists_in_source:
-                if not dry_run:
-                    await target_conn.execute(
-                        f"DELETE FROM {table} WHERE id = $1",
-                        target_id
-                    )
-                deleted += 1
-        
-        return deleted
-    
-    async def _table_exists(self, conn, table: str) -> bool:
-        """テーブル存在確認"""
-        return await conn.fetchval("""
-            SELECT EXISTS (
-                SELECT FROM information_schema.tables
-                WHERE table_schema = 'public' AND table_name = $1
-            )
-        """, table)
+        # ソース側の存在確認・削除はそれぞれ1クエリでまとめて行う
+        ids = [row["id"] for row in target_ids]
+        exists_in_source = await self._existing_ids(source_conn, table, ids)
+        missing = [record_id for record_id in ids if record_id not in exists_in_source]
+        
+        if missing and not dry_run:
+            await target_conn.execute(self._queries[table]["delete_ids"], missing)
+        
+        return len(missing)
+    
+    async def _load_schema(self, conn) -> None:
+        """同期対象テーブルのカラム一覧をまとめて読み込む"""
+        rows = await conn.fetch("""
+            SELECT table_name, column_name
+            FROM information_schema.columns
+            WHERE table_schema = 'public'
+            AND table_name = ANY($1::text[])
+        """, self.TABLES)
+        self._schema_cache = {}
+        for row in rows:
+            self._schema_cache.setdefault(row["table_name"], set()).add(row["column_name"])
+    
+    def _table_exists(self, table: str) -> bool:
+        """テーブル存在確認（_load_schemaの結果から判定）"""
+        return table in self._schema_cache
+    
+    def _has_column(self, table: str, column: str) -> bool:
+        """カラム存在確認（_load_schemaの結果から判定）"""
+        return column in self._schema_cache.get(table, ())
     
-    async def _has_column(self, conn, table: str, column: str) -> bool:
-        """カラム存在確認"""
-        return await conn.fetchval("""
-            SELECT EXISTS (
-                SELECT FROM information_schema.columns
-                WHERE table_schema = 'public'
-                AND table_name = $1
-                AND column_name = $2
+    async def _sync_columns(self, source_conn, target_conn, table: str) -> List[str]:
+        """同期するカラム（ソース・ターゲットの両方にあるもの、ソースの定義順）"""
+        if table not in self._columns_cache:
+            query = """
+                SELECT a.attname
+                FROM pg_attribute a
+                WHERE a.attrelid = $1::regclass
+                AND a.attnum > 0
+                AND NOT a.attisdropped
+                ORDER BY a.attnum
+            """
+            source_columns, target_columns = await asyncio.gather(
+                source_conn.fetch(query, table),
+                target_conn.fetch(query, table)
             )
-        """, table, column)
-    
-    async def _record_exists(self, conn, table: str, record_id) -> bool:
-        """レコード存在確認"""
-        if record_id is None:
-            return False
-        return await conn.fetchval(
-            f"SELECT EXISTS (SELECT 1 FROM {table} WHERE id = $1)",
-            record_id
-        )
+            target_names = {row["attname"] for row in target_columns}
+            self._columns_cache[table] = [
+                row["attname"]
+                for row in source_columns
+                if row["attname"] in target_names
+            ]
+        return self._columns_cache[table]
     
-    def _convert_value(self, value: Any) -> Any:
-        """値をPostgreSQL互換形式に変換"""
-        if value is None:
-            return None
-        if isinstance(value, dict):
-            return json.dumps(value)
-        if isinstance(value, list):
-            return json.dumps(value)
-        return value
+    async def _existing_ids(self, conn, table: str, ids: List[Any]) -> Set[Any]:
+        """指定したIDのうち存在するものを1クエリで取得"""
+        if not ids:
+            return set()
+        rows = await conn.fetch(self._queries[table]["existing_ids"], ids)
+        return {row["id"] for row in rows}
     
     def _load_state(self, state_file: Optional[Path]) -> Optional[SyncState]:
         """同期状態を読み込み"""
@@ -409,7 +996,8 @@ class IncrementalSyncer:
         
         return SyncState(
             last_sync=data.get("last_sync", ""),
-            tables=data.get("tables", {})
+            tables=data.get("tables", {}),
+            last_lsn=data.get("last_lsn")
         )
     
     def _save_state(self, state_file: Path, state: SyncState) -> None:
@@ -438,6 +1026,20 @@ def main():
         action="store_true",
         help="Perform a dry run without syncing data"
     )
+    parser.add_argument(
+        "--sweep",
+        action="store_true",
+        help="Compare hourly updated_at bucket hashes and sync only diverged buckets"
+    )
+    parser.add_argument(
+        "--catchup",
+        action="store_true",
+        help="Sync all rows, rebuilding target indexes after the copy for large tables"
+    )
+    parser.add_argument(
+        "--slot",
+        help="Consume changes from this logical replication slot (wal2json, created if missing)"
+    )
     args = parser.parse_args()
     
     # 環境変数
@@ -472,7 +1074,10 @@ def main():
     results = asyncio.run(syncer.sync(
         since=since,
         state_file=state_file,
-        dry_run=args.dry_run
+        dry_run=args.dry_run,
+        sweep=args.sweep,
+        catchup=args.catchup,
+        slot=args.slot
     ))
     
     # エラーがあれば終了コード1
@@ -0,0 +1,86 @@
+"""
+import_aurora.py のテスト
+
+DBを使うテストは IMPORT_AURORA_TEST_DSN（PostgreSQLの接続文字列）を指定した場合のみ実行する。
+
+Usage:
+    IMPORT_AURORA_TEST_DSN=postgresql://localhost/postgres pytest scripts/migration/tests
+"""
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+asyncpg = pytest.importorskip("asyncpg")
+pytest.importorskip("boto3")
+orjson = pytest.importorskip("orjson")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from import_aurora import AuroraImporter  # noqa: E402
+
+TEST_DSN = os.environ.get("IMPORT_AURORA_TEST_DSN")
+
+
+def test_parse_json_columns_parses_json_text():
+    row = {"id": 1, "data": '{"a": 1}', "name": '{"not": "json column"}'}
+
+    AuroraImporter._parse_json_columns(row, ["data"])
+
+    assert row == {"id": 1, "data": {"a": 1}, "name": '{"not": "json column"}'}
+
+
+def test_parse_json_columns_keeps_parsed_values():
+    row = {"id": 1, "data": {"a": 1}, "tags": ["x"], "label": "plain text", "empty": None}
+
+    AuroraImporter._parse_json_columns(row, ["data", "tags", "label", "empty"])
+
+    assert row == {"id": 1, "data": {"a": 1}, "tags": ["x"], "label": "plain text", "empty": None}
+
+
+@pytest.mark.skipif(not TEST_DSN, reason="IMPORT_AURORA_TEST_DSN is not set")
+def test_jsonb_round_trip_through_json_to_recordset(tmp_path):
+    # 既定のエクスポート（JSONテキスト）と小テーブルのエクスポート（解析済み）の両形式
+    input_file = tmp_path / "habits.jsonl"
+    input_file.write_bytes(b"\n".join([
+        orjson.dumps({"id": 1, "level_assessment_data": '{"level": 3, "tags": ["a"]}'}),
+        orjson.dumps({"id": 2, "level_assessment_data": {"level": 5, "tags": []}}),
+        orjson.dumps({"id": 3, "level_assessment_data": None}),
+    ]))
+
+    async def run():
+        conn = await asyncpg.connect(TEST_DSN)
+        try:
+            importer = AuroraImporter(secret_arn="unused", input_dir=str(tmp_path))
+            await importer._configure_session(conn)
+            # 一時テーブルは同名の通常テーブルより優先して解決される
+            await conn.execute("""
+                CREATE TEMP TABLE habits (
+                    id integer PRIMARY KEY,
+                    level_assessment_data jsonb
+                )
+            """)
+
+            # COPY_THRESHOLD未満の行数のため json_to_recordset の経路を通る
+            result = await importer._import_table(conn, "habits", [input_file], dry_run=False)
+            assert result.success
+            assert result.imported_count == 3
+
+            return await conn.fetch("""
+                SELECT id, jsonb_typeof(level_assessment_data) AS kind, level_assessment_data
+                FROM habits
+                ORDER BY id
+            """)
+        finally:
+            await conn.close()
+
+    rows = asyncio.run(run())
+
+    assert [(r["id"], r["kind"], r["level_assessment_data"]) for r in rows] == [
+        (1, "object", {"level": 3, "tags": ["a"]}),
+        (2, "object", {"level": 5, "tags": []}),
+        (3, None, None),
+    ]
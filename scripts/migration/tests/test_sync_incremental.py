@@ -0,0 +1,111 @@
+"""
+sync_incremental.py のテスト
+
+DBは使わず、asyncpgの接続・カーソルの振る舞いを模した偽オブジェクトで検証する。
+
+Usage:
+    pytest scripts/migration/tests
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("asyncpg")
+pytest.importorskip("boto3")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from sync_incremental import IncrementalSyncer  # noqa: E402
+
+
+class FakeAttribute:
+    def __init__(self, name):
+        self.name = name
+
+
+class FakeTransaction:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeSourceConnection:
+    """読み込み中のfetchがキャンセルされるとトランザクションが中断される接続
+
+    asyncpgはキャンセルされたクエリにキャンセル要求を送るため、実行中の
+    トランザクションは失敗状態になり、以降のクエリはエラーになる。
+    """
+
+    def __init__(self, rows, chunk_size):
+        self.rows = rows
+        self.chunk_size = chunk_size
+        self.aborted = False
+
+    def transaction(self, **kwargs):
+        return FakeTransaction()
+
+    async def prepare(self, query):
+        self._check()
+        return FakeStatement(self)
+
+    def _check(self):
+        if self.aborted:
+            raise RuntimeError("current transaction is aborted (InFailedSQLTransaction)")
+
+
+class FakeStatement:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def get_attributes(self):
+        return [FakeAttribute("id"), FakeAttribute("updated_at")]
+
+    async def cursor(self, *args, prefetch):
+        conn = self.conn
+        conn._check()
+        for start in range(0, len(conn.rows), conn.chunk_size):
+            try:
+                # サーバーからの1回分の取得
+                await asyncio.sleep(0.001)
+            except asyncio.CancelledError:
+                conn.aborted = True
+                raise
+            conn._check()
+            for row in conn.rows[start:start + conn.chunk_size]:
+                yield row
+
+
+def test_fallback_rereads_every_row_after_copy_merge_fails(monkeypatch):
+    rows = [{"id": i, "updated_at": None} for i in range(100)]
+    source_conn = FakeSourceConnection(rows, chunk_size=10)
+
+    syncer = IncrementalSyncer(source_conn_string="unused", target_secret_arn="unused")
+    syncer.CURSOR_PREFETCH = 10
+    syncer._columns_cache["habits"] = ["id", "updated_at"]
+
+    async def failing_merge(conn, table, columns, chunks):
+        # 1チャンク目を読んだ時点で失敗（読み込み側はまだ先読み中）
+        async for _ in chunks:
+            raise RuntimeError("COPY failed")
+
+    upserted = []
+
+    async def upsert_rows(conn, table, columns, chunk):
+        upserted.extend(row["id"] for row in chunk)
+        return 0, len(chunk), 0
+
+    monkeypatch.setattr(syncer, "_copy_merge", failing_merge)
+    monkeypatch.setattr(syncer, "_upsert_rows", upsert_rows)
+
+    result = asyncio.run(
+        syncer._sync_table(source_conn, object(), "habits", since=None, dry_run=False)
+    )
+
+    assert not source_conn.aborted
+    assert upserted == list(range(100))
+    assert (result.inserted, result.updated, result.errors) == (0, 100, 0)
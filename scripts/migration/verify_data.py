@@ -13,7 +13,6 @@ Environment Variables:
 
 import asyncio
 import json
-import hashlib
 import os
 import sys
 from typing import Dict, List, Optional
@@ -69,6 +68,10 @@ class DataVerifier:
     # チェックサム対象テーブル（重要データ）
     CHECKSUM_TABLES = ["habits", "goals", "tasks", "mindmaps"]
 
+    # 推定行数（pg_class.reltuples）を信頼する最小行数と許容差
+    ESTIMATE_MIN_ROWS = 1_000_000
+    ESTIMATE_TOLERANCE = 0.01
+
     def __init__(
         self,
         source_conn_string: str,
@@ -103,8 +106,14 @@ class DataVerifier:
         print(f"Started at: {datetime.now().isoformat()}")
         print()
 
-        source_conn = await asyncpg.connect(self.source_conn_string)
-        target_conn = await asyncpg.connect(self._get_target_connection_string())
+        # timestamptzのテキスト表現はセッションのTimeZoneに依存するため両側でUTCに揃える
+        session_settings = {"TimeZone": "UTC"}
+        source_conn = await asyncpg.connect(
+            self.source_conn_string, server_settings=session_settings
+        )
+        target_conn = await asyncpg.connect(
+            self._get_target_connection_string(), server_settings=session_settings
+        )
 
         results: List[TableVerificationResult] = []
         passed_count = 0
@@ -128,7 +137,7 @@ class DataVerifier:
                         checksum_info = ""
                         if result.checksum_match is not None:
                             checksum_info = f" (checksum: {'✓' if result.checksum_match else '✗'})"
-                        print(f"✅ PASSED ({result.source_count} rows){checksum_info}")
+                        print(f"✅ PASSED ({result.source_count} rows, {result.reason}){checksum_info}")
                     else:
                         failed_count += 1
                         print(f"❌ FAILED - {result.reason}")
@@ -189,11 +198,20 @@ class DataVerifier:
         target_conn,
         table: str
     ) -> TableVerificationResult:
-        """テーブルの整合性を検証"""
+        """テーブルの整合性を検証
+
+        安価な検証から順に行い、一致が確認できた段階で終了する:
+        推定行数 → 行数 → 先頭1000件のID → チェックサム（重要テーブルのみ）。
+        成功時のreasonには到達した段階を記録する。
+        """
+
+        # ソース・ターゲットへの問い合わせは互いに独立しているため並行に実行する
 
         # テーブル存在確認
-        source_exists = await self._table_exists(source_conn, table)
-        target_exists = await self._table_exists(target_conn, table)
+        source_exists, target_exists = await asyncio.gather(
+            self._table_exists(source_conn, table),
+            self._table_exists(target_conn, table)
+        )
 
         if not source_exists:
             return TableVerificationResult(
@@ -213,12 +231,30 @@ class DataVerifier:
                 reason="Table does not exist in target"
             )
 
-        # 行数比較
-        source_count = await source_conn.fetchval(
-            f"SELECT COUNT(*) FROM {table}"
+        # 推定行数比較（大きいテーブルで推定値が近ければ、それ以上は検証しない）
+        estimate_query = "SELECT reltuples::bigint FROM pg_class WHERE oid = $1::regclass"
+        source_estimate, target_estimate = await asyncio.gather(
+            source_conn.fetchval(estimate_query, table),
+            target_conn.fetchval(estimate_query, table)
         )
-        target_count = await target_conn.fetchval(
-            f"SELECT COUNT(*) FROM {table}"
+        largest = max(source_estimate or 0, target_estimate or 0)
+        if (
+            largest >= self.ESTIMATE_MIN_ROWS
+            and abs(source_estimate - target_estimate) / largest < self.ESTIMATE_TOLERANCE
+        ):
+            return TableVerificationResult(
+                table_name=table,
+                passed=True,
+                source_count=source_estimate,
+                target_count=target_estimate,
+                reason="level: estimate"
+            )
+
+        # 行数比較
+        count_query = f"SELECT COUNT(*) FROM {table}"
+        source_count, target_count = await asyncio.gather(
+            source_conn.fetchval(count_query),
+            target_conn.fetchval(count_query)
         )
 
         if source_count != target_count:
@@ -236,19 +272,22 @@ class DataVerifier:
                 table_name=table,
                 passed=True,
                 source_count=0,
-                target_count=0
+                target_count=0,
+                reason="level: count"
             )
 
-        # プライマリキーの存在確認
-        source_ids = await source_conn.fetch(
-            f"SELECT id FROM {table} ORDER BY id LIMIT 1000"
-        )
-        target_ids = await target_conn.fetch(
-            f"SELECT id FROM {table} ORDER BY id LIMIT 1000"
+        # プライマリキーの存在確認（IDは1つの配列として受け取る）
+        ids_query = f"""
+            SELECT array_agg(id ORDER BY id)
+            FROM (SELECT id FROM {table} ORDER BY id LIMIT 1000) s
+        """
+        source_ids, target_ids = await asyncio.gather(
+            source_conn.fetchval(ids_query),
+            target_conn.fetchval(ids_query)
         )
 
-        source_id_set = {str(row['id']) for row in source_ids}
-        target_id_set = {str(row['id']) for row in target_ids}
+        source_id_set = set(source_ids or ())
+        target_id_set = set(target_ids or ())
 
         if source_id_set != target_id_set:
             missing = len(source_id_set - target_id_set)
@@ -263,16 +302,19 @@ class DataVerifier:
 
         # チェックサム検証（重要テーブルのみ）
         checksum_match = None
+        level = "id_sample"
         if table in self.CHECKSUM_TABLES:
             checksum_match = await self._verify_checksum(
                 source_conn, target_conn, table
             )
+            level = "checksum"
 
         return TableVerificationResult(
             table_name=table,
             passed=True,
             source_count=source_count,
             target_count=target_count,
+            reason=f"level: {level}",
             checksum_match=checksum_match
         )
 
@@ -293,27 +335,23 @@ class DataVerifier:
         target_conn,
         table: str
     ) -> bool:
-        """チェックサム検証（サンプリング）"""
-        try:
-            # 最初の100行のIDを取得してチェックサム比較
-            source_data = await source_conn.fetch(f"""
-                SELECT * FROM {table} 
-                ORDER BY id 
+        """チェックサム検証（サンプリング）
+
+        最初の100行のチェックサムをDB側で計算し、ハッシュ値（32文字）のみ比較する。
+        """
+        query = f"""
+            SELECT md5(string_agg(md5(t::text), '' ORDER BY t.id))
+            FROM (
+                SELECT * FROM {table}
+                ORDER BY id
                 LIMIT 100
-            """)
-            target_data = await target_conn.fetch(f"""
-                SELECT * FROM {table} 
-                ORDER BY id 
-                LIMIT 100
-            """)
-
-            source_hash = hashlib.md5(
-                str(sorted([dict(row) for row in source_data], key=lambda x: str(x.get('id')))).encode()
-            ).hexdigest()
-            target_hash = hashlib.md5(
-                str(sorted([dict(row) for row in target_data], key=lambda x: str(x.get('id')))).encode()
-            ).hexdigest()
-
+            ) t
+        """
+        try:
+            source_hash, target_hash = await asyncio.gather(
+                source_conn.fetchval(query),
+                target_conn.fetchval(query)
+            )
             return source_hash == target_hash
         except Exception:
             return False